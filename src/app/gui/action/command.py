@@ -12,6 +12,7 @@ from src.app.utils.path_util import (
     cut_items_to_clipboard,
     delete_items,
     rename_item,
+    bulk_rename_items,
     duplicate_item,
     view_item,
     go_to_item,
@@ -20,6 +21,7 @@ from src.app.utils.path_util import (
     validate_single_path,
     copy_move,
     search_in_path,
+    quick_open,
 )
 from src.app.utils.logger import get_console_logger
 from src.app.utils.shell import properties
@@ -29,6 +31,7 @@ logger = get_console_logger(name=__name__, log_level=logging.ERROR)
 
 class CommonAction(str, Enum):
     GO_TO = "Go to..."
+    QUICK_OPEN = "Quick open..."
     GO_TO_REPO = "Go to Git repository"
     CUT = "Cut"
     COPY = "Copy"
@@ -37,6 +40,7 @@ class CommonAction(str, Enum):
     PASTE = "Paste"
     DELETE = "Delete"
     RENAME = "Rename"
+    BULK_RENAME = "Bulk rename..."
     VIEW = "View"
     EDIT = "Edit"
     DUPLICATE = "Duplicate"
@@ -131,6 +135,16 @@ def create_rename_action(parent_func: Callable, path_func: Callable) -> Action:
     )
 
 
+def create_bulk_rename_action(parent_func: Callable, path_func: Callable) -> Action:
+    return Action(
+        parent=parent_func().main_form,
+        caption=CommonAction.BULK_RENAME.value,
+        shortcut=QKeySequence(Qt.SHIFT | Qt.Key_F2),
+        slot=lambda: bulk_rename_items(parent=parent_func().main_form, path_func=path_func),
+        tip="Renames selected items by regular expression or template",
+    )
+
+
 def create_duplicate_action(parent_func: Callable, path_func: Callable) -> Action:
     return Action(
         parent=parent_func().main_form,
@@ -171,6 +185,16 @@ def create_go_to_action(parent_func: Callable, path_func: Callable, context_func
     )
 
 
+def create_quick_open_action(parent_func: Callable, path_func: Callable) -> Action:
+    return Action(
+        parent=parent_func().main_form,
+        caption=CommonAction.QUICK_OPEN.value,
+        shortcut=QKeySequence(Qt.CTRL | Qt.Key_E),
+        slot=lambda: quick_open(parent=parent_func().main_form, path_func=path_func),
+        tip="Find file by name in pinned folder",
+    )
+
+
 def create_go_to_repo_action(parent_func: Callable, path_func: Callable) -> Action:
     return Action(
         parent=parent_func().main_form,
@@ -14,6 +14,7 @@ from src.app.utils.shell import start_file
 class FileAction(Enum):
     CREATE = "Create file"
     CREATE_CLIP = "Create from clipboard text"
+    CREATE_MANIFEST = "Create from manifest..."
     OPEN = "Open file"
     OPEN_VS = "Open (VS Code)"
 
@@ -38,6 +39,16 @@ def create_file_from_clipboard_text_action(parent_func: Callable, path_func: Cal
     )
 
 
+def create_from_manifest_action(parent_func: Callable, path_func: Callable) -> Action:
+    return Action(
+        parent=parent_func().main_form,
+        caption=FileAction.CREATE_MANIFEST.value,
+        shortcut=QKeySequence(Qt.CTRL | Qt.ALT | Qt.Key_N),
+        slot=partial(src.app.utils.file_util.create_from_manifest, parent_func, path_func),
+        tip="Creates files and folders listed in manifest under current folder",
+    )
+
+
 def create_open_file_action(parent_func: Callable, path_func: Callable) -> Action:
     def open_paths():
         for path in path_util.only_files(paths=path_func()):
@@ -14,6 +14,7 @@ class TabAction(str, Enum):
     CLOSE_ALL = "Close all tabs"
     CLOSE_OTHER = "Close other tabs"
     CLOSE = "Close"
+    SCANDIR_MODEL = "Fast listing of huge folders"
 
 
 def create_new_tab_action(parent: QWidget) -> Action:
@@ -41,3 +42,15 @@ def create_close_tab_action(parent_func: Callable, index_func: Callable) -> Acti
         shortcut=QKeySequence(Qt.SHIFT | Qt.CTRL | Qt.Key_T),
         slot=lambda: parent_func().close_page(index_func=index_func),
     )
+
+
+def create_scandir_model_action(parent_func: Callable, index_func: Callable) -> Action:
+    action = Action(
+        parent=parent_func().main_form,
+        caption=TabAction.SCANDIR_MODEL.value,
+        tip="Lists folders of tab in background with less memory, suitable for folders with many thousands of items",
+    )
+    action.setCheckable(True)
+    action.setChecked(parent_func().widget(index_func()).tree_model.scandir_model)
+    action.toggled.connect(lambda checked: parent_func().set_scandir_model(index=index_func(), enabled=checked))
+    return action
@@ -0,0 +1,124 @@
+import logging
+import os
+from typing import List, Optional
+
+from PySide6.QtCore import QTimer, Qt
+from PySide6.QtGui import QBrush
+from PySide6.QtWidgets import (
+    QDialog,
+    QFormLayout,
+    QLineEdit,
+    QCheckBox,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QLabel,
+    QDialogButtonBox,
+)
+
+from src.app.gui.widget import Layout
+from src.app.utils.bulk_rename import FolderNames, RenamePlan, RenameRule, plan_renames
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+PREVIEW_DELAY = 150
+PREVIEW_LIMIT = 5000
+
+
+class BulkRenameDlg(QDialog):
+    """Renames selected items by regular expression or template. Preview of new names is computed as rules
+    are typed, dialog can be accepted only if there are no conflicts"""
+
+    def __init__(self, parent, paths: List[str]):
+        super().__init__(parent=parent)
+        self.paths = paths
+        self.plan: Optional[RenamePlan] = None
+        # folders are listed once for all previews, renames check targets again when applied
+        self.existing = FolderNames()
+        self.setWindowTitle(f"Bulk rename - {len(paths)} items")
+        self.setSizeGripEnabled(True)
+        self.pattern = QLineEdit()
+        self.pattern.setPlaceholderText("Regular expression, e.g. ^IMG_(\\d+)")
+        self.replacement = QLineEdit()
+        self.replacement.setPlaceholderText("Replacement, e.g. photo_\\1 or template {stem}_{n:03}{ext}")
+        self.regex = QCheckBox("Regular expression")
+        self.regex.setChecked(True)
+        self.ignore_case = QCheckBox("Ignore case")
+        self.preview = QTreeWidget()
+        self.preview.setHeaderLabels(["Name", "New name", "Problem"])
+        self.preview.setRootIsDecorated(False)
+        self.preview.setColumnWidth(0, 250)
+        self.preview.setColumnWidth(1, 250)
+        self.status = QLabel()
+        self.buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, Qt.Horizontal)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DELAY)
+        self.preview_timer.timeout.connect(self.update_preview)
+        form = QFormLayout()
+        form.addRow("Find", self.pattern)
+        form.addRow("Replace", self.replacement)
+        form.addRow("", self.regex)
+        form.addRow("", self.ignore_case)
+        layout = Layout(delta=10)
+        layout.addLayout(form)
+        layout.addWidget(self.preview)
+        layout.addWidget(self.status)
+        layout.addWidget(self.buttons)
+        self.setLayout(layout)
+        self.resize(700, 500)
+        self.pattern.textChanged.connect(lambda text: self.preview_timer.start())
+        self.replacement.textChanged.connect(lambda text: self.preview_timer.start())
+        self.regex.toggled.connect(self.on_regex_toggled)
+        self.ignore_case.toggled.connect(lambda checked: self.preview_timer.start())
+        self.update_preview()
+
+    def on_regex_toggled(self, checked: bool):
+        self.pattern.setEnabled(checked)
+        self.ignore_case.setEnabled(checked)
+        self.preview_timer.start()
+
+    def update_preview(self):
+        self.preview_timer.stop()
+        self.plan = None
+        self.status.clear()
+        try:
+            rule = RenameRule(
+                pattern=self.pattern.text(),
+                replacement=self.replacement.text(),
+                regex=self.regex.isChecked(),
+                ignore_case=self.ignore_case.isChecked(),
+            )
+            if not self.regex.isChecked() or self.pattern.text():
+                self.plan = plan_renames(paths=self.paths, rule=rule, exists=self.existing)
+        except ValueError as e:
+            self.status.setText(str(e))
+        self.fill_preview()
+
+    def fill_preview(self):
+        self.preview.setUpdatesEnabled(False)
+        self.preview.clear()
+        items = []
+        warning = QBrush(Qt.red)
+        for path in self.paths[:PREVIEW_LIMIT]:
+            new_path = self.plan.names.get(path, path) if self.plan is not None else path
+            problem = self.plan.conflicts.get(path, "") if self.plan is not None else ""
+            item = QTreeWidgetItem([os.path.basename(path), os.path.basename(new_path), problem])
+            if problem:
+                for column in range(3):
+                    item.setForeground(column, warning)
+            items.append(item)
+        self.preview.addTopLevelItems(items)
+        self.preview.setUpdatesEnabled(True)
+        if self.plan is not None:
+            self.status.setText(
+                f"{len(self.plan.renames)} of {len(self.paths)} items renamed, {len(self.plan.conflicts)} conflicts"
+            )
+        self.buttons.button(QDialogButtonBox.Ok).setEnabled(bool(self.plan))
+
+    def accept(self):
+        self.update_preview()
+        if self.plan:
+            super().accept()
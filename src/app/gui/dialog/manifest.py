@@ -0,0 +1,74 @@
+import logging
+from typing import Optional
+
+from PySide6.QtCore import QTimer, Qt
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QDialog, QPlainTextEdit, QLabel, QDialogButtonBox
+
+from src.app.gui.widget import Layout
+from src.app.utils.logger import get_console_logger
+from src.app.utils.manifest import ManifestError, ManifestPlan, parse_manifest, validate_manifest
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+VALIDATE_DELAY = 300
+MANIFEST_PLACEHOLDER = """src/
+    app/
+        __init__.py
+        main.py
+    test/
+README.md;setup.py
+docs/index.md"""
+
+
+class ManifestDlg(QDialog):
+    """Files and folders to create under root described by indented manifest or list of paths.
+    Manifest is validated against file system as it is typed"""
+
+    def __init__(self, parent, root: str):
+        super().__init__(parent=parent)
+        self.root = root
+        self.plan: Optional[ManifestPlan] = None
+        self.setWindowTitle(f"Create from manifest - {root}")
+        self.setSizeGripEnabled(True)
+        self.edit = QPlainTextEdit()
+        self.edit.setPlaceholderText(MANIFEST_PLACEHOLDER)
+        self.edit.setFont(QFont("Consolas"))
+        self.edit.setTabChangesFocus(False)
+        self.status = QLabel()
+        self.status.setWordWrap(True)
+        self.buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, Qt.Horizontal)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        self.validate_timer = QTimer(self)
+        self.validate_timer.setSingleShot(True)
+        self.validate_timer.setInterval(VALIDATE_DELAY)
+        self.validate_timer.timeout.connect(self.validate)
+        layout = Layout(delta=10)
+        layout.addWidget(self.edit)
+        layout.addWidget(self.status)
+        layout.addWidget(self.buttons)
+        self.setLayout(layout)
+        self.resize(500, 400)
+        self.edit.textChanged.connect(self.validate_timer.start)
+        self.validate()
+
+    def validate(self):
+        self.validate_timer.stop()
+        self.plan = None
+        try:
+            self.plan = validate_manifest(root=self.root, entries=parse_manifest(text=self.edit.toPlainText()))
+        except ManifestError as e:
+            self.status.setText(str(e))
+        if self.plan is not None:
+            conflicts = "<br>".join(f"{path}: {reason}" for path, reason in list(self.plan.conflicts.items())[:10])
+            self.status.setText(
+                f"{len(self.plan.dirs)} folders and {len(self.plan.files)} files to create, "
+                f"{len(self.plan.existing)} already exist" + (f"<br>{conflicts}" if conflicts else "")
+            )
+        self.buttons.button(QDialogButtonBox.Ok).setEnabled(bool(self.plan))
+
+    def accept(self):
+        self.validate()
+        if self.plan:
+            super().accept()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QKeyEvent
+from PySide6.QtWidgets import QDialog, QLineEdit, QListWidget, QListWidgetItem, QLabel, QBoxLayout, QApplication
+
+from src.app.utils.constant import Context
+from src.app.utils.file_index import FileIndexes
+from src.app.utils.logger import get_console_logger
+from src.app.utils.path_util import go_to_item
+
+logger = get_console_logger(__name__, log_level=logging.ERROR)
+
+RESULT_LIMIT = 50
+
+
+class QuickOpenDlg(QDialog):
+    def __init__(self, mf):
+        super().__init__(parent=mf)
+        self.mf = mf
+        self.root: Optional[str] = None
+        self.file_indexes: FileIndexes = mf.file_indexes
+        self.setSizeGripEnabled(True)
+        self.setWindowTitle("Quick open")
+        self.edit = QLineEdit()
+        self.edit.setPlaceholderText("File name or path fragments")
+        self.results = QListWidget()
+        self.status = QLabel()
+        self.query_timer = QTimer(self)
+        self.query_timer.setSingleShot(True)
+        self.query_timer.setInterval(50)
+        self.query_timer.timeout.connect(self.update_results)
+        self.main_box = QBoxLayout(QBoxLayout.TopToBottom, self)
+        self.main_box.setContentsMargins(10, 10, 10, 10)
+        self.main_box.setSpacing(5)
+        self.main_box.addWidget(self.edit)
+        self.main_box.addWidget(self.results)
+        self.main_box.addWidget(self.status)
+        self.setLayout(self.main_box)
+        self.resize(600, 400)
+
+        self.edit.textChanged.connect(lambda text: self.query_timer.start())
+        self.edit.returnPressed.connect(self.open_current)
+        self.results.itemActivated.connect(self.open_item)
+        self.file_indexes.loaded.connect(self.on_index_loaded)
+        self.file_indexes.finished.connect(self.on_index_finished)
+        self.file_indexes.exception.connect(self.on_index_exception)
+
+    def keyPressEvent(self, event: QKeyEvent):
+        if event.key() in (Qt.Key_Up, Qt.Key_Down, Qt.Key_PageUp, Qt.Key_PageDown):
+            QApplication.sendEvent(self.results, event)
+            return
+        super().keyPressEvent(event)
+
+    def open_root(self, root: str):
+        self.root = root
+        self.setWindowTitle(f"Quick open - {root}")
+        self.file_indexes.request(root=root)
+        self.update_results()
+        self.show()
+        self.activateWindow()
+        self.edit.setFocus()
+        self.edit.selectAll()
+
+    def on_index_loaded(self, root: str):
+        if root == self.root:
+            self.update_results()
+
+    def on_index_finished(self, root: str):
+        if root == self.root:
+            self.update_status()
+
+    def on_index_exception(self, root: str, message: str):
+        if root == self.root:
+            self.status.setText(message)
+
+    def update_status(self):
+        index = self.file_indexes.index(root=self.root)
+        text = f"{len(index)} files indexed" if index is not None else "No index yet"
+        if self.file_indexes.is_indexing(root=self.root):
+            text = f"{text} - indexing in background"
+        self.status.setText(text)
+
+    def update_results(self):
+        self.results.clear()
+        self.update_status()
+        index = self.file_indexes.index(root=self.root)
+        if index is None:
+            return
+        for path in index.query(text=self.edit.text(), limit=RESULT_LIMIT):
+            item = QListWidgetItem(path[len(index.root) + 1 :])
+            item.setData(Qt.UserRole, path)
+            item.setToolTip(path)
+            self.results.addItem(item)
+        self.results.setCurrentRow(0)
+
+    def open_current(self):
+        if item := self.results.currentItem():
+            self.open_item(item=item)
+
+    def open_item(self, item: QListWidgetItem):
+        path = item.data(Qt.UserRole)
+        self.hide()
+        go_to_item(parent=self.mf, path_func=lambda: [path], context_func=lambda: Context.quick_open)
@@ -32,6 +32,7 @@ from src.app.model.search import (
 from src.app.utils.constant import APP_NAME
 from src.app.utils.logger import get_console_logger
 from src.app.utils.path_util import path_caption
+from src.app.utils.scheduler import io_scheduler
 from src.app.utils.search import search, search_file
 from src.app.utils.thread import ThreadWithWorker
 
@@ -111,6 +112,10 @@ class SearchPanel(QWidget):
         self.widget_map["subdirectories"] = QCheckBox("Including subdirectories")
         self.widget_map["subdirectories"].setChecked(True)
         self.widget_map["reg_exp"] = QCheckBox("Regular expression")
+        self.widget_map["multiple_keywords"] = QCheckBox("Multiple keywords separated by semicolon")
+        self.widget_map["multiple_keywords"].setToolTip("Keywords are matched literally in a single pass over file")
+        self.widget_map["all_keywords"] = QCheckBox("All keywords required")
+        self.widget_map["all_keywords"].setEnabled(False)
 
         # Progress
         self.status = QLabel()
@@ -125,6 +130,8 @@ class SearchPanel(QWidget):
         self.form.addRow("", self.widget_map["whole_words"])
         self.form.addRow("", self.widget_map["subdirectories"])
         self.form.addRow("", self.widget_map["reg_exp"])
+        self.form.addRow("", self.widget_map["multiple_keywords"])
+        self.form.addRow("", self.widget_map["all_keywords"])
 
         self.form.addRow("Status", self.status)
         self.form.addRow("Progress", self.progress)
@@ -143,6 +150,11 @@ class SearchPanel(QWidget):
         self.setLayout(self.main_layout)
 
         self.search_btn.clicked.connect(self.search_action)
+        self.widget_map["multiple_keywords"].toggled.connect(self.on_multiple_keywords_toggled)
+
+    def on_multiple_keywords_toggled(self, checked: bool):
+        self.widget_map["reg_exp"].setEnabled(not checked)
+        self.widget_map["all_keywords"].setEnabled(checked)
 
     def set_status(self, text: str):
         metrics = QFontMetrics(self.status.font())
@@ -163,12 +175,14 @@ class SearchPanel(QWidget):
     def enable_search_controls(self, enabled: bool):
         for control in self.widget_map.values():
             control.setEnabled(enabled)
+        if enabled:
+            self.on_multiple_keywords_toggled(checked=self.widget_map["multiple_keywords"].isChecked())
 
     def search_path(self) -> str:
         return self.widget_map["path"].text()
 
     def search_path_caption(self) -> str:
-        return path_caption(path=self.search_path())
+        return "; ".join(path_caption(path=path) for path in split_multiple_values(text=self.search_path()))
 
     def cancel_search(self):
         if self.thread_with_worker.thread and self.thread_with_worker.thread.isRunning():
@@ -300,7 +314,8 @@ class SearchWorker(QObject):
             self.started.emit(self.search_param)
             result_buffer = []
             search_results = []
-            for search_result in search(search_param=self.search_param):
+            io_lane = io_scheduler().lane(name=f"search {self.search_param.path}")
+            for search_result in search(search_param=self.search_param, io_lane=io_lane):
                 self.check_if_user_requested_cancel()
                 self.progress_status.emit(ProgressStatus(status=search_result.file_name))
                 search_results.append(search_result)
@@ -321,7 +336,8 @@ class SearchWorker(QObject):
                 else:
                     search_stat.files += 1
                 if not search_results[index].is_dir and self.search_param.keyword:
-                    text_lines = open_file(file_name=search_results[index].file_name)
+                    with io_lane.slot():
+                        text_lines = open_file(file_name=search_results[index].file_name)
                     search_results[index] = search_file(
                         search_param=self.search_param, text_lines=text_lines, search_result=search_results[index]
                     )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from functools import partial
-from typing import List, Callable, Optional
+from typing import Dict, List, Callable, Optional
 from enum import Enum, auto
 
 from PySide6.QtCore import QPoint, QEvent
@@ -13,6 +13,7 @@ from src.app.gui.action.command import Action
 from src.app.gui.dialog.favorite_edit import FavoriteDialog
 from src.app.model.favorite import Favorite, Favorites
 from src.app.utils.constant import APP_NAME
+from src.app.utils.liveness import liveness_checker
 from src.app.utils.path_util import all_folders, path_caption
 from src.app.model.schema import Group
 from src.app.utils.logger import get_console_logger
@@ -31,9 +32,15 @@ class FavoriteTree(QTreeWidget):
     def __init__(self, parent, group: Group):
         super().__init__(parent=parent)
         self.favorites = group.favorites
+        self.items_by_id: Dict[int, QTreeWidgetItem] = {}
+        favorites = self.favorites
+        favorites.subscribe(listener=self)
+        self.destroyed.connect(lambda: favorites.unsubscribe(listener=self))
         self.group_panel = parent.parent()
-        self.group_box = self.group_panel.parent()
+        self.group_box = self.group_panel.group_box
         self.main_form = self.group_box.main_form
+        self.liveness = liveness_checker()
+        self.liveness.dead.connect(self.on_dead_paths)
         self.init_ui()
         self.recreate()
 
@@ -52,24 +59,29 @@ class FavoriteTree(QTreeWidget):
         # self.collapsed.connect(self.collapsed)
         self.itemSelectionChanged.connect(self.selection_changed)
 
-    def remove_dead_entries(self):
-        removed = self.favorites.remove_dead_entries()
+    def check_liveness(self):
+        # paths are checked in background, dead ones come back via on_dead_paths
+        self.liveness.check(requester=self, paths=[favorite.path for favorite in self.favorites.get_flatten_items()])
+
+    def on_dead_paths(self, requester: object, paths: List[str]):
+        if requester is not self:
+            return
+        removed = self.favorites.remove_paths(paths=set(paths))
         if removed:
             path_lst = "\n".join(removed)
             QMessageBox().information(
                 self, APP_NAME, f"The following paths are not longer valid and have been removed \n{path_lst}"
             )
-            self.recreate()
 
     def focusInEvent(self, event: QFocusEvent) -> None:
         super().focusInEvent(event)
         logger.debug("focusInEvent")
-        self.remove_dead_entries()
+        self.check_liveness()
 
     def enterEvent(self, event: QEvent) -> None:
         super().enterEvent(event)
         logger.debug("enterEvent")
-        self.remove_dead_entries()
+        self.check_liveness()
 
     def current_favorite(self) -> Optional[Favorite]:
         item = self.currentItem()
@@ -107,6 +119,7 @@ class FavoriteTree(QTreeWidget):
 
     def recreate(self):
         self.clear()
+        self.items_by_id.clear()
         self.favorites.sort()
         self.insertTopLevelItems(0, self.create_items(self.favorites))
 
@@ -124,8 +137,41 @@ class FavoriteTree(QTreeWidget):
         item.setText(2, favorite.path)
         item.setData(0, Qt.UserRole, favorite)
         item.setIcon(0, self.main_form.icons["dir"])
+        self.items_by_id[id(favorite)] = item
         return item
 
+    def on_favorite_inserted(self, parent: Optional[Favorite], favorite: Favorite, row: int):
+        item = QTreeWidgetItem()
+        self.populate_favorite_item(item=item, favorite=favorite)
+        parent_item = self.items_by_id.get(id(parent)) if parent else None
+        if parent_item:
+            parent_item.insertChild(row, item)
+            if parent.expanded:
+                self.expandItem(parent_item)
+        else:
+            self.insertTopLevelItem(row, item)
+        self.create_children(parent=item, children=favorite.children)
+
+    def on_favorite_updated(self, favorite: Favorite):
+        if item := self.items_by_id.get(id(favorite)):
+            self.populate_favorite_item(item=item, favorite=favorite)
+
+    def on_favorite_removed(self, parent: Optional[Favorite], favorite: Favorite, row: int):
+        item = self.items_by_id.get(id(favorite))
+        if item is None:
+            return
+        self.forget_items(item=item)
+        (item.parent() or self.invisibleRootItem()).removeChild(item)
+
+    def forget_items(self, item: QTreeWidgetItem):
+        self.items_by_id.pop(id(self.get_favorite(item)), None)
+        for index in range(item.childCount()):
+            self.forget_items(item=item.child(index))
+
+    def select_favorite(self, favorite: Optional[Favorite]):
+        if favorite and (item := self.items_by_id.get(id(favorite))):
+            self.set_item_selected(item)
+
     def create_top_level_item(self, favorite: Favorite) -> QTreeWidgetItem:
         item = QTreeWidgetItem(self)
         self.populate_favorite_item(item=item, favorite=favorite)
@@ -164,15 +210,9 @@ class FavoriteTree(QTreeWidget):
         item: QTreeWidgetItem = self.itemAt(event.pos())
         files = [u.toLocalFile() for u in event.mimeData().urls()]
         new_favorites = [Favorite(name=path_caption(path=file), path=file) for file in files]
-        if item:
-            current_favorite = self.get_favorite(item=item)
-            for new_favorite in new_favorites:
-                self.favorites.create_item(current_favorite=current_favorite, new_favorite=new_favorite)
-            self.create_children(parent=item, children=new_favorites)
-        else:
-            for new_favorite in new_favorites:
-                self.favorites.create_item(new_favorite=new_favorite)
-        self.recreate()
+        current_favorite = self.get_favorite(item=item) if item else None
+        for new_favorite in new_favorites:
+            self.favorites.create_item(current_favorite=current_favorite, new_favorite=new_favorite)
         logger.debug(f"Favorites after drop {self.favorites}")
 
     def open_menu(self, position: QPoint):
@@ -187,9 +227,9 @@ class FavoriteTree(QTreeWidget):
             self.favorite_tree = favorite_tree
             self.current_item = current_item
 
-        def save_tree_and_recreate(self):
+        def save_tree_and_select(self, selected: Optional[Favorite]):
             self.favorite_tree.save_to_file()
-            self.favorite_tree.recreate()
+            self.favorite_tree.select_favorite(favorite=selected)
 
         def modifier(self, current_item: QTreeWidgetItem, parent_item: QTreeWidgetItem, func: Callable, mode: EditMode):
             favorite = None
@@ -211,7 +251,7 @@ class FavoriteTree(QTreeWidget):
                     selected = favorite
                 self.favorite_tree.favorites.selected = selected
                 # logger.debug(f"selected after operation {self.favorite_tree.favorites.selected}")
-                self.save_tree_and_recreate()
+                self.save_tree_and_select(selected=selected)
 
         def open_menu(self, position: QPoint):
             self.clear()
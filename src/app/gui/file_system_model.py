@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QDir, QModelIndex
+from PySide6.QtWidgets import QFileSystemModel
+
+from src.app.gui.scandir_model import ScandirModel
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+SHARED_MODEL_FILTERS = QDir.Drives | QDir.AllEntries | QDir.AllDirs | QDir.NoDotAndDotDot | QDir.Hidden | QDir.System
+
+FileSystemModel = QFileSystemModel | ScandirModel
+SortKey = Tuple[bool, str]
+
+
+class EntryCache:
+    """Sort keys and attributes of entries of one file system model, shared by all proxies viewing it.
+    Keys are index internal ids which identify file system nodes"""
+
+    def __init__(self, model: FileSystemModel):
+        self.model = model
+        self.loaded_paths: Set[str] = set()
+        self.sort_keys: Dict[int, SortKey] = {}
+        self.hidden: Dict[int, bool] = {}
+        self.system: Dict[int, bool] = {}
+        model.directoryLoaded.connect(self.cache_directory)
+        self.connect_invalidation()
+
+    def connect_invalidation(self):
+        self.model.rowsAboutToBeRemoved.connect(self.invalidate_rows)
+        self.model.dataChanged.connect(self.invalidate_range)
+        self.model.modelReset.connect(self.clear)
+        self.model.layoutChanged.connect(self.clear)
+
+    def clear(self):
+        self.sort_keys.clear()
+        self.hidden.clear()
+        self.system.clear()
+
+    def sort_key(self, index: QModelIndex) -> SortKey:
+        key = self.sort_keys.get(index.internalId())
+        if key is None:
+            key = (not self.model.isDir(index), self.model.fileName(index).lower())
+            self.sort_keys[index.internalId()] = key
+        return key
+
+    def is_hidden(self, index: QModelIndex) -> bool:
+        hidden = self.hidden.get(index.internalId())
+        if hidden is None:
+            hidden = self.model.fileInfo(index).isHidden()
+            self.hidden[index.internalId()] = hidden
+        return hidden
+
+    def is_system(self, index: QModelIndex) -> bool:
+        system = self.system.get(index.internalId())
+        if system is None:
+            info = self.model.fileInfo(index)
+            system = not (info.isFile() or info.isDir())
+            self.system[index.internalId()] = system
+        return system
+
+    def cache_directory(self, path: str):
+        self.loaded_paths.add(path)
+        parent = self.model.index(path)
+        for row in range(self.model.rowCount(parent)):
+            index = self.model.index(row, 0, parent)
+            self.sort_key(index=index)
+            self.is_hidden(index=index)
+
+    def invalidate_rows(self, parent: QModelIndex, first: int, last: int):
+        for row in range(first, last + 1):
+            internal_id = self.model.index(row, 0, parent).internalId()
+            self.sort_keys.pop(internal_id, None)
+            self.hidden.pop(internal_id, None)
+            self.system.pop(internal_id, None)
+
+    def invalidate_range(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: List[int] = None):
+        self.invalidate_rows(parent=top_left.parent(), first=top_left.row(), last=bottom_right.row())
+
+
+class ScandirEntryCache(EntryCache):
+    """Scandir model keeps sort keys and attributes of its entries itself"""
+
+    def connect_invalidation(self):
+        pass
+
+    def sort_key(self, index: QModelIndex) -> str:
+        return self.model.sort_key(index)
+
+    def is_hidden(self, index: QModelIndex) -> bool:
+        return self.model.is_hidden(index)
+
+    def is_system(self, index: QModelIndex) -> bool:
+        return self.model.is_system(index)
+
+    def cache_directory(self, path: str):
+        self.loaded_paths.add(path)
+
+
+def load_path(model: FileSystemModel, path: str):
+    """Starts loading of folder. Unlike setRootPath it doesn't change root and watched folder
+    of model shared with other views"""
+    if not path:
+        return
+    index = model.index(path)
+    if index.isValid() and model.canFetchMore(index):
+        model.fetchMore(index)
+
+
+class SharedModels:
+    """One reference counted file system model of each kind shared by all tree views"""
+
+    def __init__(self):
+        self.models: Dict[bool, FileSystemModel] = {}
+        self.references: Dict[bool, int] = {}
+        self.caches: Dict[int, EntryCache] = {}
+
+    def acquire(self, scandir: bool = False) -> FileSystemModel:
+        model = self.models.get(scandir)
+        if model is None:
+            model = ScandirModel() if scandir else QFileSystemModel()
+            model.setFilter(SHARED_MODEL_FILTERS)
+            # root path of shared model is never changed, views load their folders with load_path
+            model.setRootPath("")
+            self.models[scandir] = model
+            self.references[scandir] = 0
+            logger.debug(f"shared model {model} created")
+        self.references[scandir] += 1
+        return model
+
+    def release(self, model: FileSystemModel):
+        scandir = isinstance(model, ScandirModel)
+        if self.models.get(scandir) is not model:
+            return
+        self.references[scandir] -= 1
+        if self.references[scandir] == 0:
+            del self.models[scandir]
+            self.caches.pop(id(model), None)
+            model.deleteLater()
+            logger.debug(f"shared model {model} released")
+
+    def entry_cache(self, model: FileSystemModel) -> EntryCache:
+        cache = self.caches.get(id(model))
+        if cache is None:
+            cache_class = ScandirEntryCache if isinstance(model, ScandirModel) else EntryCache
+            cache = cache_class(model=model)
+            self.caches[id(model)] = cache
+        return cache
+
+
+_shared_models: Optional[SharedModels] = None
+
+
+def shared_models() -> SharedModels:
+    global _shared_models  # pylint: disable=global-statement
+    if _shared_models is None:
+        _shared_models = SharedModels()
+    return _shared_models
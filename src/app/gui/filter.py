@@ -1,21 +1,82 @@
-from PySide6.QtWidgets import QWidget, QBoxLayout, QLabel, QLineEdit
+import logging
+from typing import Optional, Set, Tuple
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QWidget, QBoxLayout, QLabel, QLineEdit, QCheckBox
 
 from src.app.gui.widget import Layout
+from src.app.utils.logger import get_console_logger
+from src.app.utils.name_matcher import MatchingDirsFinder, NameMatcher
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+FILTER_DELAY = 200
+DEEP_EXPAND_LIMIT = 100
 
 
 class FilterView(QWidget):
+    """Name filter of current tree. Filter is applied when typing pauses.
+    Deep filter shows folders under pinned path containing matching files using file index built in background"""
+
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self.parent = parent
-        layout = Layout(QBoxLayout.LeftToRight)
+        self.tree_box = parent
+        self.main_form = self.tree_box.main_form
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        layout = Layout(QBoxLayout.LeftToRight, delta=0)
         layout.addStretch()
         layout.addWidget(QLabel(" Filter "))
-        edit = QLineEdit()
-        edit.textChanged.connect(self.on_text_changed)
-        layout.addWidget(edit)
+        self.edit = QLineEdit()
+        self.edit.setPlaceholderText("*.py;name")
+        self.edit.setClearButtonEnabled(True)
+        self.edit.textChanged.connect(lambda text: self.filter_timer.start())
+        layout.addWidget(self.edit)
+        self.fuzzy = QCheckBox("Fuzzy")
+        self.fuzzy.toggled.connect(lambda checked: self.filter_timer.start())
+        layout.addWidget(self.fuzzy)
+        self.deep = QCheckBox("Deep")
+        self.deep.setToolTip("Show folders under pinned path which contain matching files")
+        self.deep.toggled.connect(lambda checked: self.filter_timer.start())
+        layout.addWidget(self.deep)
         self.setLayout(layout)
+        self.main_form.file_indexes.loaded.connect(self.on_index_loaded)
+        self.dirs_finder = MatchingDirsFinder()
+        self.dirs_finder.ready.connect(self.on_dirs_ready)
+
+    def apply_filter(self):
+        self.filter_timer.stop()
+        tree = self.tree_box.current_tree()
+        if tree is None:
+            return
+        matcher = NameMatcher(text=self.edit.text(), fuzzy=self.fuzzy.isChecked())
+        deep, deep_dirs = self.deep_dirs(root=tree.pinned_path, matcher=matcher)
+        if deep and deep_dirs is None:
+            # filter is applied when folders are found in background
+            return
+        proxy = tree.proxy
+        same_matcher = (proxy.name_matcher.text, proxy.name_matcher.fuzzy) == (matcher.text, matcher.fuzzy)
+        if same_matcher and deep_dirs is None and proxy.deep_dirs is None:
+            return
+        logger.debug(f"filter {matcher.text} deep folders {len(deep_dirs) if deep_dirs is not None else None}")
+        proxy.set_name_filter(matcher=matcher, deep_root=tree.pinned_path, deep_dirs=deep_dirs)
+        if deep_dirs and len(deep_dirs) <= DEEP_EXPAND_LIMIT:
+            tree.expand_paths(paths=sorted(deep_dirs))
+
+    def deep_dirs(self, root: Optional[str], matcher: NameMatcher) -> Tuple[bool, Optional[Set[str]]]:
+        """Whether deep filter is used and its folders, None until they are found"""
+        if not self.deep.isChecked() or not root or not matcher:
+            return False, None
+        index = self.main_form.file_indexes.request(root=root)
+        if index is None:
+            return False, None
+        return True, self.dirs_finder.find(index=index, matcher=matcher)
+
+    def on_index_loaded(self, root: str):
+        if (tree := self.tree_box.current_tree()) and tree.pinned_path == root and self.deep.isChecked():
+            self.apply_filter()
 
-    def on_text_changed(self, text: str):
-        filters = text.split(";")
-        self.parent.model().setNameFilters(filters if filters else "*")
-        self.parent.model().setNameFilterDisables(False)
+    def on_dirs_ready(self, root: str):
+        self.on_index_loaded(root=root)
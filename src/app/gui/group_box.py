@@ -12,22 +12,47 @@ from src.app.utils.constant import APP_NAME
 
 
 class GroupPanel(QWidget):
+    """Favorites and tabs of group are created when group is activated for the first time"""
+
     def __init__(self, parent: QWidget, app: App, group: Group):
         super().__init__(parent)
+        # tab widget reparents panel so group box is kept for children built later
+        self.group_box = parent
         self.app = app
         self.group = group
+        self.splitter: Optional[QSplitter] = None
+        self._favorite_tree: Optional[FavoriteTree] = None
+        self._tree_box: Optional[TreeBox] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self.splitter is not None
+
+    def build(self):
+        if self.is_built:
+            return
         self.splitter = QSplitter(self)
-        self.favorite_tree = FavoriteTree(parent=self.splitter, group=group)
-        self.tree_box = TreeBox(parent=self.splitter, group=group)
-        self.splitter.addWidget(self.favorite_tree)
-        self.splitter.addWidget(self.tree_box)
+        self._favorite_tree = FavoriteTree(parent=self.splitter, group=self.group)
+        self._tree_box = TreeBox(parent=self.splitter, group=self.group)
+        self.splitter.addWidget(self._favorite_tree)
+        self.splitter.addWidget(self._tree_box)
 
-        if group.splitter_sizes:
-            self.splitter.setSizes(group.splitter_sizes)
+        if self.group.splitter_sizes:
+            self.splitter.setSizes(self.group.splitter_sizes)
         self.splitter.splitterMoved.connect(self.on_splitter_moved)
 
         self.setLayout(populated_box_layout(widgets=[self.splitter]))
 
+    @property
+    def favorite_tree(self) -> FavoriteTree:
+        self.build()
+        return self._favorite_tree
+
+    @property
+    def tree_box(self) -> TreeBox:
+        self.build()
+        return self._tree_box
+
     def on_splitter_moved(self, pos, index):
         self.group.splitter_sizes = self.splitter.sizes()
 
@@ -50,13 +75,16 @@ class GroupBox(TabWidget):
 
     def save_pinned_paths(self):
         for panel in self.get_all_groups_panels():
+            if not panel.is_built:
+                continue
             current_tree = panel.tree_box.current_tree()
             path = current_tree.pinned_path if current_tree else None
             panel.group.last_page_pinned_path = path
 
     def store_groups_layout(self):
         for panel in self.get_all_groups_panels():
-            panel.tree_box.store_pages_layout()
+            if panel.is_built:
+                panel.tree_box.store_pages_layout()
 
     def current_group_panel(self) -> Optional[GroupPanel]:
         index = self.currentIndex()
@@ -113,10 +141,14 @@ class GroupBox(TabWidget):
         if not self.app_model.groups:
             self.open_default_group()
             return
+        # only the group shown at startup is built, others are built when activated
+        blocked = self.blockSignals(True)
         for group in self.app_model.groups:
             self.add_group(group=group)
         if self.app_model.last_group and self.app_model.last_group in [group.name for group in self.app_model.groups]:
             self.go_to_group(self.app_model.get_group_by_name(self.app_model.last_group))
+        self.blockSignals(blocked)
+        self.on_current_changed(index=self.currentIndex())
 
     def add_group(self, group: Group) -> GroupPanel:
         group_panel = self.get_group_component(group=group)
@@ -142,7 +174,8 @@ class GroupBox(TabWidget):
         menu.exec_(self.mapToGlobal(position))
 
     def on_current_changed(self, index: int):
-        pass
+        if index >= 0:
+            self.widget(index).build()
 
     def close_page(self, index_func: Callable):
         index = index_func()
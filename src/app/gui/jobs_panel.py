@@ -0,0 +1,88 @@
+import logging
+from typing import Dict, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem, QMenu, QMessageBox, QDockWidget
+
+from src.app.utils.jobs import Job, JobQueue, JobState, BYTES
+from src.app.utils.logger import get_console_logger
+from src.app.utils.path_util import convert_size
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+JOB_COLUMN = 0
+STATE_COLUMN = 1
+PROGRESS_COLUMN = 2
+
+
+def progress_caption(job: Job) -> str:
+    if (percent := job.progress()) is None:
+        return ""
+    if job.unit != BYTES:
+        return f"{percent}% ({job.done} of {job.total} {job.unit})"
+    return f"{percent}% ({convert_size(size_bytes=job.done)} of {convert_size(size_bytes=job.total)})"
+
+
+class JobsPanel(QTreeWidget):
+    """List of file operations queued in job queue with their state and progress"""
+
+    def __init__(self, parent, queue: JobQueue):
+        super().__init__(parent)
+        self.main_form = parent
+        self.queue = queue
+        self.items: Dict[int, QTreeWidgetItem] = {}
+        self.setHeaderLabels(["Job", "State", "Progress"])
+        self.setRootIsDecorated(False)
+        self.setColumnWidth(JOB_COLUMN, 400)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.open_menu)
+        self.queue.added.connect(self.on_job_added)
+        self.queue.changed.connect(self.on_job_changed)
+        self.queue.finished.connect(self.on_job_finished)
+
+    def on_job_added(self, job: Job):
+        item = QTreeWidgetItem([job.caption, job.state.value, ""])
+        item.setData(JOB_COLUMN, Qt.UserRole, job.id)
+        item.setToolTip(JOB_COLUMN, job.caption)
+        self.items[job.id] = item
+        self.addTopLevelItem(item)
+        if dock := self.dock():
+            dock.show()
+
+    def on_job_changed(self, job: Job):
+        if (item := self.items.get(job.id)) is None:
+            return
+        item.setText(STATE_COLUMN, job.state.value)
+        item.setText(PROGRESS_COLUMN, progress_caption(job=job))
+
+    def on_job_finished(self, job: Job):
+        self.on_job_changed(job=job)
+        if job.state == JobState.FAILED:
+            if item := self.items.get(job.id):
+                item.setToolTip(STATE_COLUMN, job.error)
+            QMessageBox.critical(self.main_form, "Exception in background thread", job.error)
+
+    def current_job(self) -> Optional[Job]:
+        if (item := self.currentItem()) is None:
+            return None
+        return self.queue.jobs.get(item.data(JOB_COLUMN, Qt.UserRole))
+
+    def cancel_current_job(self):
+        if job := self.current_job():
+            self.queue.cancel(job=job)
+
+    def clear_finished(self):
+        for job in self.queue.clear_finished():
+            if (item := self.items.pop(job.id, None)) is not None:
+                self.takeTopLevelItem(self.indexOfTopLevelItem(item))
+
+    def open_menu(self, position):
+        menu = QMenu()
+        job = self.current_job()
+        cancel = menu.addAction("Cancel", self.cancel_current_job)
+        cancel.setEnabled(job is not None and not job.is_finished)
+        menu.addAction("Clear finished", self.clear_finished)
+        menu.exec_(self.viewport().mapToGlobal(position))
+
+    def dock(self) -> Optional[QDockWidget]:
+        return self.parent() if isinstance(self.parent(), QDockWidget) else None
@@ -3,22 +3,26 @@ import sys
 import traceback
 from typing import Optional, List, Dict
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QMainWindow, QMessageBox, QApplication, QStyle
+from PySide6.QtWidgets import QMainWindow, QMessageBox, QApplication, QStyle, QDockWidget
 
 from src.app.gui.action.command import Action
 from src.app.gui.group_box import GroupBox, GroupPanel
+from src.app.gui.jobs_panel import JobsPanel
 from src.app.gui.dialog.base import CustomMessageBox
+from src.app.gui.dialog.quick_open import QuickOpenDlg
 from src.app.gui.dialog.search.search_dlg import SearchDlg
 from src.app.gui.dialog.search.search_panel import SearchWorker
 from src.app.gui.favorite_view import FavoriteTree
 from src.app.gui.menu import init_menu
 from src.app.gui.tree_box import TreeBox
 from src.app.gui.tree_view import TreeView
-from src.app.model.schema import get_config_file, WindowState, App
+from src.app.model.schema import get_config_file, get_index_dir, WindowState, App
 from src.app.model.search import FileSearchResult
 from src.app.utils.constant import APP_NAME, Context
+from src.app.utils.file_index import FileIndexes, IndexWorker
+from src.app.utils.jobs import job_queue
 from src.app.utils.logger import get_console_logger, get_file_handler
 from src.app.utils.serializer import json_to_file
 from src.app.utils.thread import ThreadWithWorker
@@ -26,6 +30,9 @@ from src.app.utils.thread import ThreadWithWorker
 logger = get_console_logger(name=__name__, log_level=logging.INFO)
 logger.addHandler(get_file_handler())
 
+# ms after which jobs panel shows file operations that quit waits for
+JOBS_PANEL_QUIT_DELAY = 2000
+
 
 class MainForm(QMainWindow):
     def __init__(self, app: App, app_qt_object: QApplication):
@@ -41,12 +48,16 @@ class MainForm(QMainWindow):
         self.app_qt_object = app_qt_object
         self.actions: Dict[str, Action] = {}
         self.threads: List[ThreadWithWorker] = []
+        self.jobs = job_queue()
+        self.quitting = False
+        self.file_indexes = FileIndexes(mf=self, index_dir=get_index_dir())
         self.group = GroupBox(parent=self, app_model=app)
         self.setCentralWidget(self.group)
         self.init_ui()
         self.menu = self.menuBar()
         init_menu(main_form=self)
         self.search_dlg = SearchDlg(mf=self)
+        self.quick_open_dlg = QuickOpenDlg(mf=self)
         self.app_qt_object.aboutToQuit.connect(self.on_quit)
 
     def remove_thread(self, thread_with_worker: ThreadWithWorker):
@@ -117,26 +128,45 @@ class MainForm(QMainWindow):
     def init_ui(self):
         self.setWindowTitle(self.app.name)
         self.setWindowIcon(QIcon("file_system.ico"))
+        self.jobs_dock = QDockWidget("Jobs", self)
+        self.jobs_dock.setObjectName("jobs")
+        self.jobs_dock.setWidget(JobsPanel(parent=self, queue=self.jobs))
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.jobs_dock)
+        self.jobs_dock.hide()
 
     def app_should_quit(self) -> bool:
-        message = """Some <b>background threads</b> are still running<br>
-                     Are you sure you want to <b>quit?</b>"""
-        if len(self.threads) > 0:
-            resp = QMessageBox.question(self, APP_NAME, message)
-            if resp == QMessageBox.No:
-                return False
-            for thread in [t for t in self.threads if isinstance(t.worker, SearchWorker)]:
-                thread.thread.requestInterruption()
-                thread.thread.quit()
-                if not thread.thread.wait():
-                    logger.debug("Search thread NOT terminated")
-                if [t for t in self.threads if not isinstance(t.worker, SearchWorker)]:
-                    QMessageBox.information(
-                        self, APP_NAME, "Shell operation in progress. " "Cancel it manually or wait to finish"
-                    )
-                    return False
+        if self.quitting:
+            # window is closed again when cancelled jobs stop
+            return not self.jobs.active_jobs()
+        jobs = self.jobs.active_jobs()
+        if not self.threads and not jobs:
+            return True
+        if jobs:
+            message = f"""<b>{len(jobs)} file operation(s)</b> running or queued<br>
+                          Cancel them and <b>quit?</b>"""
+        else:
+            message = """Some <b>background threads</b> are still running<br>
+                         Are you sure you want to <b>quit?</b>"""
+        resp = QMessageBox.question(self, APP_NAME, message)
+        if resp == QMessageBox.No:
+            return False
+        for thread in [t for t in self.threads if isinstance(t.worker, (SearchWorker, IndexWorker))]:
+            thread.thread.requestInterruption()
+            thread.thread.quit()
+            if not thread.thread.wait():
+                logger.debug("Search thread NOT terminated")
+        # queued jobs are dropped, running jobs stop at their next cancellation check
+        self.jobs.cancel_all()
+        if not self.jobs.active_jobs():
             return True
-        return True
+        self.quitting = True
+        self.jobs.finished.connect(self.on_quit_job_finished)
+        QTimer.singleShot(JOBS_PANEL_QUIT_DELAY, self.jobs_dock.show)
+        return False
+
+    def on_quit_job_finished(self):
+        if not self.jobs.active_jobs():
+            self.close()
 
     def closeEvent(self, event):
         if not self.app_should_quit():
@@ -7,9 +7,11 @@ from src.app.gui.action.command import (
     create_cut_items_to_clipboard_action,
     create_delete_items_action,
     create_rename_action,
+    create_bulk_rename_action,
     create_duplicate_action,
     create_view_action,
     create_go_to_action,
+    create_quick_open_action,
     create_go_to_repo_action,
     create_edit_action,
     create_properties_action,
@@ -22,6 +24,7 @@ from src.app.gui.action.file import (
     create_open_file_action,
     create_file_action,
     create_file_from_clipboard_text_action,
+    create_from_manifest_action,
 )
 from src.app.gui.action.folder import (
     FolderAction,
@@ -63,7 +66,7 @@ def init_menu(main_form):
     init_selection_menu(main_form)
     init_group_menu(main_form)
     init_tab_menu(main_form)
-    # init_view_menu(main_form)
+    init_view_menu(main_form)
 
 
 def init_file_menu(main_form):
@@ -83,6 +86,11 @@ def init_file_menu(main_form):
         parent_func=main_form.current_tree, path_func=main_form.path_func
     )
     file_menu.addAction(main_form.actions[FileAction.CREATE_CLIP])
+    # Create from manifest
+    main_form.actions[FileAction.CREATE_MANIFEST] = create_from_manifest_action(
+        parent_func=main_form.current_tree, path_func=main_form.path_func
+    )
+    file_menu.addAction(main_form.actions[FileAction.CREATE_MANIFEST])
     # Open file in VS code
 
 
@@ -140,6 +148,11 @@ def init_command_menu(main_form):
         parent_func=main_form.current_tree, path_func=main_form.path_func, context_func=main_form.context_func
     )
     command_menu.addAction(main_form.actions[CommonAction.GO_TO])
+    # Quick open
+    main_form.actions[CommonAction.QUICK_OPEN] = create_quick_open_action(
+        parent_func=main_form.current_tree, path_func=main_form.path_func
+    )
+    command_menu.addAction(main_form.actions[CommonAction.QUICK_OPEN])
     # Go to repo
     main_form.actions[CommonAction.GO_TO_REPO] = create_go_to_repo_action(
         parent_func=main_form.current_tree, path_func=main_form.path_func
@@ -167,6 +180,11 @@ def init_command_menu(main_form):
         parent_func=main_form.current_tree, path_func=main_form.path_func
     )
     command_menu.addAction(main_form.actions[CommonAction.RENAME])
+    # Bulk rename
+    main_form.actions[CommonAction.BULK_RENAME] = create_bulk_rename_action(
+        parent_func=main_form.current_tree, path_func=main_form.path_func
+    )
+    command_menu.addAction(main_form.actions[CommonAction.BULK_RENAME])
     # View
     main_form.actions[CommonAction.VIEW] = create_view_action(
         parent_func=main_form.current_tree, path_func=main_form.path_func, line_func=main_form.line_func
@@ -266,9 +284,11 @@ def init_tab_menu(main_form):
     tab_menu.addAction(main_form.actions[TabAction.CLOSE])
 
 
-# def init_view_menu(main_form):
-#     view_menu = main_form.menu.addMenu("&View")
-# show favorite
-# show buttons
-# file filter
-# always on top
+def init_view_menu(main_form):
+    view_menu = main_form.menu.addMenu("&View")
+    # Jobs
+    view_menu.addAction(main_form.jobs_dock.toggleViewAction())
+    # show favorite
+    # show buttons
+    # file filter
+    # always on top
@@ -0,0 +1,604 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from enum import Enum, auto
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QDateTime,
+    QDir,
+    QFileInfo,
+    QFileSystemWatcher,
+    QLocale,
+    QMimeData,
+    QModelIndex,
+    QObject,
+    Qt,
+    QUrl,
+    Signal,
+)
+from PySide6.QtWidgets import QFileIconProvider, QFileSystemModel
+
+from src.app.utils.logger import get_console_logger
+from src.app.utils.path_util import convert_size
+from src.app.utils.scandir import ScanEntry, ScanOptions, scan_dir, is_system
+from src.app.utils.scheduler import io_scheduler
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+COLUMNS = ("Name", "Size", "Type", "Date Modified")
+COLUMN_COUNT = len(COLUMNS)
+DEFAULT_FILTERS = QDir.AllEntries | QDir.NoDotAndDotDot | QDir.AllDirs
+MAX_REMOVED_RANGES = 256
+# batch scattered into more places is appended and whole folder is sorted once
+MAX_INSERTED_RANGES = 16
+IS_DIR = 1
+HIDDEN = 2
+SYSTEM = 4
+FILE_PATH_ROLE = int(QFileSystemModel.FilePathRole)
+FILE_NAME_ROLE = int(QFileSystemModel.FileNameRole)
+DISPLAY_ROLE = int(Qt.DisplayRole)
+DECORATION_ROLE = int(Qt.DecorationRole)
+TEXT_ALIGNMENT_ROLE = int(Qt.TextAlignmentRole)
+
+
+class DirState(Enum):
+    NOT_LOADED = auto()
+    LOADING = auto()
+    LOADED = auto()
+
+
+def entry_key(entry: ScanEntry) -> str:
+    # folders first, then case insensitive name
+    return ("0" if entry.is_dir else "1") + entry.name.lower()
+
+
+def entry_flags(entry: ScanEntry) -> int:
+    return (IS_DIR if entry.is_dir else 0) | (HIDDEN if entry.hidden else 0) | (SYSTEM if entry.system else 0)
+
+
+class DirNode:
+    """Children of one directory kept in parallel arrays ordered by sort key.
+    Batches are inserted at their sorted positions, so proxy model shows rows in model order"""
+
+    __slots__ = (
+        "id",
+        "path",
+        "parent",
+        "row",
+        "names",
+        "keys",
+        "flags",
+        "sizes",
+        "mtimes",
+        "children",
+        "state",
+    )
+
+    def __init__(self, node_id: int, path: str, parent: Optional[DirNode], row: int):
+        self.id = node_id
+        self.path = path
+        self.parent = parent
+        self.row = row
+        self.names: List[str] = []
+        self.keys: List[str] = []
+        self.flags = bytearray()
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.children: Dict[int, DirNode] = {}
+        self.state = DirState.NOT_LOADED
+
+    def __len__(self):
+        return len(self.names)
+
+    def child_path(self, row: int) -> str:
+        name = self.names[row]
+        if self.parent is None:
+            return name
+        return f"{self.path}{name}" if self.path.endswith("/") else f"{self.path}/{name}"
+
+    def find(self, name: str) -> Optional[int]:
+        folded, name = name.lower(), os.path.normcase(name)
+        for key in ("0" + folded, "1" + folded):
+            row = bisect_left(self.keys, key)
+            while row < len(self.keys) and self.keys[row] == key:
+                if os.path.normcase(self.names[row]) == name:
+                    return row
+                row += 1
+        return None
+
+    def append(self, entry: ScanEntry):
+        self.insert(row=len(self.names), entries=[entry])
+
+    def insert(self, row: int, entries: List[ScanEntry]):
+        self.names[row:row] = [entry.name for entry in entries]
+        self.keys[row:row] = [entry_key(entry=entry) for entry in entries]
+        self.flags[row:row] = bytes(entry_flags(entry=entry) for entry in entries)
+        self.sizes[row:row] = array("q", (entry.size for entry in entries))
+        self.mtimes[row:row] = array("d", (entry.modified for entry in entries))
+        if any(child_row >= row for child_row in self.children):
+            self.move_children(new_rows=lambda child_row: child_row + len(entries) if child_row >= row else child_row)
+
+    def sort(self) -> List[int]:
+        """Sorts rows by key and returns new row of each old row"""
+        order = sorted(range(len(self.names)), key=self.keys.__getitem__)
+        self.names = [self.names[row] for row in order]
+        self.keys = [self.keys[row] for row in order]
+        self.flags = bytearray(self.flags[row] for row in order)
+        self.sizes = array("q", (self.sizes[row] for row in order))
+        self.mtimes = array("d", (self.mtimes[row] for row in order))
+        new_rows = [0] * len(order)
+        for new_row, old_row in enumerate(order):
+            new_rows[old_row] = new_row
+        self.move_children(new_rows=new_rows.__getitem__)
+        return new_rows
+
+    def move_children(self, new_rows: Callable[[int], int]):
+        self.children = {new_rows(child_row): child for child_row, child in self.children.items()}
+        for child_row, child in self.children.items():
+            child.row = child_row
+
+    def update(self, row: int, entry: ScanEntry) -> bool:
+        changed = self.sizes[row] != entry.size or self.mtimes[row] != entry.modified
+        self.sizes[row] = entry.size
+        self.mtimes[row] = entry.modified
+        return changed
+
+    def remove(self, first: int, last: int) -> List[DirNode]:
+        for values in (self.names, self.keys, self.flags, self.sizes, self.mtimes):
+            del values[first : last + 1]
+        count = last - first + 1
+        removed = [child for child_row, child in self.children.items() if first <= child_row <= last]
+        self.children = {
+            child_row: child for child_row, child in self.children.items() if not first <= child_row <= last
+        }
+        self.move_children(new_rows=lambda child_row: child_row - count if child_row > last else child_row)
+        return removed
+
+
+def row_ranges(rows: List[int]) -> List[Tuple[int, int]]:
+    ranges = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+    return ranges
+
+
+class ScanRequest(NamedTuple):
+    node_id: int
+    path: str
+    refresh: bool
+    options: ScanOptions
+
+
+class ScandirLoader(QObject):
+    """Lists requested directories one by one in background thread"""
+
+    batch = Signal(int, object)
+    refreshed = Signal(int, object)
+    finished = Signal(int, bool)
+
+    def __init__(self):
+        super().__init__()
+        self._requests: Deque[ScanRequest] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._io_lane = io_scheduler().lane(name="directory listing", limit=1)
+
+    def request(self, request: ScanRequest):
+        with self._condition:
+            self._requests.append(request)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="scandir loader", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._requests:
+                    self._condition.wait()
+                request = self._requests.popleft()
+            entries: List[ScanEntry] = []
+            emitted = 0
+            with self._io_lane.slot():
+                for batch in scan_dir(path=request.path, options=request.options):
+                    entries.extend(batch)
+                    # merging batch may reorder whole folder, so batches grow with it
+                    if not request.refresh and len(entries) >= emitted:
+                        self.batch.emit(request.node_id, entries)
+                        emitted += len(entries)
+                        entries = []
+            if request.refresh:
+                self.refreshed.emit(request.node_id, entries)
+            elif entries:
+                self.batch.emit(request.node_id, entries)
+            self.finished.emit(request.node_id, request.refresh)
+
+
+# pylint: disable=too-many-public-methods
+class ScandirModel(QAbstractItemModel):
+    """Light alternative of QFileSystemModel for huge directories.
+    Children are listed with os.scandir in background and inserted in batches"""
+
+    directoryLoaded = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filters = DEFAULT_FILTERS
+        self._name_filters: List[str] = []
+        self._next_id = 0
+        self._nodes: Dict[int, DirNode] = {}
+        self._dirs: Dict[str, DirNode] = {}
+        self._root = self.new_node(path="", parent=None, row=-1)
+        self.icon_provider = QFileIconProvider()
+        self.icons = {
+            IS_DIR: self.icon_provider.icon(QFileIconProvider.Folder),
+            0: self.icon_provider.icon(QFileIconProvider.File),
+        }
+        self.drive_icon = self.icon_provider.icon(QFileIconProvider.Drive)
+        self.locale = QLocale()
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.refresh)
+        self.loader = ScandirLoader()
+        self.loader.batch.connect(self.on_batch)
+        self.loader.refreshed.connect(self.on_refreshed)
+        self.loader.finished.connect(self.on_finished)
+        self.load_drives()
+
+    def new_node(self, path: str, parent: Optional[DirNode], row: int) -> DirNode:
+        node = DirNode(node_id=self._next_id, path=path, parent=parent, row=row)
+        self._next_id += 1
+        self._nodes[node.id] = node
+        if path:
+            self._dirs[os.path.normcase(path)] = node
+        return node
+
+    def drop_node(self, node: DirNode):
+        for child in node.children.values():
+            self.drop_node(node=child)
+        self._nodes.pop(node.id, None)
+        self._dirs.pop(os.path.normcase(node.path), None)
+        if node.state != DirState.NOT_LOADED:
+            self.watcher.removePath(node.path)
+
+    def load_drives(self):
+        drives = [
+            ScanEntry(name=drive.absoluteFilePath(), is_dir=True, hidden=False, system=False, size=0, modified=0)
+            for drive in QDir.drives()
+        ]
+        self._root.insert(row=0, entries=sorted(drives, key=entry_key))
+        self._root.state = DirState.LOADED
+
+    def scan_options(self) -> ScanOptions:
+        return ScanOptions(
+            files=bool(self._filters & QDir.Files),
+            hidden=bool(self._filters & QDir.Hidden),
+            system=bool(self._filters & QDir.System),
+            name_filters=tuple(self._name_filters),
+        )
+
+    # Tree structure
+
+    def node(self, index: QModelIndex) -> Optional[DirNode]:
+        if not index.isValid():
+            return self._root
+        parent = self._nodes.get(index.internalId())
+        if parent is None:
+            return None
+        row = index.row()
+        child = parent.children.get(row)
+        if child is not None or row >= len(parent.names):
+            return child
+        return self.child_node(parent=parent, row=row)
+
+    def child_node(self, parent: DirNode, row: int) -> Optional[DirNode]:
+        child = parent.children.get(row)
+        if child is None and parent.flags[row] & IS_DIR:
+            child = self.new_node(path=parent.child_path(row=row), parent=parent, row=row)
+            parent.children[row] = child
+        return child
+
+    def node_index(self, node: DirNode, column: int = 0) -> QModelIndex:
+        if node.parent is None:
+            return QModelIndex()
+        return self.createIndex(node.row, column, node.parent.id)
+
+    def entry(self, index: QModelIndex) -> Optional[DirNode]:
+        return self._nodes.get(index.internalId()) if index.isValid() else None
+
+    def index(self, row: int | str, column: int = 0, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if isinstance(row, str):
+            return self.path_index(path=row, column=column)
+        node = self.node(parent)
+        if node is None or not 0 <= row < len(node.names) or not 0 <= column < COLUMN_COUNT:
+            return QModelIndex()
+        return self.createIndex(row, column, node.id)
+
+    def parent(self, *args) -> QModelIndex:
+        if not args:
+            return super().parent()
+        node = self.entry(args[0])
+        if node is None:
+            return QModelIndex()
+        return self.node_index(node=node)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        node = self.node(parent)
+        return len(node) if node is not None else 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return COLUMN_COUNT
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return True
+        if parent.column() > 0:
+            return False
+        return self.isDir(parent)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self.node(parent) if parent.column() <= 0 else None
+        return node is not None and node.state == DirState.NOT_LOADED
+
+    def fetchMore(self, parent: QModelIndex):
+        if (node := self.node(parent)) is not None:
+            self.fetch(node=node)
+
+    def fetch(self, node: DirNode, refresh: bool = False):
+        if node.state == DirState.NOT_LOADED or refresh:
+            node.state = DirState.LOADING
+            self.loader.request(
+                ScanRequest(
+                    node_id=node.id,
+                    path=node.path,
+                    refresh=refresh,
+                    options=self.scan_options(),
+                )
+            )
+
+    def on_batch(self, node_id: int, entries: List[ScanEntry]):
+        if (node := self._nodes.get(node_id)) is not None:
+            self.insert_entries(node=node, entries=entries)
+
+    def insert_entries(self, node: DirNode, entries: List[ScanEntry]):
+        """Inserts new entries at their sorted positions. Entries of batch usually come in few runs,
+        e.g. NTFS lists folders in name order, otherwise batch is appended and folder is sorted once"""
+        entries = sorted((entry for entry in entries if node.find(name=entry.name) is None), key=entry_key)
+        ranges: List[Tuple[int, List[ScanEntry]]] = []
+        for entry in entries:
+            row = bisect_right(node.keys, entry_key(entry=entry))
+            if ranges and ranges[-1][0] == row:
+                ranges[-1][1].append(entry)
+            else:
+                ranges.append((row, [entry]))
+        parent = self.node_index(node=node)
+        if len(ranges) > MAX_INSERTED_RANGES:
+            self.beginInsertRows(parent, len(node), len(node) + len(entries) - 1)
+            node.insert(row=len(node), entries=entries)
+            self.endInsertRows()
+            self.sort_node(node=node)
+            return
+        # from the end so that rows of preceding ranges are not shifted
+        for row, inserted in reversed(ranges):
+            self.beginInsertRows(parent, row, row + len(inserted) - 1)
+            node.insert(row=row, entries=inserted)
+            self.endInsertRows()
+
+    def sort_node(self, node: DirNode):
+        self.layoutAboutToBeChanged.emit()
+        new_rows = node.sort()
+        old_indexes = [index for index in self.persistentIndexList() if index.internalId() == node.id]
+        self.changePersistentIndexList(
+            old_indexes, [self.createIndex(new_rows[index.row()], index.column(), node.id) for index in old_indexes]
+        )
+        self.layoutChanged.emit()
+
+    def on_refreshed(self, node_id: int, entries: List[ScanEntry]):
+        node = self._nodes.get(node_id)
+        if node is None:
+            return
+        current = {os.path.normcase(entry.name): entry for entry in entries}
+        parent = self.node_index(node=node)
+        removed_rows = [row for row, name in enumerate(node.names) if os.path.normcase(name) not in current]
+        ranges = row_ranges(rows=removed_rows)
+        if len(ranges) > MAX_REMOVED_RANGES:
+            ranges = [(0, len(node) - 1)]
+        for first, last in reversed(ranges):
+            self.beginRemoveRows(parent, first, last)
+            for removed in node.remove(first=first, last=last):
+                self.drop_node(node=removed)
+            self.endRemoveRows()
+        for row, name in enumerate(node.names):
+            if node.update(row=row, entry=current[os.path.normcase(name)]):
+                self.dataChanged.emit(self.index(row, 1, parent), self.index(row, COLUMN_COUNT - 1, parent))
+        self.on_batch(node_id=node_id, entries=entries)
+
+    def on_finished(self, node_id: int, refresh: bool):
+        node = self._nodes.get(node_id)
+        if node is None:
+            return
+        node.state = DirState.LOADED
+        if not refresh:
+            self.watcher.addPath(node.path)
+            logger.debug(f"{node.path} loaded with {len(node)} entries")
+            self.directoryLoaded.emit(node.path)
+
+    def refresh(self, path: str):
+        if (node := self._dirs.get(os.path.normcase(path))) is not None:
+            self.fetch(node=node, refresh=True)
+
+    def refresh_loaded(self):
+        for node in list(self._nodes.values()):
+            if node.parent is not None and node.state == DirState.LOADED:
+                self.fetch(node=node, refresh=True)
+
+    # QFileSystemModel compatible interface
+
+    def path_index(self, path: str, column: int = 0) -> QModelIndex:
+        if not path:
+            return QModelIndex()
+        path = QDir.fromNativeSeparators(path)
+        node = self._root
+        drives = [name for name in self._root.names if os.path.normcase(path).startswith(os.path.normcase(name))]
+        if not drives:
+            return QModelIndex()
+        drive = max(drives, key=len)
+        row = self._root.find(name=drive)
+        for part in [part for part in path[len(drive) :].split("/") if part]:
+            node = self.child_node(parent=node, row=row)
+            if node is None:
+                return QModelIndex()
+            row = self.find_row(node=node, name=part)
+            if row is None:
+                return QModelIndex()
+        return self.createIndex(row, column, node.id)
+
+    def find_row(self, node: DirNode, name: str) -> Optional[int]:
+        row = node.find(name=name)
+        return self.add_entry(node=node, name=name) if row is None else row
+
+    def add_entry(self, node: DirNode, name: str) -> Optional[int]:
+        path = f"{node.path}{name}" if node.path.endswith("/") else f"{node.path}/{name}"
+        try:
+            entry_stat = os.stat(path)
+        except OSError:
+            return None
+        is_dir = os.path.isdir(path)
+        entry = ScanEntry(
+            name=name,
+            is_dir=is_dir,
+            hidden=QFileInfo(path).isHidden(),
+            system=is_system(mode=entry_stat.st_mode),
+            size=0 if is_dir else entry_stat.st_size,
+            modified=entry_stat.st_mtime,
+        )
+        self.insert_entries(node=node, entries=[entry])
+        return node.find(name=name)
+
+    def setRootPath(self, path: str) -> QModelIndex:
+        index = self.path_index(path=path)
+        if index.isValid() and (node := self.node(index)) is not None:
+            self.fetch(node=node)
+        return index
+
+    def filter(self) -> QDir.Filters:
+        return self._filters
+
+    def setFilter(self, filters: QDir.Filters):
+        if filters != self._filters:
+            self._filters = filters
+            self.refresh_loaded()
+
+    def nameFilters(self) -> List[str]:
+        return self._name_filters
+
+    def setNameFilters(self, filters: Sequence[str]):
+        filters = [filters] if isinstance(filters, str) else list(filters)
+        if filters != self._name_filters:
+            self._name_filters = filters
+            self.refresh_loaded()
+
+    def setNameFilterDisables(self, enable: bool):
+        pass
+
+    def filePath(self, index: QModelIndex) -> str:
+        node = self.entry(index)
+        return node.child_path(row=index.row()) if node is not None else ""
+
+    def fileName(self, index: QModelIndex) -> str:
+        node = self.entry(index)
+        return node.names[index.row()] if node is not None else ""
+
+    def fileInfo(self, index: QModelIndex) -> QFileInfo:
+        return QFileInfo(self.filePath(index))
+
+    def isDir(self, index: QModelIndex) -> bool:
+        node = self.entry(index)
+        return node is not None and bool(node.flags[index.row()] & IS_DIR)
+
+    def is_hidden(self, index: QModelIndex) -> bool:
+        node = self.entry(index)
+        return node is not None and bool(node.flags[index.row()] & HIDDEN)
+
+    def is_system(self, index: QModelIndex) -> bool:
+        node = self.entry(index)
+        return node is not None and bool(node.flags[index.row()] & SYSTEM)
+
+    def sort_key(self, index: QModelIndex) -> str:
+        node = self.entry(index)
+        return node.keys[index.row()] if node is not None else ""
+
+    def size(self, index: QModelIndex) -> int:
+        node = self.entry(index)
+        return node.sizes[index.row()] if node is not None else 0
+
+    def lastModified(self, index: QModelIndex) -> QDateTime:
+        node = self.entry(index)
+        return QDateTime.fromMSecsSinceEpoch(int(node.mtimes[index.row()] * 1000) if node is not None else 0)
+
+    def type(self, index: QModelIndex) -> str:
+        if self.isDir(index):
+            return "Folder"
+        suffix = QFileInfo(self.fileName(index)).suffix()
+        return f"{suffix.upper()} File" if suffix else "File"
+
+    # Item data
+
+    def data(self, index: QModelIndex, role: int = DISPLAY_ROLE) -> Any:
+        node = self.entry(index)
+        if node is None:
+            return None
+        column = index.column()
+        if role == DISPLAY_ROLE:
+            if column == 0:
+                return node.names[index.row()]
+            if column == 1:
+                return "" if self.isDir(index) else convert_size(self.size(index))
+            if column == 2:
+                return self.type(index)
+            return self.locale.toString(self.lastModified(index), QLocale.ShortFormat)
+        if role == DECORATION_ROLE and column == 0:
+            return self.drive_icon if node is self._root else self.icons[node.flags[index.row()] & IS_DIR]
+        if role == TEXT_ALIGNMENT_ROLE and column == 1:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == FILE_PATH_ROLE:
+            return self.filePath(index)
+        if role == FILE_NAME_ROLE:
+            return self.fileName(index)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = DISPLAY_ROLE) -> Any:
+        if orientation == Qt.Horizontal and role == DISPLAY_ROLE and 0 <= section < COLUMN_COUNT:
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+        if self.isDir(index):
+            flags |= Qt.ItemIsDropEnabled
+        return flags
+
+    def mimeTypes(self) -> List[str]:
+        return ["text/uri-list"]
+
+    def mimeData(self, indexes: List[QModelIndex]) -> QMimeData:
+        mime_data = QMimeData()
+        paths = dict.fromkeys(self.filePath(index) for index in indexes)
+        mime_data.setUrls([QUrl.fromLocalFile(path) for path in paths])
+        return mime_data
+
+    def supportedDragActions(self) -> Qt.DropActions:
+        return Qt.CopyAction | Qt.MoveAction
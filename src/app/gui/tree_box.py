@@ -1,10 +1,11 @@
 import logging
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Union
 
 from PySide6.QtCore import Qt, QDir
-from PySide6.QtWidgets import QMenu, QMessageBox, QFileDialog
+from PySide6.QtWidgets import QMenu, QMessageBox, QFileDialog, QWidget
 
-from src.app.gui.action.tab import create_close_tab_action, create_close_all_tabs_action
+from src.app.gui.action.tab import create_close_tab_action, create_close_all_tabs_action, create_scandir_model_action
+from src.app.gui.filter import FilterView
 from src.app.gui.tree_view import TreeView
 from src.app.gui.widget import TabWidget
 from src.app.utils.path_util import path_caption
@@ -15,15 +16,37 @@ from src.app.utils.logger import get_console_logger
 logger = get_console_logger(name=__name__, log_level=logging.ERROR)
 
 
+class TreePlaceholder(QWidget):
+    """Stands for tree view of saved page until its tab is activated"""
+
+    def __init__(self, parent, tree_model: Tree, last_selected_path: str = None):
+        super().__init__(parent)
+        self.tree_model = tree_model
+        self.last_selected_path = last_selected_path
+
+    @property
+    def pinned_path(self) -> Optional[str]:
+        return self.tree_model.pinned_path
+
+    def store_layout(self):
+        # page which was never shown has layout of its tree model
+        pass
+
+
+TreePage = Union[TreeView, TreePlaceholder]
+
+
 class TreeBox(TabWidget):
     def __init__(self, parent, group: Group):
         super().__init__(parent=parent)
         self.group_panel = self.parent().parent()
-        self.group_box = self.group_panel.parent()
+        self.group_box = self.group_panel.group_box
         self.main_form = self.group_box.main_form
         self.group = group
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.open_menu)
+        self.filter_view = FilterView(parent=self)
+        self.setCornerWidget(self.filter_view, Qt.TopRightCorner)
         self.currentChanged.connect(self.on_current_changed)
         self.open_pages()
 
@@ -33,6 +56,8 @@ class TreeBox(TabWidget):
         if index >= 0:
             menu.addAction(create_close_tab_action(parent_func=lambda: self, index_func=lambda: index))
             menu.addAction(create_close_all_tabs_action(parent_func=lambda: self))
+            menu.addSeparator()
+            menu.addAction(create_scandir_model_action(parent_func=lambda: self, index_func=lambda: index))
         menu.exec_(self.mapToGlobal(position))
 
     # pylint: disable=unnecessary-comprehension
@@ -40,11 +65,15 @@ class TreeBox(TabWidget):
         if not self.group.pages:
             self.open_root_page(find_existing=True)
             return
+        # only current page gets tree view, others are placeholders until activated
+        blocked = self.blockSignals(True)
         for page in self.group.pages:
             logger.info(f"Opening page {str(page.pinned_path)} last path {self.group.last_page_pinned_path}")
-            self.open_tree_page(pinned_path=page.pinned_path, create=False, find_existing=False)
+            self.open_tree_page(pinned_path=page.pinned_path, create=False, find_existing=False, lazy=True)
         if pinned_path := self.group.last_page_pinned_path:
             self.go_to_page(pinned_path=pinned_path)
+        self.blockSignals(blocked)
+        self.on_current_changed(index=self.currentIndex())
 
     def open_tree_page(
         self,
@@ -53,6 +82,7 @@ class TreeBox(TabWidget):
         find_existing: bool = False,
         go_to_page: bool = False,
         selection: List[str] = None,
+        lazy: bool = False,
     ):
         selected_path = selection[0] if selection and len(selection) == 1 else None
         if find_existing:
@@ -72,6 +102,7 @@ class TreeBox(TabWidget):
             tree_model=tree_model,
             go_to_page=go_to_page,
             last_selected_path=tree_model.last_selected_path or selected_path,
+            lazy=lazy,
         )
 
     def open_root_page(self, find_existing: bool = True):
@@ -82,17 +113,63 @@ class TreeBox(TabWidget):
         if path:
             self.open_tree_page(pinned_path=path, find_existing=True, go_to_page=True)
 
-    def add_page(self, tree_model: Tree, go_to_page: bool = False, last_selected_path: List[str] = None):
-        page = TreeView(parent=self, tree_model=tree_model, last_selected_path=last_selected_path)
+    def add_page(
+        self, tree_model: Tree, go_to_page: bool = False, last_selected_path: List[str] = None, lazy: bool = False
+    ):
+        page_class = TreePlaceholder if lazy else TreeView
+        page = page_class(parent=self, tree_model=tree_model, last_selected_path=last_selected_path)
         dir_name = path_caption(path=tree_model.pinned_path) if tree_model.pinned_path else "/"
         self.addTab(page, dir_name)
         if go_to_page:
             self.go_to_page(pinned_path=tree_model.pinned_path)
 
-    def pages(self) -> List[TreeView]:
+    def materialize(self, index: int) -> TreeView:
+        placeholder = self.widget(index)
+        if not isinstance(placeholder, TreePlaceholder):
+            return placeholder
+        logger.debug(f"creating tree view of page {placeholder.pinned_path}")
+        page = TreeView(
+            parent=self, tree_model=placeholder.tree_model, last_selected_path=placeholder.last_selected_path
+        )
+        is_current = self.currentIndex() == index
+        blocked = self.blockSignals(True)
+        text = self.tabText(index)
+        self.removeTab(index)
+        self.insertTab(index, page, text)
+        if is_current:
+            self.setCurrentIndex(index)
+        self.blockSignals(blocked)
+        placeholder.deleteLater()
+        return page
+
+    def set_scandir_model(self, index: int, enabled: bool):
+        """Tree view of page is created again with other kind of model when page is shown"""
+        page = self.widget(index)
+        if page.tree_model.scandir_model == enabled:
+            return
+        page.store_layout()
+        page.tree_model.scandir_model = enabled
+        if isinstance(page, TreePlaceholder):
+            return
+        placeholder = TreePlaceholder(
+            parent=self, tree_model=page.tree_model, last_selected_path=page.tree_model.last_selected_path
+        )
+        is_current = self.currentIndex() == index
+        blocked = self.blockSignals(True)
+        text = self.tabText(index)
+        self.removeTab(index)
+        self.insertTab(index, placeholder, text)
+        if is_current:
+            self.setCurrentIndex(index)
+        self.blockSignals(blocked)
+        page.deleteLater()
+        if is_current:
+            self.on_current_changed(index=index)
+
+    def pages(self) -> List[TreePage]:
         return [self.widget(i) for i in range(self.count())]
 
-    def page(self, path: str) -> Optional[TreeView]:
+    def page(self, path: str) -> Optional[TreePage]:
         # logger.debug(f"search page {[page for page in self.pages() if page.pinned_path == path]}")
         pages = [page for page in self.pages() if page.pinned_path == path]
         if len(pages) == 0:
@@ -111,7 +188,7 @@ class TreeBox(TabWidget):
         if index < 0:
             return None
         logger.debug(f"current index {index} pinned path {self.widget(index).pinned_path}")
-        return self.widget(index)
+        return self.materialize(index=index)
 
     def close_page(self, index_func: Callable):
         index = index_func()
@@ -131,15 +208,16 @@ class TreeBox(TabWidget):
                 self.close_page(index_func=lambda x=index: x)
 
     def tabRemoved(self, index):
-        if current_tree := self.current_tree():
+        if isinstance(current_tree := self.currentWidget(), TreeView):
             current_tree.setFocus()
             logger.debug(
-                f"Deleted widget with index {index} " f"focus set to {path_caption(self.current_tree().current_path)}"
+                f"Deleted widget with index {index} " f"focus set to {path_caption(current_tree.current_path)}"
             )
 
     def on_current_changed(self, index: int):
         if current_tree := self.current_tree():
             current_tree.set_selection()
+            self.filter_view.apply_filter()
 
     def store_pages_layout(self):
         for page in self.pages():
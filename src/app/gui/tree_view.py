@@ -1,31 +1,51 @@
-import os
 import logging
+import os
 from enum import Enum
 from typing import List, Optional, Callable, Set, Any
 
-from PySide6.QtCore import QDir, QFileInfo, QModelIndex, QSortFilterProxyModel, QItemSelectionModel, Qt
-from PySide6.QtGui import QPainter, QPalette, QDropEvent, QDragMoveEvent, QDragEnterEvent
+from PySide6.QtCore import (
+    QDir,
+    QFileInfo,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSortFilterProxyModel,
+    QItemSelectionModel,
+    Qt,
+)
+from PySide6.QtGui import QPainter, QPalette, QDropEvent, QDragMoveEvent, QDragEnterEvent, QCursor
 from PySide6.QtWidgets import (
     QTreeView,
-    QFileSystemModel,
     QMenu,
     QAbstractItemView,
     QFileDialog,
     QApplication,
     QStyleOptionViewItem,
+    QToolTip,
 )
 
 from src.app.gui.action.command import CommonAction
 from src.app.gui.action.file import FileAction
 from src.app.gui.action.folder import FolderAction
 from src.app.gui.action.selection import SelectionAction
+from src.app.gui.scandir_model import ScandirModel
+from src.app.gui.file_system_model import (
+    EntryCache,
+    FileSystemModel,
+    SHARED_MODEL_FILTERS,
+    load_path,
+    shared_models,
+)
 from src.app.utils import path_util
-from src.app.utils.path_util import path_caption, convert_size, file_first_lines, dir_list
+from src.app.utils.folder_size import folder_size_scanner, FOLDER_SIZE_PLACEHOLDER
+from src.app.utils.name_matcher import NameMatcher
+from src.app.utils.path_trie import PathTrie
+from src.app.utils.path_util import path_caption, convert_size, items_caption, file_operations
 from src.app.model.schema import Tree
 from src.app.utils.constant import APP_NAME
 from src.app.utils.logger import get_console_logger
-from src.app.utils.shell import start_file, open_folder, copy, move
-from src.app.utils.thread import run_in_thread
+from src.app.utils.preview import preview_loader, PreviewKey, PREVIEW_PLACEHOLDER
+from src.app.utils.shell import start_file, open_folder
+from src.app.utils.jobs import run_job
 
 logger = get_console_logger(name=__name__, log_level=logging.ERROR)
 
@@ -43,16 +63,22 @@ class TreeView(QTreeView):
         self.last_selected_path = last_selected_path
         self.tree_box = parent
         self.main_form = self.tree_box.main_form
-        self.sys_model = QFileSystemModel()
+        self.sys_model = shared_models().acquire(scandir=tree_model.scandir_model)
+        sys_model = self.sys_model
+        self.destroyed.connect(lambda: shared_models().release(model=sys_model))
         self.proxy = SortFilterModel(self)
         self.proxy.setSourceModel(self.sys_model)
         self.proxy.setDynamicSortFilter(True)
-        self.setModel(self.proxy)
+        self.pin_proxy = PinFilterModel(self)
+        self.pin_proxy.setSourceModel(self.proxy)
+        self.setModel(self.pin_proxy)
         self.setSortingEnabled(True)
         self.header().setSortIndicator(0, Qt.AscendingOrder)
-        self.loaded_paths: Set[str] = set()
+        self.loaded_paths: Set[str] = self.proxy.entry_cache.loaded_paths
         self.tree_model = tree_model
-        self.filtered_indexes = []
+        self.pending_expanded = PathTrie()
+        # pinned folder requested by this view which is not loaded yet
+        self.pending_pin: Optional[str] = None
         self.init_ui()
 
     def set_last_selected_path(self, path: str):
@@ -70,11 +96,10 @@ class TreeView(QTreeView):
         for column in TreeColumn:
             self.hide_column(column=column.value, hide=column.value not in self.tree_model.visible_columns)
         self.sys_model.directoryLoaded.connect(self.on_dir_loaded)
-        self.sys_model.setRootPath(None)
+        self.filter = self.get_filter()
         self.pinned_path = self.tree_model.pinned_path
         if self.tree_model.current_path:
             self.current_path = self.tree_model.current_path
-        self.filter = self.get_filter()
         self.setAcceptDrops(True)
         self.setDragEnabled(True)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
@@ -93,17 +118,20 @@ class TreeView(QTreeView):
 
     def drawRow(self, painter: QPainter, options: QStyleOptionViewItem, index: QModelIndex) -> None:
         new_options = QStyleOptionViewItem(options)
-        sys_index = self.sys_index(proxy_index=index)
-        file_path = self.sys_model.filePath(sys_index)
-        info = QFileInfo(file_path)
-        if info.isHidden():
+        if index.data(HIDDEN_ROLE):
             new_options.palette.setColor(QPalette.Text, Qt.darkGray)
         super().drawRow(painter, new_options, index)
 
+    def map_from_sys(self, sys_index: QModelIndex) -> QModelIndex:
+        return self.pin_proxy.mapFromSource(self.proxy.mapFromSource(sys_index))
+
+    def map_to_sys(self, index: QModelIndex) -> QModelIndex:
+        return self.proxy.mapToSource(self.pin_proxy.mapToSource(index))
+
     def proxy_index(self, sys_index: QModelIndex) -> QModelIndex:
         if not sys_index.isValid():
             raise ValueError(f"Sys index is not valid {sys_index}")
-        index = self.proxy.mapFromSource(sys_index)
+        index = self.map_from_sys(sys_index=sys_index)
         if not index.isValid():
             raise ValueError(f"Mapped index is not valid {index}")
         return index
@@ -111,7 +139,7 @@ class TreeView(QTreeView):
     def sys_index(self, proxy_index: QModelIndex) -> QModelIndex:
         if not proxy_index.isValid():
             raise ValueError(f"Proxy index is not valid {proxy_index}")
-        index = self.proxy.mapToSource(proxy_index)
+        index = self.map_to_sys(index=proxy_index)
         if not index.isValid():
             raise ValueError(f"Mapped index is not valid {index}")
         return index
@@ -119,8 +147,13 @@ class TreeView(QTreeView):
     def on_dir_loaded(self, path: str):
         logger.debug(f"Path {path} loaded")
         self.loaded_paths.add(path)
-        if path == self.tree_model.pinned_path:
-            self.pinned_path = path
+        if path == self.pending_pin:
+            self.pending_pin = None
+            self._pin(path=path, pin=True)
+        if self.pending_expanded:
+            self.setUpdatesEnabled(False)
+            self.expand_pending(path=path)
+            self.setUpdatesEnabled(True)
 
     def path_from_tree_index(self, proxy_index: QModelIndex):
         return self.sys_model.fileInfo(self.sys_index(proxy_index=proxy_index)).absoluteFilePath()
@@ -178,12 +211,13 @@ class TreeView(QTreeView):
     def pinned_path(self, path: str):
         parent_path = path_util.parent_path(path=path)
         if parent_path not in self.loaded_paths:
-            self.sys_model.setRootPath(parent_path)
+            load_path(model=self.sys_model, path=parent_path)
         if path not in self.loaded_paths:
-            self.sys_model.setRootPath(path)
+            load_path(model=self.sys_model, path=path)
         self.tree_model.pinned_path = path
         self.tree_box.setTabText(self.tree_box.indexOf(self), path_caption(path=path))
-        self._pin(path=path, pin=path is not None)
+        pinned = self._pin(path=path, pin=path is not None)
+        self.pending_pin = None if pinned else path
 
     def select_folder(self):
         path = QFileDialog.getExistingDirectory(self, APP_NAME, self.current_path)
@@ -196,41 +230,17 @@ class TreeView(QTreeView):
             self.pinned_path = path if pin else None
 
     def _pin(self, path: str, pin: bool) -> bool:
-        def show_children(path: QModelIndex):
-            ind = self.proxy_index(sys_index=self.sys_model.index(path))
-            # sys_ind = self.sys_index(proxy_index=ind)
-            # sys_path = self.sys_model.filePath(sys_ind)
-            logger.debug(f"showing children under {path}")
-            logger.debug(f"rows to show {range(self.proxy.rowCount(ind))}")
-            for row in range(self.proxy.rowCount(ind)):
-                row_index = self.proxy.index(row, 0, ind)
-                sys_index = self.sys_index(proxy_index=row_index)
-                file_path = self.sys_model.filePath(sys_index)
-                logger.debug(f"show child {file_path}")
-                self.setRowHidden(row, ind, False)
-
         if pin:
             if path in self.loaded_paths:
                 parent_path = path_util.parent_path(path)
                 logger.debug(f"pinned parent path {parent_path} path {path}")
                 if path != parent_path:
+                    # siblings of pinned folder are filtered out by proxy
+                    self.pin_proxy.set_pinned_path(path=path, parent_path=parent_path)
                     parent_index = self.proxy_index(sys_index=self.sys_model.index(parent_path))
                     logger.debug(f"parent index {parent_index}")
                     self.setRootIndex(parent_index)
-                    self.filtered_indexes.append(parent_path)
-                    logger.debug(
-                        f"children of {self.sys_model.filePath(self.sys_index(proxy_index=parent_index))} "
-                        f"valid {parent_index.isValid()} "
-                        f"{list(range(self.proxy.rowCount(parent_index)))}"
-                    )
-                    for row in range(self.proxy.rowCount(parent_index)):
-                        row_index = self.proxy.index(row, 0, parent_index)
-                        sys_index = self.sys_index(proxy_index=row_index)
-                        file_path = self.sys_model.filePath(sys_index)
-                        self.setRowHidden(row, parent_index, file_path != path)
-                        if file_path == path:
-                            self.expand(row_index)
-                        logger.debug(f"hiding row {file_path}")
+                    self.expand(self.proxy_index(sys_index=self.sys_model.index(path)))
                     self.restore_layout()
                     self.set_selection(selection=[self.last_selected_path] if self.last_selected_path else [path])
                     logger.debug(f"should be selected {[path]}")
@@ -238,19 +248,17 @@ class TreeView(QTreeView):
                 logger.debug(f"path {path} NOT LOADED YET")
                 return False
         else:
+            self.pin_proxy.set_pinned_path(path=None)
             self.setRootIndex(QModelIndex())
-            for index in self.filtered_indexes:
-                show_children(path=index)
-            self.filtered_indexes.clear()
         return True
 
     @property
     def filter(self) -> QDir.Filters:
-        return self.sys_model.filter()
+        return self.proxy.filters
 
     @filter.setter
     def filter(self, filters: QDir.Filters):
-        self.sys_model.setFilter(filters)
+        self.proxy.set_filters(filters=filters)
 
     def get_filter(self) -> QDir.Filters:
         files, hidden, system = self.tree_model.show_files, self.tree_model.show_hidden, self.tree_model.show_system
@@ -271,12 +279,11 @@ class TreeView(QTreeView):
 
     def get_selected_paths(self) -> List[str]:
         return [
-            self.sys_model.fileInfo(self.proxy.mapToSource(index)).absoluteFilePath()
-            for index in self.selectedIndexes()
+            self.sys_model.fileInfo(self.map_to_sys(index=index)).absoluteFilePath() for index in self.selectedIndexes()
         ]
 
     def on_clicked(self, index):
-        path = self.sys_model.fileInfo(self.proxy.mapToSource(index)).absoluteFilePath()
+        path = self.sys_model.fileInfo(self.map_to_sys(index=index)).absoluteFilePath()
         logger.debug(f"Tree selected path {path}")
 
     def open_menu(self, position):
@@ -287,6 +294,7 @@ class TreeView(QTreeView):
                 if path_util.is_single(paths=paths):
                     menu.addAction(self.main_form.actions[FolderAction.CREATE])
                     menu.addAction(self.main_form.actions[FileAction.CREATE])
+                    menu.addAction(self.main_form.actions[FileAction.CREATE_MANIFEST])
                     menu.addSeparator()
                     menu.addAction(self.main_form.actions[FolderAction.PIN])
                     menu.addAction(self.main_form.actions[FolderAction.UNPIN])
@@ -301,6 +309,7 @@ class TreeView(QTreeView):
                 menu.addAction(self.main_form.actions[FileAction.OPEN])
             menu.addSeparator()
             menu.addAction(self.main_form.actions[CommonAction.RENAME])
+            menu.addAction(self.main_form.actions[CommonAction.BULK_RENAME])
             menu.addAction(self.main_form.actions[CommonAction.DUPLICATE])
             menu.addAction(self.main_form.actions[CommonAction.DELETE])
             selection_menu = QMenu("Copy selected")
@@ -319,7 +328,7 @@ class TreeView(QTreeView):
 
     def dragMoveEvent(self, event: QDragMoveEvent):
         index = self.indexAt(event.pos())
-        path = self.sys_model.fileInfo(self.proxy.mapToSource(index)).absoluteFilePath()
+        path = self.sys_model.fileInfo(self.map_to_sys(index=index)).absoluteFilePath()
         logger.debug(f"Drop action {event.dropAction()} {path}")
         if event.mimeData().hasUrls:
             event.accept()
@@ -328,22 +337,19 @@ class TreeView(QTreeView):
 
     def dropEvent(self, event: QDropEvent):
         modifiers = event.keyboardModifiers()
-        func = copy if modifiers == Qt.ShiftModifier else move
+        operations = file_operations(parent=self.main_form)
+        func = operations.copy if modifiers == Qt.ShiftModifier else operations.move
         files = [u.toLocalFile() for u in event.mimeData().urls()]
         index = self.indexAt(event.pos())
-        path = self.sys_model.fileInfo(self.proxy.mapToSource(index)).absoluteFilePath()
+        path = self.sys_model.fileInfo(self.map_to_sys(index=index)).absoluteFilePath()
         logger.debug(f"dropped files {files} action {func}")
         if files and path:
-            run_in_thread(
-                parent=self.main_form,
-                target=func,
-                args=[files, path, False],
-                threads=self.main_form.threads,
-            )
+            action = "Copy" if modifiers == Qt.ShiftModifier else "Move"
+            run_job(target=func, args=[files, path, False], caption=f"{action} {items_caption(files)} to {path}")
             logger.debug(f"action executed {func} files {files}")
 
     def on_activated(self, index: QModelIndex):
-        item_path = self.sys_model.fileInfo(self.proxy.mapToSource(index)).absoluteFilePath()
+        item_path = self.sys_model.fileInfo(self.map_to_sys(index=index)).absoluteFilePath()
         logger.debug(f"activated item path {item_path}")
         path = QFileInfo(item_path)
         if path.isFile():
@@ -356,53 +362,227 @@ class TreeView(QTreeView):
                 # open_folder(dir_name=item_path)
             else:
                 ind = self.proxy_index(sys_index=self.sys_model.index(item_path))
-                logger.debug(f"activated proxy index valid {ind.isValid()} children {self.proxy.rowCount(ind)}")
+                logger.debug(f"activated proxy index valid {ind.isValid()} children {self.pin_proxy.rowCount(ind)}")
 
     def store_layout(self):
         expanded = []
-        for index in self.proxy.persistentIndexList():
-            if self.isExpanded(index):
-                expanded.append(str(index.data(Qt.DisplayRole)))
+        for index in self.pin_proxy.persistentIndexList():
+            if index.column() == 0 and self.isExpanded(index):
+                expanded.append(self.sys_model.filePath(self.map_to_sys(index=index)))
         self.tree_model.expanded_items = expanded
         self.tree_model.last_selected_path = self.current_path
 
     def restore_layout(self):
         self.setUpdatesEnabled(False)
         logger.debug(f"expanding {self.tree_model.expanded_items} for {self.pinned_path} {self.tree_model.pinned_path}")
-        self.expand_items(expanded_items=self.tree_model.expanded_items, start_index=self.rootIndex())
+        # layouts stored by older versions contain names instead of paths
+        names = [item for item in self.tree_model.expanded_items if "/" not in item and "\\" not in item]
+        if names:
+            self.expand_items(expanded_items=names, start_index=self.rootIndex())
+        self.pending_expanded = PathTrie()
+        self.expand_paths(paths=[item for item in self.tree_model.expanded_items if item not in names])
         self.setUpdatesEnabled(True)
 
+    def expand_paths(self, paths: List[str]):
+        for path in paths:
+            self.pending_expanded.add(path=path)
+        # items under loaded directories are expanded now, others when their directory is loaded
+        for path in list(self.pending_expanded.paths()):
+            parent_path = path_util.parent_path(path=path)
+            if parent_path in self.loaded_paths:
+                self.expand_pending(path=parent_path)
+
+    def expand_pending(self, path: str):
+        for child_path in self.pending_expanded.pop_children(path=path):
+            sys_index = self.sys_model.index(child_path)
+            if not sys_index.isValid():
+                continue
+            index = self.map_from_sys(sys_index=sys_index)
+            if not index.isValid():
+                continue
+            self.expand(index)
+            if child_path in self.loaded_paths:
+                self.expand_pending(path=child_path)
+
     def expand_items(self, expanded_items: List[str], start_index: QModelIndex):
         for expanded in expanded_items:
-            matches = self.proxy.match(start_index, Qt.DisplayRole, expanded)
+            matches = self.pin_proxy.match(start_index, Qt.DisplayRole, expanded)
             for index in matches:
                 logger.debug(f"expanding index {start_index.data(Qt.DisplayRole)}")
                 self.expand(index)
-                self.expand_items(expanded_items, self.proxy.index(0, 0, index))
+                self.expand_items(expanded_items, self.pin_proxy.index(0, 0, index))
+
+
+# plain ints, comparing role with Qt enum members in data() is slow
+DISPLAY_ROLE = int(Qt.DisplayRole)
+TOOL_TIP_ROLE = int(Qt.ToolTipRole)
+HIDDEN_ROLE = int(Qt.UserRole) + 1
+SIZE_COLUMN = int(TreeColumn.SIZE)
 
 
 class SortFilterModel(QSortFilterProxyModel):
-    def lessThan(self, left, right):
-        left_path = self.sourceModel().filePath(left)
-        right_path = self.sourceModel().filePath(right)
-        return (not os.path.isdir(left_path), left_path.lower()) < (not os.path.isdir(right_path), right_path.lower())
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.view = parent
+        self.entry_cache: Optional[EntryCache] = None
+        self.filters = SHARED_MODEL_FILTERS
+        self.show_files = self.show_hidden = self.show_system = True
+        self.name_matcher = NameMatcher(text="")
+        self.deep_root: Optional[str] = None
+        self.deep_dirs: Optional[Set[str]] = None
+        self.preview_loader = preview_loader()
+        self.preview_loader.ready.connect(self.on_preview_ready)
+        self.folder_sizes = folder_size_scanner()
+        self.folder_sizes.ready.connect(self.on_folder_size_ready)
+        self.folder_sizes.invalidated.connect(self.on_folder_size_invalidated)
+
+    def setSourceModel(self, source_model: FileSystemModel):
+        super().setSourceModel(source_model)
+        self.entry_cache = shared_models().entry_cache(model=source_model)
+        source_model.rowsInserted.connect(self.on_rows_changed)
+        source_model.rowsRemoved.connect(self.on_rows_changed)
+
+    def set_filters(self, filters: QDir.Filters):
+        self.filters = filters
+        self.show_files = bool(filters & QDir.Files)
+        self.show_hidden = bool(filters & QDir.Hidden)
+        self.show_system = bool(filters & QDir.System)
+        self.invalidateFilter()
+
+    def set_name_filter(self, matcher: NameMatcher, deep_root: str = None, deep_dirs: Set[str] = None):
+        """With deep_dirs only folders under deep_root which contain matching files are shown"""
+        self.name_matcher = matcher
+        if deep_root and deep_dirs is not None:
+            self.deep_root = os.path.normcase(deep_root.rstrip("/\\") + "/")
+            self.deep_dirs = {os.path.normcase(path) for path in deep_dirs}
+        else:
+            self.deep_root = self.deep_dirs = None
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self.show_files and self.show_hidden and self.show_system and not self.name_matcher:
+            return True
+        model = self.sourceModel()
+        index = model.index(source_row, 0, source_parent)
+        is_dir = model.isDir(index)
+        if not self.show_files and not is_dir:
+            return False
+        if not self.show_system and self.entry_cache.is_system(index=index):
+            return False
+        if not self.show_hidden and self.entry_cache.is_hidden(index=index):
+            # hidden folders on the way to pinned folder stay visible
+            pinned_path = self.view.pinned_path
+            return bool(pinned_path) and path_util.is_sub_path(path=pinned_path, root=model.filePath(index))
+        if not self.name_matcher:
+            return True
+        if not is_dir:
+            return self.name_matcher.matches(name=model.fileName(index))
+        if self.deep_dirs is not None:
+            path = os.path.normcase(model.filePath(index))
+            if path.startswith(self.deep_root):
+                return path in self.deep_dirs
+        return True
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        if isinstance(self.sourceModel(), ScandirModel) and order == Qt.AscendingOrder:
+            # scandir model keeps its rows sorted, proxy keeps source order instead of comparing rows in Python
+            column = -1
+        super().sort(column, order)
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        return self.entry_cache.sort_key(index=left) < self.entry_cache.sort_key(index=right)
+
+    def preview(self, sys_index: QModelIndex) -> str:
+        model = self.sourceModel()
+        key = PreviewKey(
+            path=model.filePath(sys_index),
+            last_modified=model.lastModified(sys_index).toMSecsSinceEpoch(),
+            is_dir=model.isDir(sys_index),
+        )
+        text = self.preview_loader.preview(key=key)
+        return PREVIEW_PLACEHOLDER if text is None else text
+
+    def on_preview_ready(self, path: str):
+        if not QToolTip.isVisible():
+            return
+        index = self.view.indexAt(self.view.viewport().mapFromGlobal(QCursor.pos()))
+        if index.isValid() and self.sourceModel().filePath(self.view.map_to_sys(index=index)) == path:
+            QToolTip.showText(QCursor.pos(), index.data(Qt.ToolTipRole), self.view)
+
+    def folder_size(self, sys_index: QModelIndex) -> Optional[str]:
+        model = self.sourceModel()
+        # drives are not summed up
+        if not model.isDir(sys_index) or not sys_index.parent().isValid():
+            return None
+        size = self.folder_sizes.size(path=model.filePath(sys_index))
+        return FOLDER_SIZE_PLACEHOLDER if size is None else convert_size(size)
+
+    def size_index(self, sys_index: QModelIndex) -> QModelIndex:
+        model = self.sourceModel()
+        return self.mapFromSource(model.index(sys_index.row(), SIZE_COLUMN, sys_index.parent()))
+
+    def on_folder_size_ready(self, path: str):
+        sys_index = self.sourceModel().index(path)
+        if sys_index.isValid() and (index := self.size_index(sys_index=sys_index)).isValid():
+            self.dataChanged.emit(index, index)
+
+    def on_rows_changed(self, parent: QModelIndex, first: int, last: int):
+        # only changes of folder content invalidate its size, models emit dataChanged all the time
+        if parent.isValid():
+            self.folder_sizes.invalidate(path=self.sourceModel().filePath(parent))
+
+    def on_folder_size_invalidated(self, path: str):
+        # totals of folder and its ancestors are recomputed when they are shown again
+        sys_index = self.sourceModel().index(path)
+        while sys_index.isValid():
+            if (index := self.size_index(sys_index=sys_index)).isValid():
+                self.dataChanged.emit(index, index)
+            sys_index = sys_index.parent()
 
     def data(self, index: QModelIndex, role: int = ...) -> Any:
-        if role == Qt.ToolTipRole:
+        if role == DISPLAY_ROLE and index.column() == SIZE_COLUMN:
+            if (size := self.folder_size(sys_index=self.mapToSource(index))) is not None:
+                return size
+        if role == HIDDEN_ROLE:
+            return self.entry_cache.is_hidden(index=self.mapToSource(index))
+        if role == TOOL_TIP_ROLE:
             sys_index = self.mapToSource(index)
-            file_path = self.sourceModel().filePath(sys_index)
-            info = QFileInfo(file_path)
-            last_modified = info.lastModified().toString("yyyy/MM/dd hh:mm:ss")
-            modifiers = QApplication.keyboardModifiers()
-            parts = []
-            if modifiers == Qt.ShiftModifier:
-                if info.isFile():
-                    parts = file_first_lines(file_path=info.absoluteFilePath(), count=20)
-                elif info.isDir():
-                    parts = dir_list(path=info.absoluteFilePath())
-            else:
-                parts = [f"Path: {info.absoluteFilePath()}", f"Last modified: {last_modified}"]
-                if info.isFile():
-                    parts.append(f"Size: {convert_size(info.size())}")
+            model = self.sourceModel()
+            if QApplication.keyboardModifiers() == Qt.ShiftModifier:
+                return self.preview(sys_index=sys_index)
+            last_modified = model.lastModified(sys_index).toString("yyyy/MM/dd hh:mm:ss")
+            parts = [f"Path: {model.filePath(sys_index)}", f"Last modified: {last_modified}"]
+            if not model.isDir(sys_index):
+                parts.append(f"Size: {convert_size(model.size(sys_index))}")
             return "\n".join(parts)
         return super().data(index, role)
+
+
+class PinFilterModel(QSortFilterProxyModel):
+    """Shows only pinned folder among its siblings. It is stacked on sorted proxy and keeps its order,
+    so siblings of unpinned folder are shown again without sorting them"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.pinned_parent = QPersistentModelIndex()
+        self.pinned_index = QPersistentModelIndex()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+    def set_pinned_path(self, path: Optional[str], parent_path: str = None):
+        proxy = self.sourceModel()
+        model = proxy.sourceModel()
+        if path:
+            self.pinned_parent = QPersistentModelIndex(proxy.mapFromSource(model.index(parent_path)))
+            self.pinned_index = QPersistentModelIndex(proxy.mapFromSource(model.index(path)))
+        else:
+            self.pinned_parent = QPersistentModelIndex()
+            self.pinned_index = QPersistentModelIndex()
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        # only pinned folder is shown in its parent, persistent index follows its row in sorted proxy
+        if not self.pinned_parent.isValid() or source_parent != self.pinned_parent:
+            return True
+        return source_row == self.pinned_index.row()
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+import bisect
+from typing import Dict, List, Optional, Protocol, Set
 
 from PySide6.QtCore import QFileInfo
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from src.app.utils.logger import get_console_logger
 
@@ -22,64 +23,168 @@ class Favorite(BaseModel):
 Favorite.update_forward_refs()
 
 
+class FavoritesListener(Protocol):
+    def on_favorite_inserted(self, parent: Optional[Favorite], favorite: Favorite, row: int):
+        ...
+
+    def on_favorite_updated(self, favorite: Favorite):
+        ...
+
+    def on_favorite_removed(self, parent: Optional[Favorite], favorite: Favorite, row: int):
+        ...
+
+
+class FavoriteIndex:
+    """Nodes of favorites tree by id with links to parents and nodes by path"""
+
+    def __init__(self, items: List[Favorite] = None):
+        self.nodes: Dict[int, Favorite] = {}
+        self.parents: Dict[int, Optional[Favorite]] = {}
+        self.by_path: Dict[str, Dict[int, Favorite]] = {}
+        for item in items or []:
+            self.add(favorite=item)
+
+    def __contains__(self, favorite: Favorite) -> bool:
+        return id(favorite) in self.nodes
+
+    def __deepcopy__(self, memo):
+        # index of copied favorites is built again from copied items
+        return None
+
+    def parent(self, favorite: Favorite) -> Optional[Favorite]:
+        return self.parents.get(id(favorite))
+
+    def add(self, favorite: Favorite, parent: Favorite = None):
+        self.nodes[id(favorite)] = favorite
+        self.parents[id(favorite)] = parent
+        self.by_path.setdefault(favorite.path, {})[id(favorite)] = favorite
+        for child in favorite.children:
+            self.add(favorite=child, parent=favorite)
+
+    def remove(self, favorite: Favorite):
+        for child in favorite.children:
+            self.remove(favorite=child)
+        self.nodes.pop(id(favorite), None)
+        self.parents.pop(id(favorite), None)
+        self.remove_path(favorite=favorite, path=favorite.path)
+
+    def remove_path(self, favorite: Favorite, path: str):
+        if (nodes := self.by_path.get(path)) is not None:
+            nodes.pop(id(favorite), None)
+            if not nodes:
+                del self.by_path[path]
+
+    def change_path(self, favorite: Favorite, old_path: str):
+        self.remove_path(favorite=favorite, path=old_path)
+        self.by_path.setdefault(favorite.path, {})[id(favorite)] = favorite
+
+
+class FavoritesListeners(list):
+    def __deepcopy__(self, memo):
+        # widgets showing favorites are not copied with them
+        return FavoritesListeners()
+
+
+def sort_key(favorite: Favorite) -> str:
+    return favorite.name.lower()
+
+
 class Favorites(BaseModel):
     items: List[Favorite] = []
     selected: Optional[Favorite] = None
+    _index: Optional[FavoriteIndex] = PrivateAttr(default=None)
+    _listeners: FavoritesListeners = PrivateAttr(default_factory=FavoritesListeners)
+
+    @property
+    def index(self) -> FavoriteIndex:
+        if self._index is None:
+            self._index = FavoriteIndex(items=self.items)
+        return self._index
+
+    def subscribe(self, listener: FavoritesListener):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: FavoritesListener):
+        self._listeners = FavoritesListeners(item for item in self._listeners if item is not listener)
+
+    def siblings(self, parent: Optional[Favorite]) -> List[Favorite]:
+        return parent.children if parent else self.items
+
+    def row(self, favorite: Favorite) -> int:
+        siblings = self.siblings(parent=self.index.parent(favorite=favorite))
+        return next(row for row, sibling in enumerate(siblings) if sibling is favorite)
+
+    def insert(self, parent: Optional[Favorite], favorite: Favorite):
+        siblings = self.siblings(parent=parent)
+        # items are kept sorted by name so new item goes to its sorted position
+        row = bisect.bisect_right(siblings, sort_key(favorite), key=sort_key)
+        siblings.insert(row, favorite)
+        self.index.add(favorite=favorite, parent=parent)
+        for listener in self._listeners:
+            listener.on_favorite_inserted(parent=parent, favorite=favorite, row=row)
+
+    def remove(self, favorite: Favorite):
+        parent = self.index.parent(favorite=favorite)
+        row = self.row(favorite=favorite)
+        del self.siblings(parent=parent)[row]
+        self.index.remove(favorite=favorite)
+        for listener in self._listeners:
+            listener.on_favorite_removed(parent=parent, favorite=favorite, row=row)
 
     def create_item(
         self, current_favorite: Favorite = None, parent_favorite: Favorite = None, new_favorite: Favorite = None
     ):
-        if current_favorite:
-            current_favorite.children.append(new_favorite)
-        else:
-            self.items.append(new_favorite)
+        self.insert(parent=current_favorite, favorite=new_favorite)
 
     def modify_item(self, current_favorite: Favorite, parent_favorite: Favorite = None, new_favorite: Favorite = None):
+        old_name, old_path = current_favorite.name, current_favorite.path
         current_favorite.name = new_favorite.name
         current_favorite.description = new_favorite.description
         current_favorite.path = new_favorite.path
+        if current_favorite not in self.index:
+            return
+        if old_path != current_favorite.path:
+            self.index.change_path(favorite=current_favorite, old_path=old_path)
+        if sort_key(current_favorite) != old_name.lower():
+            parent = self.index.parent(favorite=current_favorite)
+            self.remove(favorite=current_favorite)
+            self.insert(parent=parent, favorite=current_favorite)
+            return
+        for listener in self._listeners:
+            listener.on_favorite_updated(favorite=current_favorite)
 
     def delete_item(self, current_favorite: Favorite, parent_favorite: Favorite = None, new_favorite: Favorite = None):
-        def delete_child(current_item: Favorite, to_delete: Favorite):
-            current_item.children = [child for child in current_item.children if child is not to_delete]
-            for child in current_item.children:
-                delete_child(current_item=child, to_delete=to_delete)
-
-        self.items = [item for item in self.items if item is not current_favorite]
-        logger.debug(f"top level state {self.items}")
-        for item in self.items:
-            delete_child(current_item=item, to_delete=current_favorite)
+        if current_favorite in self.index:
+            self.remove(favorite=current_favorite)
 
     def sort(self):
         def sort_child(current_favorite: Favorite):
-            current_favorite.children = sorted(current_favorite.children, key=lambda i: i.name.lower())
+            current_favorite.children.sort(key=sort_key)
             for child in current_favorite.children:
                 sort_child(current_favorite=child)
 
-        self.items = sorted(self.items, key=lambda i: i.name.lower())
+        self.items.sort(key=sort_key)
         for item in self.items:
             sort_child(current_favorite=item)
 
-    # def __iter__(self):
-    #     return self
+    def get_flatten_items(self) -> List[Favorite]:
+        return list(self.index.nodes.values())
 
-    def get_flatten_items(self):
-        def add_child(parent: Favorite, items: List[Favorite]):
-            items.append(parent)
-            for child in parent.children:
-                add_child(parent=child, items=items)
+    def find_by_path(self, path: str) -> List[Favorite]:
+        return list(self.index.by_path.get(path, {}).values())
 
-        favorites = []
-        for item in self.items:
-            add_child(parent=item, items=favorites)
-
-        return favorites
+    def paths(self) -> List[str]:
+        return list(self.index.by_path)
 
     def remove_dead_entries(self) -> List[str]:
+        return self.remove_paths(paths={path for path in self.paths() if not QFileInfo(path).exists()})
+
+    def remove_paths(self, paths: Set[str]) -> List[str]:
         deleted = []
-        for favorite in self.get_flatten_items():
-            info = QFileInfo(favorite.path)
-            if not info.exists():
-                deleted.append(favorite.path)
-                self.delete_item(current_favorite=favorite)
+        for path in paths:
+            for favorite in self.find_by_path(path=path):
+                # favorite might be gone with its deleted ancestor
+                if favorite in self.index:
+                    deleted.append(favorite.path)
+                    self.remove(favorite=favorite)
         return deleted
@@ -20,6 +20,14 @@ def get_config_file() -> str:
     return join(items=[path, "file_system.json"])
 
 
+def get_index_dir() -> str:
+    path = join(items=[get_app_data_path(), USER_NAME, APP_NAME, "index"])
+    index_dir = QDir(path)
+    if not index_dir.exists():
+        index_dir.mkpath(path)
+    return path
+
+
 class Tree(BaseModel):
     current_path: Optional[str] = None
     pinned_path: Optional[str] = None
@@ -30,6 +38,7 @@ class Tree(BaseModel):
     show_system: bool = False
     expanded_items: List[str] = []
     last_selected_path: Optional[str] = None
+    scandir_model: bool = False
 
 
 class WindowState(BaseModel):
@@ -93,6 +102,9 @@ class App(BaseModel):
     search_win_state: SearchWindowState = SearchWindowState()
     last_group: Optional[str] = None
     groups: List[Group] = []
+    # copy engine reports progress in jobs panel and fails the job instead of overwriting existing files,
+    # Windows shell shows its own dialogs and asks before overwriting
+    shell_file_operations: bool = False
 
     def get_group_by_name(self, name: str):
         lookup = [group for group in self.groups if group.name == name]
@@ -4,20 +4,25 @@ import operator
 import re
 from enum import Enum, auto
 from itertools import accumulate
-from typing import Sequence, Iterator, Optional, List, Tuple, Dict
+from typing import Sequence, Iterator, Optional, List, Tuple, Dict, Union
 
 from PySide6.QtCore import QFileInfo
 
 from pydantic import BaseModel
 
+from src.app.utils.aho_corasick import TermMatch
 from src.app.utils.constant import DEFAULT_ENCODING
-from src.app.utils.path_util import extract_folders, path_caption
+from src.app.utils.path_util import extract_folders, path_caption, collapse_roots
 
 
 def format_keyword(keyword: str) -> str:
     return f"""<span style="background-color:transparent;color:gold">{keyword}</span>"""
 
 
+def format_term(term: str) -> str:
+    return f"""<span style="background-color:transparent;color:Gray">[{term}] </span>"""
+
+
 def format_path(path: str) -> str:
     return f"""<span style="background-color:transparent;color:aqua">{path}</span>"""
 
@@ -59,9 +64,27 @@ class SearchParam(BaseModel):
     whole_words: bool = False
     reg_exp: bool = False
     subdirectories: bool = True
+    multiple_keywords: bool = False
+    all_keywords: bool = False
+
+    def keyword_list(self) -> List[str]:
+        if not self.keyword:
+            return []
+        if not self.multiple_keywords:
+            return [self.keyword]
+        return list(dict.fromkeys(part.strip() for part in self.keyword.split(";") if part.strip()))
+
+    def search_paths(self) -> List[str]:
+        if not self.path:
+            return []
+        paths = [path.strip() for path in self.path.split(";")]
+        return collapse_roots(paths=paths, nested=self.subdirectories)
 
     def as_html(self) -> str:
         def search_type() -> str:
+            if self.keyword and self.multiple_keywords:
+                keywords = ", ".join(format_keyword(keyword=keyword) for keyword in self.keyword_list())
+                return f"{'all' if self.all_keywords else 'any'} of {keywords}"
             if self.keyword:
                 return format_keyword(keyword=self.keyword)
             return "for files and folders"
@@ -71,7 +94,7 @@ class SearchParam(BaseModel):
                 "Result(s) of searching",
                 search_type(),
                 "in",
-                format_path(path=self.path),
+                format_path(path="; ".join(self.search_paths())),
                 f"using filters {self.name_filters}",
             ]
         )
@@ -87,6 +110,7 @@ class LineHit(BaseModel):
     hit_range: Range
     line_hit_range: Range
     file_name: str
+    term: Optional[str] = None
 
     def column_number(self) -> int:
         return self.line_hit_range[0] + 1
@@ -99,7 +123,8 @@ class LineHit(BaseModel):
         keyword = format_keyword(keyword=keyword)
         text_after = self.line_text[self.line_hit_range[1] :]
         text_after = f"""<span style="background-color:transparent">{text_after}</span>"""
-        text = "".join([line_number, text_before, keyword, text_after])
+        term = format_term(term=self.term) if self.term else ""
+        text = "".join([line_number, term, text_before, keyword, text_after])
         return f"<pre><code>{text}</code></pre>"
 
     def file_name_short(self) -> str:
@@ -141,7 +166,7 @@ def line_range_map(lines: List[str]) -> LineRangeMap:
     return ranges
 
 
-def line_hit(match: re.Match, lines: List[str], line_map: LineRangeMap, file_name: str) -> LineHit:
+def line_hit(match: Union[re.Match, TermMatch], lines: List[str], line_map: LineRangeMap, file_name: str) -> LineHit:
     if match is None or len(match.regs) != 1:
         raise ValueError(f"Match is empty or contains not exactly one tuple {match}")
     hit_range = match.regs[0]
@@ -166,6 +191,7 @@ def line_hit(match: re.Match, lines: List[str], line_map: LineRangeMap, file_nam
         hit_range=hit_range,
         line_hit_range=line_hit_range,
         file_name=file_name,
+        term=getattr(match, "term", None),
     )
 
 
@@ -174,7 +200,7 @@ class FileSearchResult(BaseModel):
     file_name: str
     is_dir: bool
     error: Optional[str] = None
-    hits: Optional[List[re.Match]] = None
+    hits: Optional[List[Union[re.Match, TermMatch]]] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class TermMatch:
+    """Keyword occurrence found by Automaton. Mimics the part of re.Match interface used by search results"""
+
+    __slots__ = ("term", "regs")
+
+    def __init__(self, term: str, start: int, end: int):
+        self.term = term
+        self.regs: Tuple[Tuple[int, int]] = ((start, end),)
+
+    def start(self) -> int:
+        return self.regs[0][0]
+
+    def end(self) -> int:
+        return self.regs[0][1]
+
+    def span(self) -> Tuple[int, int]:
+        return self.regs[0]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, TermMatch) and (self.term, self.regs) == (other.term, other.regs)
+
+    def __repr__(self) -> str:
+        return f"<TermMatch span={self.span()} term={self.term!r}>"
+
+
+def is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def lower_text(text: str) -> str:
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+class Automaton:
+    """Aho-Corasick automaton finding all occurrences of many literal keywords in a single pass over text"""
+
+    def __init__(self, keywords: Iterable[str], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.keywords: List[str] = list(dict.fromkeys(keyword for keyword in keywords if keyword))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        for term_index, keyword in enumerate(self.keywords):
+            self._add(term_index=term_index, keyword=self._normalize(keyword))
+        self._build_fail_links()
+        self._lengths = [len(self._normalize(keyword)) for keyword in self.keywords]
+        first_chars = "".join(sorted(self._goto[0]))
+        self._first_char = re.compile(f"[{re.escape(first_chars)}]") if first_chars else None
+
+    def _normalize(self, text: str) -> str:
+        return lower_text(text) if self.ignore_case else text
+
+    def _add(self, term_index: int, keyword: str):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(term_index)
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                if state:
+                    self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def finditer(self, text: str, whole_words: bool = False) -> Iterator[TermMatch]:
+        if self._first_char is None:
+            return
+        haystack = self._normalize(text)
+        goto, fail, output, keywords = self._goto, self._fail, self._output, self.keywords
+        lengths = self._lengths
+        state, pos, size = 0, 0, len(haystack)
+        while pos < size:
+            if state == 0:
+                match = self._first_char.search(haystack, pos)
+                if match is None:
+                    return
+                pos = match.start()
+            char = haystack[pos]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            pos += 1
+            for term_index in output[state]:
+                start = pos - lengths[term_index]
+                if whole_words and not self._is_whole_word(text=haystack, start=start, end=pos):
+                    continue
+                yield TermMatch(term=keywords[term_index], start=start, end=pos)
+
+    @staticmethod
+    def _is_whole_word(text: str, start: int, end: int) -> bool:
+        before = start == 0 or not is_word_char(text[start - 1])
+        after = end == len(text) or not is_word_char(text[end])
+        return before and after
+
+    def search(self, text: str, whole_words: bool = False) -> Optional[TermMatch]:
+        return next(self.finditer(text=text, whole_words=whole_words), None)
+
+    def matched_terms(self, text: str, whole_words: bool = False) -> List[str]:
+        return list(dict.fromkeys(match.term for match in self.finditer(text=text, whole_words=whole_words)))
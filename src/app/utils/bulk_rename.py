@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import uuid
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.app.utils.jobs import current_job
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+INVALID_NAME_CHARS = '<>:"/\\|?*'
+
+Rename = Tuple[str, str]
+
+
+class RenameRule:
+    """Computes new name of item. Regex rule substitutes pattern in name, replacement can refer to groups.
+    Template rule builds name from fields {name}, {stem}, {ext}, {parent} and counter {n}, e.g. {stem}_{n:03}{ext}"""
+
+    def __init__(self, pattern: str, replacement: str, regex: bool = True, ignore_case: bool = False, start: int = 1):
+        self.replacement = replacement
+        self.start = start
+        self.pattern: Optional[re.Pattern] = None
+        if regex:
+            try:
+                self.pattern = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression: {e}") from e
+
+    def new_name(self, path: str, number: int) -> str:
+        name = os.path.basename(path)
+        if self.pattern is not None:
+            try:
+                return self.pattern.sub(self.replacement, name)
+            except re.error as e:
+                raise ValueError(f"Invalid replacement: {e}") from e
+        stem, ext = os.path.splitext(name)
+        try:
+            return self.replacement.format(
+                name=name, stem=stem, ext=ext, parent=os.path.basename(os.path.dirname(path)), n=number
+            )
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"Invalid template: {e}") from e
+
+
+class RenamePlan:
+    """Renames of selected items computed in memory. Items which can't be renamed are listed in conflicts"""
+
+    def __init__(self):
+        self.names: Dict[str, str] = {}
+        self.conflicts: Dict[str, str] = {}
+
+    @property
+    def renames(self) -> List[Rename]:
+        return [(src, dst) for src, dst in self.names.items() if src != dst and src not in self.conflicts]
+
+    def __bool__(self):
+        return not self.conflicts and bool(self.renames)
+
+
+def name_problem(name: str) -> Optional[str]:
+    if not name or name in (".", ".."):
+        return "Empty name"
+    if any(char in name for char in INVALID_NAME_CHARS) or name.endswith((" ", ".")):
+        return "Invalid name"
+    return None
+
+
+class FolderNames:
+    """Checks existence of paths against names of their folders, each folder is listed once with os.scandir
+    instead of stat of every path. Folder which can't be listed falls back to stat"""
+
+    def __init__(self):
+        self._names: Dict[str, Optional[Set[str]]] = {}
+
+    def __call__(self, path: str) -> bool:
+        folder, name = os.path.split(os.path.normcase(path))
+        if folder not in self._names:
+            try:
+                with os.scandir(folder or os.curdir) as it:
+                    self._names[folder] = {os.path.normcase(entry.name) for entry in it}
+            except OSError:
+                self._names[folder] = None
+        names = self._names[folder]
+        return os.path.lexists(path) if names is None else name in names
+
+
+def plan_renames(paths: List[str], rule: RenameRule, exists: Optional[Callable[[str], bool]] = None) -> RenamePlan:
+    """Existing targets are found by exists, by default folders of targets are listed"""
+    plan = RenamePlan()
+    exists = exists or FolderNames()
+    targets: Dict[str, str] = {}
+    for number, path in enumerate(paths, start=rule.start):
+        name = rule.new_name(path=path, number=number)
+        dst = os.path.join(os.path.dirname(path), name)
+        plan.names[path] = dst
+        if problem := name_problem(name=name):
+            plan.conflicts[path] = problem
+            continue
+        key = os.path.normcase(dst)
+        if (other := targets.get(key)) is not None:
+            plan.conflicts[path] = f"Same new name as {os.path.basename(other)}"
+            plan.conflicts.setdefault(other, f"Same new name as {name}")
+            continue
+        targets[key] = path
+    # target may be occupied by item which is renamed away, unless its own rename fails
+    moving = {os.path.normcase(src) for src, dst in plan.renames}
+    checked = False
+    while not checked:
+        checked = True
+        for src, dst in plan.renames:
+            key = os.path.normcase(dst)
+            if key != os.path.normcase(src) and key not in moving and exists(dst):
+                plan.conflicts[src] = "Already exists"
+                moving.discard(os.path.normcase(src))
+                checked = False
+    return plan
+
+
+def temporary_name(path: str) -> str:
+    return f"{path}.rename-{uuid.uuid4().hex[:8]}"
+
+
+def order_renames(renames: List[Rename]) -> List[Rename]:
+    """Orders renames so that no item is renamed to name which is still taken. Chains (a->b, b->c) are renamed
+    from their end, cycles (a->b, b->a) and case only renames go through temporary name.
+    Items are renamed within their folder, so deeper items go first and their paths stay valid"""
+    by_source = {os.path.normcase(src): (src, dst) for src, dst in renames}
+    done = set()
+    steps: List[Rename] = []
+    for start in sorted(by_source, key=lambda key: key.count(os.sep), reverse=True):
+        chain: List[str] = []
+        on_chain = set()
+        key = start
+        while key in by_source and key not in done and key not in on_chain:
+            on_chain.add(key)
+            chain.append(key)
+            key = os.path.normcase(by_source[key][1])
+        moved: Dict[str, str] = {}
+        if key in on_chain:
+            src, _ = by_source[key]
+            moved[key] = temporary_name(path=src)
+            steps.append((src, moved[key]))
+        for key in reversed(chain):
+            src, dst = by_source[key]
+            steps.append((moved.get(key, src), dst))
+            done.add(key)
+    return steps
+
+
+def apply_renames(steps: List[Rename]):
+    """Renames items in given order. If any rename fails, already renamed items get their names back"""
+    job = current_job()
+    renamed: List[Rename] = []
+    try:
+        for number, (src, dst) in enumerate(steps, start=1):
+            if job:
+                job.check_cancelled()
+            # rename would replace existing file silently on some platforms
+            if os.path.normcase(src) != os.path.normcase(dst) and os.path.lexists(dst):
+                raise FileExistsError(f"Cannot rename {src}, {dst} already exists")
+            os.rename(src, dst)
+            renamed.append((src, dst))
+            if job:
+                job.report(done=number, total=len(steps), unit="items")
+    except BaseException:
+        for src, dst in reversed(renamed):
+            try:
+                os.rename(dst, src)
+            except OSError as e:
+                logger.error(f"Cannot rename {dst} back to {src} {e}")
+        raise
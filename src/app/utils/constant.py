@@ -7,6 +7,7 @@ APP_NAME = "File system"
 class Context(Enum):
     main = auto()
     search = auto()
+    quick_open = auto()
 
 
 DEFAULT_ENCODING = "latin-1"
@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+import errno
+import fnmatch
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from src.app.utils.jobs import Job, current_job
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+CHUNK_SIZE = 64 * 1024 * 1024
+BUFFER_SIZE = 1024 * 1024
+SMALL_FILE_SIZE = 1024 * 1024
+COPY_WORKERS = 8
+# kernel copy is not possible between these files, nothing was copied yet
+UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP, errno.ENOTSOCK}
+
+# ioctl cloning extents of one file into another on copy on write file systems (btrfs, xfs, bcachefs)
+FICLONE = 0x40049409
+# file system or kernel can't clone these files
+UNSUPPORTED_CLONE_ERRNOS = UNSUPPORTED_ERRNOS | {errno.ENOTTY, errno.EPERM}
+
+# reparse tag of Windows junction, stat module defines it on Windows only
+IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003
+
+Sources = Union[str, Iterable[str]]
+
+
+class CopyProgress:
+    """Bytes copied by all workers of one operation, reported to the job running it"""
+
+    def __init__(self, job: Optional[Job] = None):
+        self.job = job or current_job()
+        self.total = 0
+        self.done = 0
+        self._lock = threading.Lock()
+
+    def add(self, count: int):
+        with self._lock:
+            self.done += count
+            if self.job:
+                self.job.report(done=self.done, total=self.total)
+
+    def check_cancelled(self):
+        if self.job:
+            self.job.check_cancelled()
+
+
+class FileTask(NamedTuple):
+    src: str
+    dst: str
+    size: int
+
+
+class CopyPlan:
+    """Folders to create and files and links to copy, in walk order"""
+
+    def __init__(self):
+        self.dirs: List[Tuple[str, str]] = []
+        self.files: List[FileTask] = []
+        self.links: List[Tuple[str, str]] = []
+        self.total = 0
+
+
+def expand_sources(src: Sources) -> List[str]:
+    """Absolute source paths. Like in Windows shell file name portion of path can contain wildcards"""
+    paths = [src] if isinstance(src, str) else list(src)
+    sources = []
+    for path in paths:
+        folder, name = os.path.split(os.path.abspath(path))
+        if not any(char in name for char in "*?["):
+            sources.append(os.path.join(folder, name))
+            continue
+        pattern = "*" if name == "*.*" else name
+        with os.scandir(folder) as it:
+            sources.extend(sorted(entry.path for entry in it if fnmatch.fnmatch(entry.name, pattern)))
+    return sources
+
+
+def free_name(path: str) -> str:
+    """First name(n) which doesn't exist yet"""
+    if not os.path.lexists(path):
+        return path
+    stem, suffix = (path, "") if os.path.isdir(path) else os.path.splitext(path)
+    number = 1
+    while os.path.lexists(name := f"{stem}({number}){suffix}"):
+        number += 1
+    return name
+
+
+def target_path(source: str, dst: str, auto_rename: bool) -> str:
+    target = os.path.join(os.path.abspath(dst), os.path.basename(source))
+    if auto_rename or os.path.normcase(target) == os.path.normcase(source):
+        return free_name(path=target)
+    return target
+
+
+def is_junction(path: str) -> bool:
+    """Windows junction is a link to other folder, but unlike symbolic link it looks like a folder"""
+    if hasattr(os.path, "isjunction"):
+        return os.path.isjunction(path)
+    if os.name != "nt":
+        return False
+    try:
+        return getattr(os.lstat(path), "st_reparse_tag", 0) == IO_REPARSE_TAG_MOUNT_POINT
+    except OSError:
+        return False
+
+
+def entry_is_junction(entry: os.DirEntry) -> bool:
+    if hasattr(entry, "is_junction"):
+        return entry.is_junction()
+    if os.name != "nt":
+        return False
+    return getattr(entry.stat(follow_symlinks=False), "st_reparse_tag", 0) == IO_REPARSE_TAG_MOUNT_POINT
+
+
+def is_real_dir(path: str) -> bool:
+    """Folder which is not a link, links are copied, moved and removed without their targets"""
+    return os.path.isdir(path) and not os.path.islink(path) and not is_junction(path)
+
+
+def is_inside(path: str, folder: str) -> bool:
+    path, folder = os.path.normcase(path), os.path.normcase(folder)
+    return path == folder or path.startswith(folder.rstrip(os.sep) + os.sep)
+
+
+def find_conflicts(pairs: Iterable[Tuple[str, str]]) -> List[str]:
+    """Existing targets which would be overwritten. Existing folders are merged, so only their content is checked"""
+    conflicts = []
+    stack = list(pairs)
+    while stack:
+        src, dst = stack.pop()
+        if not os.path.lexists(dst):
+            continue
+        if is_real_dir(path=src) and is_real_dir(path=dst):
+            with os.scandir(src) as it:
+                stack.extend((entry.path, os.path.join(dst, entry.name)) for entry in it)
+        else:
+            conflicts.append(dst)
+    return sorted(conflicts)
+
+
+def check_conflicts(pairs: List[Tuple[str, str]]):
+    if conflicts := find_conflicts(pairs=pairs):
+        names = "\n".join(conflicts[:10]) + ("\n..." if len(conflicts) > 10 else "")
+        raise FileExistsError(errno.EEXIST, f"{len(conflicts)} items already exist in destination\n{names}")
+
+
+def plan_copy(pairs: Iterable[Tuple[str, str]], progress: CopyProgress) -> CopyPlan:
+    plan = CopyPlan()
+    stack = list(reversed(list(pairs)))
+    while stack:
+        src, dst = stack.pop()
+        progress.check_cancelled()
+        if os.path.islink(src) or is_junction(path=src):
+            plan.links.append((src, dst))
+        elif os.path.isdir(src):
+            if is_inside(path=dst, folder=src):
+                raise OSError(errno.EINVAL, f"Cannot copy {src} into itself")
+            plan.dirs.append((src, dst))
+            with os.scandir(src) as it:
+                children = sorted(it, key=lambda entry: entry.name)
+            stack.extend((child.path, os.path.join(dst, child.name)) for child in reversed(children))
+        else:
+            size = os.stat(src).st_size
+            plan.files.append(FileTask(src=src, dst=dst, size=size))
+            plan.total += size
+    progress.total = plan.total
+    return plan
+
+
+def _clone(fsrc: BinaryIO, fdst: BinaryIO, progress: CopyProgress) -> int:
+    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    size = os.fstat(fsrc.fileno()).st_size
+    progress.add(count=size)
+    return size
+
+
+def _copy_file_range(fsrc: BinaryIO, fdst: BinaryIO, progress: CopyProgress) -> int:
+    copied = 0
+    while count := os.copy_file_range(fsrc.fileno(), fdst.fileno(), CHUNK_SIZE):
+        copied += count
+        progress.add(count=count)
+        progress.check_cancelled()
+    return copied
+
+
+def _sendfile(fsrc: BinaryIO, fdst: BinaryIO, progress: CopyProgress) -> int:
+    copied = 0
+    while count := os.sendfile(fdst.fileno(), fsrc.fileno(), copied, CHUNK_SIZE):
+        copied += count
+        progress.add(count=count)
+        progress.check_cancelled()
+    return copied
+
+
+def _read_write(fsrc: BinaryIO, fdst: BinaryIO, progress: CopyProgress) -> int:
+    copied = 0
+    buffer = memoryview(bytearray(BUFFER_SIZE))
+    while count := fsrc.readinto(buffer):
+        fdst.write(buffer[:count])
+        copied += count
+        progress.add(count=count)
+        progress.check_cancelled()
+    return copied
+
+
+def kernel_copies() -> List[Callable[[BinaryIO, BinaryIO, CopyProgress], int]]:
+    copies = []
+    if hasattr(os, "copy_file_range"):
+        copies.append(_copy_file_range)
+    if hasattr(os, "sendfile"):
+        copies.append(_sendfile)
+    return copies
+
+
+def clone_data(fsrc: BinaryIO, fdst: BinaryIO, progress: CopyProgress) -> Optional[int]:
+    """Shares data of files instead of copying them, None if file system doesn't support it"""
+    if fcntl is None:
+        return None
+    try:
+        return _clone(fsrc=fsrc, fdst=fdst, progress=progress)
+    except OSError as e:
+        if e.errno not in UNSUPPORTED_CLONE_ERRNOS:
+            raise
+        logger.debug(f"clone not supported for {fsrc.name} {e}")
+        return None
+
+
+def copy_data(fsrc: BinaryIO, fdst: BinaryIO, progress: CopyProgress, clone: bool = False) -> int:
+    """Copies in kernel when platform and file system allow, by user space buffer otherwise.
+    If clone is set, data are shared with source file where possible"""
+    if clone and (copied := clone_data(fsrc=fsrc, fdst=fdst, progress=progress)) is not None:
+        return copied
+    for kernel_copy in kernel_copies():
+        try:
+            return kernel_copy(fsrc, fdst, progress)
+        except OSError as e:
+            if e.errno not in UNSUPPORTED_ERRNOS or fdst.tell() or os.fstat(fdst.fileno()).st_size:
+                raise
+            logger.debug(f"{kernel_copy.__name__} not supported for {fsrc.name} {e}")
+    return _read_write(fsrc=fsrc, fdst=fdst, progress=progress)
+
+
+def copy_file_data(task: FileTask, progress: CopyProgress, clone: bool = False):
+    progress.check_cancelled()
+    with open(task.src, "rb", buffering=0) as fsrc, open(task.dst, "wb", buffering=0) as fdst:
+        if task.size:
+            copy_data(fsrc=fsrc, fdst=fdst, progress=progress, clone=clone)
+    shutil.copystat(task.src, task.dst)
+
+
+def copy_link(src: str, dst: str):
+    if os.path.lexists(dst):
+        os.remove(dst)
+    os.symlink(os.readlink(src), dst, target_is_directory=os.path.isdir(src))
+
+
+def copy_files(tasks: Iterator[FileTask], lock: threading.Lock, progress: CopyProgress, clone: bool = False):
+    """Copies files taken from iterator shared by all workers until it is exhausted"""
+    while True:
+        with lock:
+            task = next(tasks, None)
+        if task is None:
+            return
+        try:
+            copy_file_data(task=task, progress=progress, clone=clone)
+        except BaseException:
+            with lock:
+                # other workers stop too
+                for _ in tasks:
+                    pass
+            raise
+
+
+def execute_plan(plan: CopyPlan, progress: CopyProgress, workers: int = COPY_WORKERS, clone: bool = False):
+    """Small files are copied in parallel, large files one by one in large kernel chunks"""
+    for _, dst in plan.dirs:
+        os.makedirs(dst, exist_ok=True)
+    for src, dst in plan.links:
+        copy_link(src=src, dst=dst)
+    small_files = iter([task for task in plan.files if task.size < SMALL_FILE_SIZE])
+    lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="copy") as executor:
+        futures = [executor.submit(copy_files, small_files, lock, progress, clone) for _ in range(workers)]
+        try:
+            for task in plan.files:
+                if task.size >= SMALL_FILE_SIZE:
+                    copy_file_data(task=task, progress=progress, clone=clone)
+        except BaseException:
+            with lock:
+                for _ in small_files:
+                    pass
+            raise
+        for future in futures:
+            future.result()
+    # folder times change when files are created, copy them last and deepest first
+    for src, dst in reversed(plan.dirs):
+        shutil.copystat(src, dst)
+
+
+def remove_item(path: str):
+    if is_junction(path=path):
+        os.rmdir(path)
+    elif os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def move_item(src: str, dst: str):
+    """Renames item, existing folder is merged with moved folder"""
+    if is_real_dir(path=src) and is_real_dir(path=dst):
+        with os.scandir(src) as it:
+            children = [(entry.path, os.path.join(dst, entry.name)) for entry in it]
+        for child_src, child_dst in children:
+            move_item(src=child_src, dst=child_dst)
+        os.rmdir(src)
+    else:
+        os.replace(src, dst)
+
+
+def copy(src: Sources, dst: str, auto_rename: bool, overwrite: bool = False) -> bool:
+    """
+    Copy files and directories without Windows shell.
+
+    :param src: Path or a list of paths to copy. Filename portion of a path
+                can contain wildcards ``*`` and ``?``.
+    :param dst: destination directory, created if it doesn't exist.
+    :param auto_rename: if ''True'' then auto rename items which exist in destination
+    :param overwrite: if ''False'' then existing files in destination fail the operation
+                      before anything is copied, existing folders are merged
+    :returns: ``True`` if the operation completed successfully.
+    :raises: ``OSError`` if anything went wrong, ``JobCancelled`` if job was cancelled.
+    """
+    os.makedirs(dst, exist_ok=True)
+    progress = CopyProgress()
+    pairs = [(source, target_path(source=source, dst=dst, auto_rename=auto_rename)) for source in expand_sources(src)]
+    if not overwrite:
+        check_conflicts(pairs=pairs)
+    execute_plan(plan=plan_copy(pairs=pairs, progress=progress), progress=progress)
+    return True
+
+
+def move(src: Sources, dst: str, auto_rename: bool = False, overwrite: bool = False) -> bool:
+    """
+    Move files and directories without Windows shell. Items on the same volume are renamed,
+    items on other volumes are copied and removed.
+
+    :param src: Path or a list of paths to move. Filename portion of a path
+                can contain wildcards ``*`` and ``?``.
+    :param dst: destination directory, created if it doesn't exist.
+    :param auto_rename: if ''True'' then auto rename items which exist in destination
+    :param overwrite: if ''False'' then existing files in destination fail the operation
+                      before anything is moved, existing folders are merged
+    :returns: ``True`` if the operation completed successfully.
+    :raises: ``OSError`` if anything went wrong, ``JobCancelled`` if job was cancelled.
+    """
+    os.makedirs(dst, exist_ok=True)
+    progress = CopyProgress()
+    moves = []
+    for source in expand_sources(src):
+        target = target_path(source=source, dst=dst, auto_rename=auto_rename)
+        if os.path.isdir(source) and is_inside(path=target, folder=source):
+            raise OSError(errno.EINVAL, f"Cannot move {source} into itself")
+        moves.append((source, target))
+    if not overwrite:
+        check_conflicts(pairs=moves)
+    pairs = []
+    for source, target in moves:
+        try:
+            move_item(src=source, dst=target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            pairs.append((source, target))
+    if pairs:
+        execute_plan(plan=plan_copy(pairs=pairs, progress=progress), progress=progress)
+        for source, _ in pairs:
+            remove_item(path=source)
+    return True
+
+
+def copy_file(src: str, tgt: str, auto_rename) -> bool:
+    if auto_rename:
+        tgt = free_name(path=tgt)
+    progress = CopyProgress()
+    progress.total = os.stat(src).st_size
+    copy_file_data(task=FileTask(src=src, dst=tgt, size=progress.total), progress=progress)
+    return True
+
+
+def duplicate(src: str, dst: str) -> bool:
+    """Copy of file or folder under new name. On copy on write file systems files are cloned, which is
+    almost instant and takes no space, each file which can't be cloned is copied"""
+    progress = CopyProgress()
+    execute_plan(plan=plan_copy(pairs=[(src, dst)], progress=progress), progress=progress, clone=True)
+    return True
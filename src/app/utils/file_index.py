@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import heapq
+import logging
+import os
+import re
+import time
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+from src.app.utils.logger import get_console_logger
+from src.app.utils.thread import ThreadWithWorker
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+DEFAULT_EXCLUDED_DIRS = (".git", ".svn", "venv", "__pycache__", "node_modules")
+SEGMENT_SEPARATORS = "/_-. "
+INDEX_ENCODING = "utf-8"
+INDEX_MAX_AGE = 10 * 60
+
+
+class IndexBuildCancelled(Exception):
+    pass
+
+
+def normalize_query(text: str) -> str:
+    return "".join(text.lower().replace("\\", "/").split())
+
+
+def subsequence_pattern(query: str) -> re.Pattern:
+    chars = [re.escape(char) for char in query]
+    return re.compile(chars[0] + "".join(f"[^\\n{char}]*{char}" for char in chars[1:]))
+
+
+def match_positions(query: str, key: str, start: int = 0) -> Optional[List[int]]:
+    positions = []
+    pos = start
+    for char in query:
+        pos = key.find(char, pos)
+        if pos < 0:
+            return None
+        positions.append(pos)
+        pos += 1
+    return positions
+
+
+def fuzzy_score(query: str, key: str) -> Optional[float]:
+    name_start = key.rfind("/") + 1
+    positions = match_positions(query=query, key=key, start=name_start)
+    in_name = positions is not None
+    if not in_name:
+        positions = match_positions(query=query, key=key)
+        if positions is None:
+            return None
+    score = 0.0
+    previous = -2
+    for pos in positions:
+        score += 1
+        if pos == previous + 1:
+            score += 5
+        if pos == 0 or key[pos - 1] in SEGMENT_SEPARATORS:
+            score += 3
+        previous = pos
+    if in_name:
+        score += 10
+        if key.startswith(query, name_start):
+            score += 10
+    return score - len(key) * 0.01
+
+
+class FileIndex:
+    def __init__(self, root: str, paths: List[str] = None, built: float = None):
+        self.root = root.rstrip("/\\")
+        self.paths = paths or []
+        self.built = built or time.time()
+        keys = [path.lower() for path in self.paths]
+        names = [key[key.rfind("/") + 1 :] for key in keys]
+        self._keys, self._key_offsets = self.join_lines(lines=keys)
+        self._names, self._name_offsets = self.join_lines(lines=names)
+        self._last_query: Optional[str] = None
+        self._last_candidates: List[int] = []
+
+    @staticmethod
+    def join_lines(lines: List[str]) -> Tuple[str, List[int]]:
+        return "\n" + "\n".join(lines) + "\n", list(accumulate((len(line) + 1 for line in lines), initial=0))
+
+    def __len__(self):
+        return len(self.paths)
+
+    def full_path(self, index: int) -> str:
+        return f"{self.root}/{self.paths[index]}"
+
+    def age(self) -> float:
+        return time.time() - self.built
+
+    def key(self, index: int) -> str:
+        return self._keys[self._key_offsets[index] + 1 : self._key_offsets[index + 1]]
+
+    def candidates(self, query: str, max_candidates: int) -> List[int]:
+        if self._last_query and query.startswith(self._last_query):
+            return [index for index in self._last_candidates if match_positions(query=query, key=self.key(index))]
+        found: Dict[int, None] = {}
+        searches = [
+            (re.compile(re.escape("\n" + query)), self._names, self._name_offsets),
+            (re.compile(re.escape(query)), self._names, self._name_offsets),
+            (subsequence_pattern(query=query), self._names, self._name_offsets),
+            (subsequence_pattern(query=query), self._keys, self._key_offsets),
+        ]
+        for pattern, text, offsets in searches:
+            for match in pattern.finditer(text):
+                found[bisect.bisect_right(offsets, match.start()) - 1] = None
+                if len(found) >= max_candidates:
+                    self._last_query = None
+                    return list(found)
+        self._last_query, self._last_candidates = query, list(found)
+        return self._last_candidates
+
+    def query(self, text: str, limit: int = 50) -> List[str]:
+        return [path for _, path in self.query_with_scores(text=text, limit=limit)]
+
+    def query_with_scores(self, text: str, limit: int = 50, max_candidates: int = 1000) -> List[Tuple[float, str]]:
+        needle = normalize_query(text=text)
+        if not needle:
+            return []
+        scored = []
+        for index in self.candidates(query=needle, max_candidates=max(limit, max_candidates)):
+            score = fuzzy_score(query=needle, key=self.key(index))
+            if score is not None:
+                scored.append((score, index))
+        return [(score, self.full_path(index)) for score, index in heapq.nlargest(limit, scored)]
+
+    @classmethod
+    def build(
+        cls,
+        root: str,
+        excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+        is_cancelled: Callable[[], bool] = None,
+    ) -> FileIndex:
+        excluded = {name.lower() for name in excluded_dirs}
+        paths = []
+        folders = [""]
+        while folders:
+            if is_cancelled and is_cancelled():
+                raise IndexBuildCancelled(f"Indexing of {root} cancelled")
+            folder = folders.pop()
+            try:
+                with os.scandir(os.path.join(root, folder)) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.debug(f"Cannot list {folder} {e}")
+                continue
+            for entry in entries:
+                rel_path = f"{folder}/{entry.name}" if folder else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    paths.append(rel_path)
+                elif entry.name.lower() not in excluded:
+                    folders.append(rel_path)
+        paths.sort(key=str.lower)
+        return cls(root=root, paths=paths)
+
+    def save(self, file_name: str):
+        tmp_file_name = f"{file_name}.tmp"
+        with open(tmp_file_name, "w", encoding=INDEX_ENCODING, errors="surrogateescape") as file:
+            file.write(f"{self.root}\n{self.built}\n")
+            file.write("\n".join(self.paths))
+        os.replace(tmp_file_name, file_name)
+
+    @classmethod
+    def load(cls, file_name: str) -> Optional[FileIndex]:
+        try:
+            with open(file_name, "r", encoding=INDEX_ENCODING, errors="surrogateescape") as file:
+                lines = file.read().split("\n")
+            return cls(root=lines[0], paths=[line for line in lines[2:] if line], built=float(lines[1]))
+        except (OSError, IndexError, ValueError) as e:
+            logger.debug(f"Cannot load index {file_name} {e}")
+            return None
+
+
+def index_file_name(index_dir: str, root: str) -> str:
+    key = os.path.normcase(os.path.abspath(root)).encode(INDEX_ENCODING, errors="surrogateescape")
+    return os.path.join(index_dir, f"{hashlib.md5(key).hexdigest()}.idx")
+
+
+class IndexWorker(QObject):
+    loaded = Signal(str, object)
+    finished = Signal()
+    exception = Signal(str, str)
+
+    def __init__(self, root: str, file_name: str, max_age: float = INDEX_MAX_AGE):
+        super().__init__()
+        self.root = root
+        self.file_name = file_name
+        self.max_age = max_age
+
+    def run(self):
+        try:
+            index = FileIndex.load(file_name=self.file_name)
+            if index is not None:
+                self.loaded.emit(self.root, index)
+            if index is None or index.age() > self.max_age:
+                index = FileIndex.build(root=self.root, is_cancelled=QThread.currentThread().isInterruptionRequested)
+                index.save(file_name=self.file_name)
+                self.loaded.emit(self.root, index)
+        except IndexBuildCancelled as e:
+            logger.debug(str(e))
+        except Exception as e:
+            logger.error(str(e))
+            self.exception.emit(self.root, str(e))
+        finally:
+            self.finished.emit()
+
+
+class FileIndexes(QObject):
+    """One index of each root shared by quick open and deep filter.
+    Old or missing index is rebuilt in background, by at most one thread per root"""
+
+    loaded = Signal(str)
+    finished = Signal(str)
+    exception = Signal(str, str)
+
+    def __init__(self, mf, index_dir: str):
+        super().__init__(parent=mf)
+        self.mf = mf
+        self.index_dir = index_dir
+        self.indexes: Dict[str, FileIndex] = {}
+        self.index_threads: Dict[str, ThreadWithWorker] = {}
+
+    def index(self, root: str) -> Optional[FileIndex]:
+        return self.indexes.get(root)
+
+    def request(self, root: str) -> Optional[FileIndex]:
+        """Current index of root, index is built when it's missing or older than INDEX_MAX_AGE"""
+        index = self.indexes.get(root)
+        if root not in self.index_threads and (index is None or index.age() > INDEX_MAX_AGE):
+            self.build_index(root=root)
+        return index
+
+    def is_indexing(self, root: str) -> bool:
+        return root in self.index_threads
+
+    def build_index(self, root: str):
+        thread = QThread()
+        worker = IndexWorker(root=root, file_name=index_file_name(index_dir=self.index_dir, root=root))
+        thread_with_worker = ThreadWithWorker(thread=thread, worker=worker)
+        self.index_threads[root] = thread_with_worker
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.loaded.connect(self.on_index_loaded)
+        worker.exception.connect(self.exception)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(lambda: self.reset_index_thread(root=root))
+        thread.start()
+        self.mf.threads.append(thread_with_worker)
+
+    def reset_index_thread(self, root: str):
+        thread_with_worker = self.index_threads.pop(root, None)
+        if thread_with_worker:
+            self.mf.remove_thread(thread_with_worker=thread_with_worker)
+            thread_with_worker.thread.deleteLater()
+        self.finished.emit(root)
+
+    def on_index_loaded(self, root: str, index: FileIndex):
+        self.indexes[root] = index
+        self.loaded.emit(root)
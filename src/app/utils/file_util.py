@@ -1,9 +1,13 @@
 import os
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
+from shiboken6 import isValid
 from PySide6.QtCore import QFileInfo, QDir
-from PySide6.QtWidgets import QMessageBox, QInputDialog, QApplication
+from PySide6.QtWidgets import QMessageBox, QInputDialog, QApplication, QDialog
 
+from src.app.gui.dialog.manifest import ManifestDlg
+from src.app.utils.jobs import run_job
+from src.app.utils.manifest import create_manifest
 from src.app.utils.path_util import logger, validate_single_path, extract_path, rename_if_exists
 from src.app.utils.constant import APP_NAME
 from src.app.utils.shell import new_file
@@ -71,3 +75,27 @@ def create_text_file_from_clip(parent_func: Callable, path_func: Callable) -> bo
         return create_file(parent_func=parent_func, path_func=path_func, text=text)
     QMessageBox.information(parent_func(), APP_NAME, "Clipboard is empty")
     return False
+
+
+def create_from_manifest(parent_func: Callable, path_func: Callable) -> bool:
+    parent = parent_func()
+    is_ok, org_path = validate_single_path(parent=parent, paths=path_func())
+    if not is_ok:
+        return False
+    root = extract_path(item=org_path)
+    dialog = ManifestDlg(parent=parent, root=root)
+    if dialog.exec_() != QDialog.Accepted or not dialog.plan:
+        return False
+    run_job(
+        target=create_manifest,
+        args=[dialog.plan],
+        caption=f"Create {len(dialog.plan.dirs) + len(dialog.plan.files)} items in {root}",
+        callback=lambda job: select_created(tree=parent, paths=job.result),
+    )
+    return True
+
+
+def select_created(tree, paths: List[str]):
+    # tab might have been closed while job was running
+    if isValid(tree):
+        tree.set_selection(paths)
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import deque
+from contextlib import nullcontext
+from typing import Deque, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from src.app.utils.copy_engine import entry_is_junction
+from src.app.utils.logger import get_console_logger
+from src.app.utils.scheduler import IOLane, io_scheduler, DEFAULT_MAX_WORKERS
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+FOLDER_SIZE_PLACEHOLDER = "..."
+
+
+def folder_key(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+class FolderAggregate:
+    """Size of files directly in folder, its sub folders and total size of the whole subtree.
+    Stale folder has to be listed again, dirty folder has to sum totals of its sub folders again"""
+
+    __slots__ = ("own_size", "children", "total", "stale", "dirty")
+
+    def __init__(self, own_size: int, children: Tuple[str, ...], total: int):
+        self.own_size = own_size
+        self.children = children
+        self.total = total
+        self.stale = False
+        self.dirty = False
+
+
+class FolderSizeCache:
+    """Thread safe folder aggregates. Change of folder marks its aggregate stale and its ancestors dirty
+    so recomputation lists only changed folders and reuses totals of all others.
+    Folder being computed counts changes in its subtree, its result is kept only if there were none"""
+
+    def __init__(self):
+        self._items: Dict[str, FolderAggregate] = {}
+        # computations in progress and generations of their subtrees keyed by folder
+        self._computing: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, path: str) -> Optional[FolderAggregate]:
+        with self._lock:
+            return self._items.get(folder_key(path))
+
+    def begin(self, path: str) -> int:
+        """Starts computation of folder, returns generation of its subtree"""
+        key = folder_key(path)
+        with self._lock:
+            count, generation = self._computing.get(key, (0, 0))
+            self._computing[key] = (count + 1, generation)
+            return generation
+
+    def end(self, path: str):
+        key = folder_key(path)
+        with self._lock:
+            count, generation = self._computing[key]
+            if count > 1:
+                self._computing[key] = (count - 1, generation)
+            else:
+                del self._computing[key]
+
+    def put(self, path: str, aggregate: FolderAggregate, generation: int):
+        key = folder_key(path)
+        with self._lock:
+            if self._computing.get(key, (0, generation))[1] != generation:
+                # subtree changed during computation, total might be based on outdated listing
+                aggregate.stale = aggregate.dirty = True
+            self._items[key] = aggregate
+
+    def total(self, path: str) -> Tuple[Optional[int], bool]:
+        """Last known total and whether it is up-to-date"""
+        aggregate = self.get(path=path)
+        if aggregate is None:
+            return None, False
+        return aggregate.total, not (aggregate.stale or aggregate.dirty)
+
+    def invalidate(self, path: str) -> bool:
+        key = folder_key(path)
+        with self._lock:
+            self._count_change(key=key)
+            aggregate = self._items.get(key)
+            if aggregate is None or aggregate.stale:
+                return False
+            aggregate.stale = True
+            while (parent := os.path.dirname(key)) != key:
+                key = parent
+                aggregate = self._items.get(key)
+                if aggregate is None or aggregate.dirty:
+                    break
+                aggregate.dirty = True
+            return True
+
+    def _count_change(self, key: str):
+        """Bumps generations of folders being computed which contain changed folder"""
+        if not self._computing:
+            return
+        while True:
+            if computing := self._computing.get(key):
+                self._computing[key] = (computing[0], computing[1] + 1)
+            parent = os.path.dirname(key)
+            if parent == key:
+                return
+            key = parent
+
+
+def list_folder(path: str, lane: IOLane = None) -> Tuple[int, Tuple[str, ...]]:
+    own_size = 0
+    children: List[str] = []
+    try:
+        with lane.slot() if lane else nullcontext():
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_symlink() or entry_is_junction(entry):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            children.append(entry.path)
+                        else:
+                            own_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+    except OSError as e:
+        logger.debug(f"Cannot list {path} {e}")
+    return own_size, tuple(children)
+
+
+def folder_size(path: str, cache: FolderSizeCache, lane: IOLane = None) -> int:
+    aggregate = cache.get(path=path)
+    if aggregate is not None and not aggregate.stale and not aggregate.dirty:
+        return aggregate.total
+    generation = cache.begin(path=path)
+    try:
+        if aggregate is None or aggregate.stale:
+            own_size, children = list_folder(path=path, lane=lane)
+        else:
+            own_size, children = aggregate.own_size, aggregate.children
+        total = own_size + sum(folder_size(path=child, cache=cache, lane=lane) for child in children)
+        cache.put(
+            path=path,
+            aggregate=FolderAggregate(own_size=own_size, children=children, total=total),
+            generation=generation,
+        )
+    finally:
+        cache.end(path=path)
+    return total
+
+
+class FolderSizeScanner(QObject):
+    """Computes sizes of folders in background threads. Most recent requests are served first.
+    Invalidated folder is announced once, so that all views showing it can update"""
+
+    ready = Signal(str)
+    invalidated = Signal(str)
+
+    def __init__(self, workers: int = DEFAULT_MAX_WORKERS, max_pending: int = 64):
+        super().__init__()
+        self.cache = FolderSizeCache()
+        self.workers = max(1, workers)
+        self._requests: Deque[str] = deque(maxlen=max_pending)
+        self._active: Dict[str, None] = {}
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._io_lane = io_scheduler().lane(name="folder sizes", limit=self.workers)
+
+    def size(self, path: str) -> Optional[int]:
+        total, is_current = self.cache.total(path=path)
+        if not is_current:
+            self.request(path=path)
+        return total
+
+    def invalidate(self, path: str) -> bool:
+        if not self.cache.invalidate(path=path):
+            return False
+        self.invalidated.emit(path)
+        return True
+
+    def request(self, path: str):
+        with self._condition:
+            if path in self._requests or path in self._active:
+                return
+            self._requests.append(path)
+            if len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._run, name="folder size scanner", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._requests:
+                    self._condition.wait()
+                path = self._requests.pop()
+                self._active[path] = None
+            try:
+                folder_size(path=path, cache=self.cache, lane=self._io_lane)
+            finally:
+                with self._condition:
+                    del self._active[path]
+            logger.debug(f"size of {path} ready")
+            self.ready.emit(path)
+
+
+_folder_size_scanner: Optional[FolderSizeScanner] = None
+
+
+def folder_size_scanner() -> FolderSizeScanner:
+    global _folder_size_scanner  # pylint: disable=global-statement
+    if _folder_size_scanner is None:
+        _folder_size_scanner = FolderSizeScanner()
+    return _folder_size_scanner
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+GIT_DIR = ".git"
+GIT_DIR_PREFIX = "gitdir:"
+
+Config = Dict[str, Dict[str, str]]
+
+
+class Repo(NamedTuple):
+    root: str
+    # folder with HEAD of work tree
+    git_dir: str
+    # folder with config shared by all work trees
+    common_dir: str
+
+    @property
+    def config_path(self) -> str:
+        return os.path.join(self.common_dir, "config")
+
+
+def read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="utf-8") as file:
+            return file.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def resolve_git_dir(root: str) -> Optional[str]:
+    """Folder with repository data of work tree. In linked work trees and submodules .git is a file
+    pointing to it with gitdir: line"""
+    dot_git = os.path.join(root, GIT_DIR)
+    if os.path.isdir(dot_git):
+        return dot_git
+    text = read_text(path=dot_git)
+    if text and text.startswith(GIT_DIR_PREFIX):
+        git_dir = os.path.normpath(os.path.join(root, text[len(GIT_DIR_PREFIX) :].strip()))
+        if os.path.isdir(git_dir):
+            return git_dir
+    return None
+
+
+def find_repo(path: str) -> Optional[Repo]:
+    """Walks up from path to first folder with .git"""
+    folder = os.path.abspath(path)
+    if not os.path.isdir(folder):
+        folder = os.path.dirname(folder)
+    while True:
+        if git_dir := resolve_git_dir(root=folder):
+            common_dir = read_text(path=os.path.join(git_dir, "commondir"))
+            common_dir = os.path.normpath(os.path.join(git_dir, common_dir)) if common_dir else git_dir
+            return Repo(root=folder, git_dir=git_dir, common_dir=common_dir)
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            return None
+        folder = parent
+
+
+def parse_value(value: str) -> str:
+    """Strips comment and quotes of config value"""
+    result = []
+    quoted = False
+    escaped = False
+    for char in value.strip():
+        if escaped:
+            result.append({"n": "\n", "t": "\t", "b": "\b"}.get(char, char))
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif char in "#;" and not quoted:
+            break
+        else:
+            result.append(char)
+    return "".join(result).strip()
+
+
+def parse_config(text: str) -> Config:
+    """Sections of git config keyed by lower case name with subsection, e.g. remote "origin".
+    Last value of repeated key wins"""
+    config: Config = {}
+    section: Optional[Dict[str, str]] = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+        if line.startswith("["):
+            header = line[1 : line.find("]")] if "]" in line else line[1:]
+            name, _, subsection = header.partition(" ")
+            name = name.lower()
+            if subsection:
+                name = f'{name} "{subsection.strip().strip(chr(34))}"'
+            elif "." in name:
+                # deprecated [section.subsection] syntax
+                name, _, subsection = name.partition(".")
+                name = f'{name} "{subsection}"'
+            section = config.setdefault(name, {})
+        elif section is not None:
+            key, _, value = line.partition("=")
+            section[key.strip().lower()] = parse_value(value=value) if _ else "true"
+    return config
+
+
+class ConfigCache:
+    """Parsed configs keyed by repository root, entry is valid while mtime of config file doesn't change"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._configs: Dict[str, Tuple[float, Config]] = {}
+
+    def config(self, repo: Repo) -> Config:
+        try:
+            mtime = os.stat(repo.config_path).st_mtime
+        except OSError:
+            return {}
+        with self._lock:
+            if (cached := self._configs.get(repo.root)) and cached[0] == mtime:
+                return cached[1]
+        config = parse_config(text=read_text(path=repo.config_path) or "")
+        with self._lock:
+            self._configs[repo.root] = (mtime, config)
+        return config
+
+    def clear(self):
+        with self._lock:
+            self._configs.clear()
+
+
+_config_cache: Optional[ConfigCache] = None
+
+
+def config_cache() -> ConfigCache:
+    global _config_cache  # pylint: disable=global-statement
+    if _config_cache is None:
+        _config_cache = ConfigCache()
+    return _config_cache
+
+
+def remote_url(path: str, remote: str = "origin") -> Optional[str]:
+    repo = find_repo(path=path)
+    if repo is None:
+        return None
+    url = config_cache().config(repo=repo).get(f'remote "{remote}"', {}).get("url")
+    logger.debug(f"{path} repo {repo.root} url {url}")
+    return url or None
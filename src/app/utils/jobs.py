@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from src.app.utils.logger import get_console_logger, get_file_handler
+from src.app.utils.scheduler import io_scheduler, IOLane
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+logger.addHandler(get_file_handler())
+
+PROGRESS_INTERVAL = 0.1
+BYTES = "B"
+
+_file_jobs_lane: Optional[IOLane] = None
+
+
+def file_jobs_lane() -> IOLane:
+    """Jobs hold their slot until they finish, so one slot is always left to searches"""
+    global _file_jobs_lane  # pylint: disable=global-statement
+    if _file_jobs_lane is None:
+        _file_jobs_lane = io_scheduler().lane(name="file jobs", reserve=1)
+    return _file_jobs_lane
+
+
+class JobState(Enum):
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    DONE = "Done"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+
+
+class JobPriority(int, Enum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    """File operation executed by JobQueue. Long operations report progress and check cancellation
+    through current_job()"""
+
+    def __init__(
+        self,
+        job_id: int,
+        caption: str,
+        target: Callable,
+        args: Sequence,
+        priority: JobPriority,
+        callback: Optional[Callable[[Job], None]] = None,
+    ):
+        self.id = job_id
+        self.caption = caption
+        self.target = target
+        self.args = args
+        self.priority = priority
+        self.callback = callback
+        self.result = None
+        self.state = JobState.QUEUED
+        self.done = 0
+        self.total = 0
+        self.unit = BYTES
+        self.error: Optional[str] = None
+        self.queue: Optional[JobQueue] = None
+        self._cancel_event = threading.Event()
+        self._reported = 0.0
+
+    def __repr__(self) -> str:
+        return f"Job({self.id}, {self.caption}, {self.state.value})"
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in (JobState.DONE, JobState.FAILED, JobState.CANCELLED)
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled(self.caption)
+
+    def report(self, done: int, total: Optional[int] = None, unit: Optional[str] = None):
+        self.done = done
+        if total is not None:
+            self.total = total
+        if unit is not None:
+            self.unit = unit
+        now = time.monotonic()
+        if self.queue and (now - self._reported >= PROGRESS_INTERVAL or self.done == self.total):
+            self._reported = now
+            self.queue.changed.emit(self)  # pylint: disable=no-member
+
+    def progress(self) -> Optional[int]:
+        """Percent done or None if job doesn't report progress"""
+        if not self.total:
+            return None
+        return min(100, self.done * 100 // self.total)
+
+
+_current = threading.local()
+
+
+def current_job() -> Optional[Job]:
+    """Job executed by calling thread"""
+    return getattr(_current, "job", None)
+
+
+class JobQueue(QObject):
+    """Runs jobs in bounded pool of reusable worker threads. Jobs with higher priority start first,
+    jobs with the same priority start in submission order"""
+
+    added = Signal(object)
+    changed = Signal(object)
+    finished = Signal(object)
+
+    def __init__(self, workers: Optional[int] = None, lane: Optional[IOLane] = None):
+        super().__init__()
+        self.lane = lane or file_jobs_lane()
+        self.workers = max(1, workers or self.lane.limit)
+        self.jobs: Dict[int, Job] = {}
+        self._heap: List[Tuple[int, int, Job]] = []
+        self._ids = itertools.count(1)
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        # queued connection, finished is emitted by worker threads
+        self.finished.connect(self.on_finished)
+
+    def submit(
+        self,
+        target: Callable,
+        args: Sequence,
+        caption: str,
+        priority: JobPriority = JobPriority.NORMAL,
+        callback: Optional[Callable[[Job], None]] = None,
+    ) -> Job:
+        """Callback is called in GUI thread when job finishes successfully"""
+        with self._condition:
+            job = Job(
+                job_id=next(self._ids),
+                caption=caption,
+                target=target,
+                args=args,
+                priority=priority,
+                callback=callback,
+            )
+            job.queue = self
+            self.jobs[job.id] = job
+            heapq.heappush(self._heap, (priority, job.id, job))
+            if len(self._heap) > self._idle and len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._run, name="job worker", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._condition.notify_all()
+        logger.debug(f"submitted {job}")
+        self.added.emit(job)
+        return job
+
+    def cancel(self, job: Job):
+        job.cancel()
+        with self._condition:
+            if job.state != JobState.QUEUED:
+                return
+            # worker skips cancelled job when it gets to the top of heap
+            job.state = JobState.CANCELLED
+            self._condition.notify_all()
+        self.finished.emit(job)
+
+    def cancel_all(self):
+        for job in self.active_jobs():
+            self.cancel(job=job)
+
+    def active_jobs(self) -> List[Job]:
+        with self._condition:
+            return [job for job in self.jobs.values() if not job.is_finished]
+
+    def running_jobs(self) -> List[Job]:
+        with self._condition:
+            return [job for job in self.jobs.values() if job.state == JobState.RUNNING]
+
+    def clear_finished(self) -> List[Job]:
+        with self._condition:
+            finished = [job for job in self.jobs.values() if job.is_finished]
+            for job in finished:
+                del self.jobs[job.id]
+        return finished
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits until all submitted jobs finish. For tests and shutdown"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while any(not job.is_finished for job in self.jobs.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(timeout=remaining)
+        return True
+
+    def on_finished(self, job: Job):
+        if job.callback and job.state == JobState.DONE:
+            job.callback(job)
+
+    def _next_job(self) -> Job:
+        with self._condition:
+            while True:
+                while not self._heap:
+                    self._idle += 1
+                    self._condition.wait()
+                    self._idle -= 1
+                _, _, job = heapq.heappop(self._heap)
+                if job.state == JobState.QUEUED:
+                    job.state = JobState.RUNNING
+                    return job
+
+    def _finish(self, job: Job, state: JobState, error: Optional[str] = None):
+        with self._condition:
+            job.state = state
+            job.error = error
+            self._condition.notify_all()
+        self.finished.emit(job)
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            self.changed.emit(job)
+            _current.job = job
+            try:
+                logger.debug(f"Executing {job.target} with args {job.args}")
+                with self.lane.slot():
+                    job.check_cancelled()
+                    job.result = job.target(*job.args)
+            except JobCancelled:
+                self._finish(job=job, state=JobState.CANCELLED)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(str(e))
+                self._finish(job=job, state=JobState.FAILED, error=str(e))
+            else:
+                self._finish(job=job, state=JobState.DONE)
+            finally:
+                _current.job = None
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def job_queue() -> JobQueue:
+    global _job_queue  # pylint: disable=global-statement
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
+
+
+def run_job(
+    target: Callable,
+    args: Sequence,
+    caption: str,
+    priority: JobPriority = JobPriority.NORMAL,
+    callback: Optional[Callable[[Job], None]] = None,
+) -> Job:
+    return job_queue().submit(target=target, args=args, caption=caption, priority=priority, callback=callback)
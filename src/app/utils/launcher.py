@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from src.app.utils.logger import get_console_logger, get_file_handler
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+logger.addHandler(get_file_handler())
+
+# cmd.exe limit is 8191 characters, editors are often started through .cmd wrappers
+MAX_COMMAND_LENGTH = 8000
+
+Command = List[str]
+# line and column of file, column is optional
+Position = Tuple[int, Optional[int]]
+
+
+def command_length(command: Command) -> int:
+    # each argument may be quoted and is separated by space
+    return sum(len(arg) + 3 for arg in command)
+
+
+def command_batches(
+    program: str, options: List[str], items: List[str], limit: int = MAX_COMMAND_LENGTH
+) -> List[Command]:
+    """Splits items into as few command lines as length limit allows. Options are repeated in every command"""
+    base = [program] + options
+    commands: List[Command] = []
+    batch: List[str] = []
+    length = command_length(command=base)
+    for item in items:
+        size = len(item) + 3
+        if batch and length + size > limit:
+            commands.append(base + batch)
+            batch, length = [], command_length(command=base)
+        batch.append(item)
+        length += size
+    if batch:
+        commands.append(base + batch)
+    return commands
+
+
+def goto_item(path: str, position: Optional[Position]) -> str:
+    if position is None:
+        return path
+    line, column = position
+    return f"{path}:{line}:{column}" if column is not None else f"{path}:{line}"
+
+
+def vs_code_commands(program: str, paths: List[str], positions: Dict[str, Position]) -> List[Command]:
+    """VS Code opens all paths of command in one window. With -g every file can carry its own line and column"""
+    options = []
+    if any(os.path.isdir(path) for path in paths):
+        options.append("-n")
+    if any(path in positions for path in paths):
+        options.append("-g")
+    items = [goto_item(path=path, position=positions.get(path)) for path in paths]
+    return command_batches(program=program, options=options, items=items)
+
+
+def notepad_commands(program: str, files: List[str], positions: Dict[str, Position]) -> List[Command]:
+    """Notepad++ applies -n and -c to all files of command so files are grouped by line and column"""
+    groups: Dict[Optional[Position], List[str]] = {}
+    for file in files:
+        groups.setdefault(positions.get(file), []).append(file)
+    commands: List[Command] = []
+    for position, group in groups.items():
+        options = []
+        if position is not None:
+            line, column = position
+            options.append(f"-n{line}")
+            if column is not None:
+                options.append(f"-c{column}")
+        commands.extend(command_batches(program=program, options=options, items=group))
+    return commands
+
+
+class Launcher:
+    """Starts programs in background thread so that GUI doesn't wait for process creation"""
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="launcher")
+
+    def launch(self, commands: List[Command]):
+        for command in commands:
+            self._executor.submit(self._start, command)
+
+    @staticmethod
+    def _start(command: Command):
+        logger.debug(f"cmd {command}")
+        try:
+            subprocess.Popen(command)  # pylint: disable=consider-using-with
+        except OSError as e:
+            logger.error(f"Cannot start {command[0]} {e}")
+
+
+_launcher: Optional[Launcher] = None
+
+
+def launcher() -> Launcher:
+    global _launcher  # pylint: disable=global-statement
+    if _launcher is None:
+        _launcher = Launcher()
+    return _launcher
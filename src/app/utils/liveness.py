@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+PROBE_TIMEOUT = 2.0
+PROBE_TTL = 30.0
+PROBE_WORKERS = 4
+CHECK_DELAY = 500
+
+
+class PathProbe:
+    """Checks existence of paths in worker threads. Path which doesn't answer within timeout is reported
+    as unknown (None) and is not probed again until its pending check finishes, late answer replaces it.
+    Existing and unknown paths are cached for ttl, missing paths are probed every time"""
+
+    def __init__(
+        self,
+        timeout: float = PROBE_TIMEOUT,
+        ttl: float = PROBE_TTL,
+        workers: int = PROBE_WORKERS,
+        exists: Callable[[str], bool] = os.path.exists,
+    ):
+        self.timeout = timeout
+        self.ttl = ttl
+        self.exists = exists
+        self.cache: Dict[str, Tuple[Optional[bool], float]] = {}
+        self._in_flight: Dict[str, Future] = {}
+        # reentrant, callback of future which is already done runs in thread adding it
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="path probe")
+
+    def probe(self, paths: Iterable[str]) -> Dict[str, Optional[bool]]:
+        results: Dict[str, Optional[bool]] = {}
+        futures: Dict[str, Future] = {}
+        with self._lock:
+            for path in dict.fromkeys(paths):
+                entry = self.cache.get(path)
+                if entry is not None and time.monotonic() - entry[1] <= self.ttl:
+                    results[path] = entry[0]
+                    continue
+                if (future := self._in_flight.get(path)) is None:
+                    future = self._executor.submit(self.exists, path)
+                    self._in_flight[path] = future
+                    future.add_done_callback(partial(self.on_done, path))
+                futures[path] = future
+        deadline = time.monotonic() + self.timeout
+        for path, future in futures.items():
+            try:
+                alive = bool(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                logger.debug(f"{path} did not answer within {self.timeout}s")
+                alive = None
+                with self._lock:
+                    if not future.done():
+                        self.cache[path] = (None, time.monotonic())
+            except OSError:
+                alive = None
+            results[path] = alive
+        return results
+
+    def on_done(self, path: str, future: Future):
+        try:
+            alive = bool(future.result())
+        except OSError:
+            alive = None
+        with self._lock:
+            self._in_flight.pop(path, None)
+            if alive is False:
+                self.cache.pop(path, None)
+            else:
+                self.cache[path] = (alive, time.monotonic())
+
+
+class LivenessChecker(QObject):
+    """Debounced background check of paths. Paths which certainly don't exist are reported by dead signal
+    together with requester which asked for them, so that each requester handles only its own paths"""
+
+    dead = Signal(object, object)
+
+    def __init__(self, probe: PathProbe = None, delay: int = CHECK_DELAY):
+        super().__init__()
+        self.probe = probe or PathProbe()
+        self._paths: Dict[object, Dict[str, None]] = {}
+        self._batch: Optional[Dict[object, Dict[str, None]]] = None
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.start_check)
+
+    def check(self, requester: object, paths: Iterable[str]):
+        self._paths.setdefault(requester, {}).update(dict.fromkeys(paths))
+        self._timer.start()
+
+    def start_check(self):
+        requests, self._paths = self._paths, {}
+        with self._condition:
+            if self._batch is None:
+                self._batch = {}
+            for requester, paths in requests.items():
+                self._batch.setdefault(requester, {}).update(paths)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="liveness checker", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._batch is None:
+                    self._condition.wait()
+                requests, self._batch = self._batch, None
+            results = self.probe.probe(paths=[path for paths in requests.values() for path in paths])
+            for requester, paths in requests.items():
+                dead: List[str] = [path for path in paths if results.get(path) is False]
+                if dead:
+                    logger.debug(f"dead paths {dead}")
+                    self.dead.emit(requester, dead)
+
+
+_liveness_checker: Optional[LivenessChecker] = None
+
+
+def liveness_checker() -> LivenessChecker:
+    global _liveness_checker  # pylint: disable=global-statement
+    if _liveness_checker is None:
+        _liveness_checker = LivenessChecker()
+    return _liveness_checker
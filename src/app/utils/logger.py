@@ -13,7 +13,8 @@ def get_console_handler(log_level: int = logging.DEBUG) -> logging.StreamHandler
 
 
 def get_file_handler(log_level: int = logging.DEBUG, file_name="file_system.log") -> logging.FileHandler:
-    file_handler = logging.FileHandler(file_name)
+    # file is created by first record, not by import of module adding the handler
+    file_handler = logging.FileHandler(file_name, delay=True)
     file_handler.setLevel(level=log_level)
     file_handler.setFormatter(get_formatter())
     return file_handler
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+import os
+from typing import Dict, List, NamedTuple, Optional, Set
+
+from src.app.utils.bulk_rename import name_problem
+from src.app.utils.jobs import current_job
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+TAB_SIZE = 4
+
+
+class ManifestError(ValueError):
+    def __init__(self, line_number: int, message: str):
+        super().__init__(f"Line {line_number}: {message}")
+        self.line_number = line_number
+
+
+class ManifestEntry(NamedTuple):
+    path: str
+    is_dir: bool
+
+
+def split_names(text: str, line_number: int) -> List[str]:
+    parts = [part for part in text.replace("\\", "/").split("/") if part]
+    if text.startswith(("/", "\\")) or (parts and parts[0].endswith(":")):
+        raise ManifestError(line_number=line_number, message=f"{text} is not a relative path")
+    for part in parts:
+        if problem := name_problem(name=part):
+            raise ManifestError(line_number=line_number, message=f"{problem} {part}")
+    return parts
+
+
+def parse_manifest(text: str) -> List[ManifestEntry]:
+    """Paths to create, parents first. Manifest is either a list of relative paths or an indented tree
+    where items nested under a line are created in its folder. Line can contain several names separated
+    by semicolons. Names ending with slash and names with nested items are folders, others are files.
+    Empty lines and lines starting with # are skipped"""
+    entries: Dict[str, bool] = {}
+    # (indent, folder) of lines which current line can be nested under
+    stack: List[tuple] = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        content = line.strip()
+        if not content or content.startswith("#"):
+            continue
+        expanded = line.expandtabs(TAB_SIZE)
+        indent = len(expanded) - len(expanded.lstrip())
+        popped = set()
+        while stack and stack[-1][0] >= indent:
+            popped.add(stack.pop()[0])
+        if popped and indent not in popped:
+            raise ManifestError(line_number=line_number, message="Indentation doesn't match any outer line")
+        if not stack and indent and entries:
+            raise ManifestError(line_number=line_number, message="Indented line has no parent")
+        parent = stack[-1][1] if stack else ""
+        if parent and not entries[parent]:
+            entries[parent] = True
+        last = None
+        for name in content.split(";"):
+            name = name.strip()
+            if not name:
+                continue
+            parts = split_names(text=name, line_number=line_number)
+            if not parts:
+                raise ManifestError(line_number=line_number, message=f"Invalid name {name}")
+            path = parent
+            for number, part in enumerate(parts, start=1):
+                path = f"{path}/{part}" if path else part
+                is_dir = number < len(parts) or name.endswith(("/", "\\"))
+                entries[path] = entries.get(path, False) or is_dir
+            last = path
+        if last is not None:
+            stack.append((indent, last))
+    return [ManifestEntry(path=path, is_dir=is_dir) for path, is_dir in entries.items()]
+
+
+class ManifestPlan:
+    """Entries of manifest checked against file system. Existing items of the same kind are skipped"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.dirs: List[str] = []
+        self.files: List[str] = []
+        self.existing: List[str] = []
+        self.conflicts: Dict[str, str] = {}
+        self.top_level: List[str] = []
+
+    def __bool__(self):
+        return not self.conflicts and bool(self.dirs or self.files)
+
+
+def validate_manifest(root: str, entries: List[ManifestEntry]) -> ManifestPlan:
+    """Lists every existing folder touched by manifest once instead of checking each path"""
+    plan = ManifestPlan(root=root)
+    listings: Dict[str, Optional[Dict[str, bool]]] = {}
+    missing: Set[str] = set()
+
+    def listing(folder: str) -> Optional[Dict[str, bool]]:
+        if folder not in listings:
+            try:
+                with os.scandir(os.path.join(root, folder) if folder else root) as it:
+                    listings[folder] = {os.path.normcase(entry.name): entry.is_dir() for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                listings[folder] = None
+        return listings[folder]
+
+    for entry in entries:
+        folder, _, name = entry.path.rpartition("/")
+        path = os.path.normpath(os.path.join(root, entry.path))
+        if not folder:
+            plan.top_level.append(path)
+        existing = None if folder in missing else listing(folder=folder)
+        is_dir = existing.get(os.path.normcase(name)) if existing is not None else None
+        if is_dir is None:
+            missing.add(entry.path)
+            (plan.dirs if entry.is_dir else plan.files).append(path)
+        elif is_dir != entry.is_dir:
+            plan.conflicts[path] = "Folder exists" if is_dir else "File exists"
+        else:
+            plan.existing.append(path)
+    return plan
+
+
+def create_manifest(plan: ManifestPlan) -> List[str]:
+    """Creates folders and empty files of plan. Returns top level items of manifest"""
+    job = current_job()
+    total = len(plan.dirs) + len(plan.files)
+    for number, path in enumerate(plan.dirs, start=1):
+        if job:
+            job.check_cancelled()
+            job.report(done=number, total=total, unit="items")
+        os.makedirs(path, exist_ok=True)
+    for number, path in enumerate(plan.files, start=len(plan.dirs) + 1):
+        if job:
+            job.check_cancelled()
+            job.report(done=number, total=total, unit="items")
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+    return plan.top_level
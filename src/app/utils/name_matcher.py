@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import fnmatch
+import logging
+import re
+import threading
+from typing import Iterable, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from src.app.utils.file_index import FileIndex, subsequence_pattern
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+GLOB_CHARS = "*?["
+
+
+class NameMatcher:
+    """File name filter compiled once from text typed by user. Terms are separated by semicolons.
+    Terms with wildcards are globs, other terms match as substrings or, if fuzzy, as subsequences"""
+
+    def __init__(self, text: str, fuzzy: bool = False):
+        self.text = text
+        self.fuzzy = fuzzy
+        terms = [term.strip().lower() for term in text.split(";") if term.strip() and term.strip() != "*"]
+        globs = [term for term in terms if any(char in term for char in GLOB_CHARS)]
+        self.substrings = [term for term in terms if term not in globs]
+        patterns = [f"^{fnmatch.translate(term)}" for term in globs]
+        if fuzzy:
+            patterns.extend(subsequence_pattern(query=term).pattern for term in self.substrings)
+            self.substrings = []
+        self.pattern: Optional[re.Pattern] = re.compile("|".join(patterns)) if patterns else None
+        self.matches_all = not terms
+
+    def __bool__(self):
+        return not self.matches_all
+
+    def matches(self, name: str) -> bool:
+        if self.matches_all:
+            return True
+        name = name.lower()
+        if any(term in name for term in self.substrings):
+            return True
+        return self.pattern is not None and self.pattern.search(name) is not None
+
+    def matching_dirs(self, root: str, paths: Iterable[str]) -> Set[str]:
+        """Sub folders of root containing matching files. Paths are relative to root"""
+        dirs = set()
+        for path in paths:
+            name_start = path.rfind("/") + 1
+            if not self.matches(name=path[name_start:]):
+                continue
+            folder = path[: max(name_start - 1, 0)]
+            while folder:
+                folder_path = f"{root}/{folder}"
+                if folder_path in dirs:
+                    break
+                dirs.add(folder_path)
+                folder = folder[: max(folder.rfind("/"), 0)]
+        return dirs
+
+
+class MatchingDirsFinder(QObject):
+    """Finds folders of file index containing matching files in background thread.
+    Only the latest request is computed, so typing doesn't queue scans of whole index"""
+
+    ready = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._request: Optional[Tuple[FileIndex, str, bool]] = None
+        self._result: Optional[Tuple[Tuple[FileIndex, str, bool], Set[str]]] = None
+
+    def find(self, index: FileIndex, matcher: NameMatcher) -> Optional[Set[str]]:
+        """Folders found for index and matcher or None if they are being found, ready is emitted then"""
+        key = (index, matcher.text, matcher.fuzzy)
+        with self._condition:
+            if self._result is not None and self._result[0] == key:
+                return self._result[1]
+            self._request = key
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="matching dirs finder", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._request is None:
+                    self._condition.wait()
+                key, self._request = self._request, None
+            index, text, fuzzy = key
+            dirs = NameMatcher(text=text, fuzzy=fuzzy).matching_dirs(root=index.root, paths=index.paths)
+            with self._condition:
+                if self._request is not None:
+                    # newer request replaces this result
+                    continue
+                self._result = (key, dirs)
+            logger.debug(f"{len(dirs)} folders of {index.root} match {text}")
+            self.ready.emit(index.root)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+import os
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+
+def path_parts(path: str) -> List[str]:
+    # Qt models use forward slashes on every platform, saved layouts may contain both
+    return [os.path.normcase(part) for part in path.replace("\\", "/").split("/") if part]
+
+
+class PathTrieNode:
+    __slots__ = ("path", "children")
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self.children: Dict[str, PathTrieNode] = {}
+
+
+class PathTrie:
+    """Set of paths stored by their components so that paths directly under a directory are found
+    without scanning the whole set"""
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self.root = PathTrieNode()
+        self.count = 0
+        for path in paths:
+            self.add(path=path)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, path: str) -> bool:
+        node = self.node(path=path)
+        return node is not None and node.path is not None
+
+    def node(self, path: str) -> Optional[PathTrieNode]:
+        node = self.root
+        for part in path_parts(path=path):
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def add(self, path: str):
+        node = self.root
+        for part in path_parts(path=path):
+            node = node.children.setdefault(part, PathTrieNode())
+        if node.path is None:
+            self.count += 1
+        node.path = path
+
+    def paths(self) -> Iterator[str]:
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.path is not None:
+                yield node.path
+            stack.extend(node.children.values())
+
+    def pop_children(self, path: str) -> List[str]:
+        """Removes and returns paths directly under path. Paths deeper below them are kept"""
+        parts = path_parts(path=path)
+        nodes = [self.root]
+        for part in parts:
+            node = nodes[-1].children.get(part)
+            if node is None:
+                return []
+            nodes.append(node)
+        parent = nodes[-1]
+        children = []
+        for name, node in list(parent.children.items()):
+            if node.path is None:
+                continue
+            children.append(node.path)
+            node.path = None
+            self.count -= 1
+            if not node.children:
+                del parent.children[name]
+        # prune branch which no longer leads to any path
+        for part, node in zip(reversed(parts), reversed(nodes[:-1])):
+            child = node.children[part]
+            if child.path is not None or child.children:
+                break
+            del node.children[part]
+        return children
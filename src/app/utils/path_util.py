@@ -1,22 +1,25 @@
 from __future__ import annotations
 import math
 import os.path
-import subprocess
 import logging
 import typing
 from typing import List, Callable, Tuple, Optional, Dict
 
 from PySide6.QtCore import QDir, QFileInfo, QMimeData, QUrl, Qt, QDirIterator
-from PySide6.QtWidgets import QMessageBox, QApplication, QInputDialog
+from PySide6.QtWidgets import QMessageBox, QApplication, QInputDialog, QDialog
 
 from src.app.gui.dialog.base import select_folder
+from src.app.gui.dialog.bulk_rename import BulkRenameDlg
 from src.app.gui.dialog.sys_path_edit import SysPathDialog
 
 
 from src.app.utils.constant import APP_NAME, Context, DEFAULT_ENCODING
 from src.app.utils.logger import get_console_logger
-from src.app.utils.shell import paste, cut, delete, rename, copy, copy_file, fail, move
-from src.app.utils.thread import run_in_thread
+from src.app.utils import copy_engine, git_repo, shell, trash
+from src.app.utils.bulk_rename import apply_renames, order_renames
+from src.app.utils.shell import paste, cut, rename, fail
+from src.app.utils.jobs import run_job
+from src.app.utils.launcher import Position, launcher, notepad_commands, vs_code_commands
 
 if typing.TYPE_CHECKING:
     from src.app.model.search import LineHit
@@ -55,6 +58,26 @@ def extract_folders(paths: Paths) -> Paths:
     return [extract_path(item=path) for path in paths]
 
 
+def normalize_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def is_sub_path(path: str, root: str) -> bool:
+    path, root = normalize_path(path), normalize_path(root)
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+
+def collapse_roots(paths: Paths, nested: bool = True) -> Paths:
+    roots = []
+    for path in sorted(dict.fromkeys(path for path in paths if path), key=lambda p: len(normalize_path(p))):
+        if nested and any(is_sub_path(path=path, root=root) for root in roots):
+            continue
+        if not nested and any(normalize_path(path) == normalize_path(root) for root in roots):
+            continue
+        roots.append(path)
+    return [path for path in dict.fromkeys(paths) if path in roots]
+
+
 def only_folders(paths: Paths) -> Paths:
     return [path for path in paths if QFileInfo(path).isDir()]
 
@@ -90,20 +113,21 @@ def file_name(path: str) -> str:
     return file.fileName()
 
 
-def file_first_lines(file_path: str, count: int) -> List[str]:
+def file_first_lines(file_path: str, count: int, max_chars: int = None) -> List[str]:
     info = QFileInfo(file_path)
     parts = []
     if not info.isFile():
         fail(f"{file_path} is not a file")
     with open(info.absoluteFilePath(), "r", encoding=DEFAULT_ENCODING) as file:
-        for line_no, line in enumerate(file):
+        lines = file.read(max_chars).splitlines() if max_chars else file
+        for line_no, line in enumerate(lines):
             parts.append(line.rstrip())
             if line_no >= count:
                 break
     return parts
 
 
-def dir_list(path: str) -> List[str]:
+def dir_list(path: str, limit: int = None) -> List[str]:
     info = QFileInfo(path)
     parts = []
     if not info.isDir():
@@ -112,6 +136,9 @@ def dir_list(path: str) -> List[str]:
     while it.hasNext():
         full_path = it.next()
         if it.fileName() not in (".", ".."):
+            if limit is not None and len(parts) >= limit:
+                parts.append("...")
+                break
             parts.append(full_path)
     return parts
 
@@ -179,10 +206,20 @@ def rename_if_exists(parent, path: str, user_is_aware: bool = False) -> Optional
     return path
 
 
+def file_operations(parent):
+    """Module with copy, move and copy_file. Windows shell shows its own dialogs, copy engine reports progress
+    to jobs panel"""
+    return shell if parent.app.shell_file_operations else copy_engine
+
+
+def items_caption(paths: List[str]) -> str:
+    return paths[0] if len(paths) == 1 else f"{len(paths)} items"
+
+
 def cut_items_to_clipboard(parent, path_func: Callable) -> bool:
     is_ok, path = validate_single_path(parent=parent, paths=path_func())
     if is_ok:
-        run_in_thread(parent=parent, target=cut, args=[path], threads=parent.threads)
+        run_job(target=cut, args=[path], caption=f"Cut {path}")
         return True
     return True
 
@@ -201,25 +238,52 @@ def paste_items_from_clipboard(parent, path_func: Callable) -> bool:
     is_ok, path = validate_single_path(parent=parent, paths=path_func())
     if is_ok:
         path = extract_path(item=path)
-        run_in_thread(parent=parent, target=paste, args=[path], threads=parent.threads)
+        run_job(target=paste, args=[path], caption=f"Paste to {path}")
         return True
     return False
 
 
 def delete_items(parent, path_func: Callable) -> bool:
     paths = path_func()
-    modifiers = QApplication.keyboardModifiers()
-    run_in_thread(parent=parent, target=delete, args=[paths, modifiers == Qt.ControlModifier], threads=parent.threads)
+    hard_delete = QApplication.keyboardModifiers() == Qt.ControlModifier
+    if hard_delete and not parent.app.shell_file_operations:
+        # Windows shell confirms permanent delete itself, soft delete can be undone from recycle bin or trash
+        resp = QMessageBox.question(
+            parent, APP_NAME, f"Permanently delete <b>{items_caption(paths)}</b>?<br>It cannot be undone"
+        )
+        if resp != QMessageBox.Yes:
+            return False
+    # hard delete is staged and purged in parallel, cancelled one moves what is left of items back
+    func = shell.delete if hard_delete and parent.app.shell_file_operations else trash.delete
+    run_job(target=func, args=[paths, hard_delete], caption=f"Delete {items_caption(paths)}")
     return True
 
 
 def rename_item(parent, path_func: Callable) -> bool:
-    is_ok, path = validate_single_path(parent=parent, paths=path_func())
+    paths = path_func()
+    if len(paths) > 1:
+        return bulk_rename_items(parent=parent, path_func=lambda: paths)
+    is_ok, path = validate_single_path(parent=parent, paths=paths)
     if is_ok:
         new_path = rename_if_exists(parent=parent, path=path, user_is_aware=True)
         if not new_path:
             return False
-        run_in_thread(parent=parent, target=rename, args=[path, new_path, False], threads=parent.threads)
+        run_job(target=rename, args=[path, new_path, False], caption=f"Rename {path}")
+    return True
+
+
+def bulk_rename_items(parent, path_func: Callable) -> bool:
+    paths = [path for path in path_func() if path]
+    if not paths:
+        return False
+    dialog = BulkRenameDlg(parent=parent, paths=paths)
+    if dialog.exec_() != QDialog.Accepted or not dialog.plan:
+        return False
+    run_job(
+        target=apply_renames,
+        args=[order_renames(renames=dialog.plan.renames)],
+        caption=f"Rename {items_caption(paths)}",
+    )
     return True
 
 
@@ -229,16 +293,8 @@ def duplicate_item(parent, path_func: Callable) -> bool:
         new_path = rename_if_exists(parent=parent, path=path, user_is_aware=True)
         if not new_path:
             return False
-        info = QFileInfo(path)
-        if info.suffix():
-            run_in_thread(parent=parent, target=copy_file, args=[path, new_path, False], threads=parent.threads)
-        else:
-            run_in_thread(
-                parent=parent,
-                target=copy,
-                args=[os.path.join(path, "*.*"), new_path, False],
-                threads=parent.threads,
-            )
+        # new path doesn't exist, so duplicate never overwrites and doesn't need shell dialogs
+        run_job(target=copy_engine.duplicate, args=[path, new_path], caption=f"Duplicate {path}")
         return True
     return False
 
@@ -250,42 +306,21 @@ def copy_move(parent, path_func: Callable, move_flag: bool = True) -> bool:
     caption = action + " to location"
     path = select_folder(parent=parent, text=path, caption=caption)
     if path:
-        func = move if move_flag else copy
-        run_in_thread(
-            parent=parent,
-            target=func,
-            args=[paths, path, False],
-            threads=parent.threads,
-        )
-
-
-def run_command(args: List[str]) -> str:
-    logger.debug(f"cmd {args}")
-    # return subprocess.run(args, stdout=subprocess.PIPE).stdout.decode('utf-8')
-    # return subprocess.check_output(args)
-    #     capture_output=True, shell=True
-    return subprocess.run(args, capture_output=True, shell=True).stdout.decode("utf-8")
-
-
-def get_repo_url(path: str) -> Optional[str]:
-    args = f"cd {path} & git config --get remote.origin.url".split()
-    resp = run_command(args=args)
-    logger.debug(f"{path} repo url {resp}")
-    return resp if resp else None
+        operations = file_operations(parent=parent)
+        func = operations.move if move_flag else operations.copy
+        run_job(target=func, args=[paths, path, False], caption=f"{action} {items_caption(paths)} to {path}")
 
 
-# pylint: disable=consider-using-with
-def exec_item(sys_path: str, args: List[str]):
+def validate_executable(sys_path: str):
     path = QFileInfo(sys_path)
     valid_path = path.exists() and path.isFile() and path.isExecutable()
     if not valid_path:
         raise RuntimeError(f"Invalid path {sys_path}. It is not existing executable file")
-    sys_path = quote_path(text=sys_path)
-    args = [quote_path(text=arg) for arg in args]
-    cmd = [sys_path] + args
-    cmd = " ".join(cmd)
-    logger.debug(f"cmd {cmd}")
-    subprocess.Popen(cmd)
+
+
+def exec_item(sys_path: str, args: List[str]):
+    validate_executable(sys_path=sys_path)
+    launcher().launch(commands=[[sys_path] + args])
 
 
 def open_in_chrome(parent, urls: List[str]) -> bool:
@@ -301,42 +336,37 @@ def go_to_repo(parent, path_func: Callable) -> bool:
     is_ok, path = validate_single_path(parent=parent, paths=path_func())
     if is_ok:
         path = extract_path(item=path)
-        url = get_repo_url(path=path)
+        url = git_repo.remote_url(path=path)
         if url:
             open_in_chrome(parent=parent, urls=[url])
             return True
     return False
 
 
+def hit_positions(line_func: Callable[[], Dict[str, LineHit]] | None) -> Dict[str, Position]:
+    if not line_func:
+        return {}
+    return {
+        path: (line_hit.line_number, line_hit.column_number())
+        for path, line_hit in line_func().items()
+        if line_hit.line_number is not None
+    }
+
+
 def view_item(parent, path_func: Callable, line_func: Callable[[], Dict[str, LineHit]] | None = None) -> bool:
     if not parent.app.sys_paths.vs_code.path:
         SysPathDialog.exec(parent=parent, sys_paths=parent.app.sys_paths)
     paths = path_func()
-    if line_func:
-        path_hits = line_func()
-        for path in paths:
-            if path in path_hits:
-                line_hit = path_hits[path]
-                cmd = path
-                if line_hit.line_number is not None:
-                    cmd = f"{cmd}:{str(line_hit.line_number)}"
-                    if line_hit.column_number() is not None:
-                        cmd = f"{cmd}:{str(line_hit.column_number())}"
-                args = ["-g"] + [cmd]
-            else:
-                args = [path]
-            exec_item(sys_path=parent.app.sys_paths.vs_code.path, args=args)
-        return True
-    if paths and parent.app.sys_paths.vs_code.path:
-        files = only_files(paths=paths)
-        if paths != files:
-            paths = ["-n"] + paths
-        exec_item(sys_path=parent.app.sys_paths.vs_code.path, args=paths)
+    vs_code = parent.app.sys_paths.vs_code.path
+    if paths and vs_code:
+        validate_executable(sys_path=vs_code)
+        launcher().launch(
+            commands=vs_code_commands(program=vs_code, paths=paths, positions=hit_positions(line_func=line_func))
+        )
         return True
     return False
 
 
-# pylint: disable=too-many-nested-blocks
 def edit_item(parent, path_func: Callable, line_func: Callable[[], Dict[str, LineHit]] | None = None) -> bool:
     if not parent.app.sys_paths.notepad.path or not parent.app.sys_paths.vs_code.path:
         logger.info(f"sys paths before edit {parent.app.sys_paths}")
@@ -345,29 +375,24 @@ def edit_item(parent, path_func: Callable, line_func: Callable[[], Dict[str, Lin
     folders = only_folders(paths=paths)
     files = only_files(paths=paths)
     logger.debug(f"folders {folders} files {files}")
-    if parent.app.sys_paths.vs_code.path and parent.app.sys_paths.notepad.path:
+    vs_code, notepad = parent.app.sys_paths.vs_code.path, parent.app.sys_paths.notepad.path
+    if vs_code and notepad:
+        commands = []
         if folders:
-            exec_item(sys_path=parent.app.sys_paths.vs_code.path, args=["-n"] + folders)
+            validate_executable(sys_path=vs_code)
+            commands.extend(vs_code_commands(program=vs_code, paths=folders, positions={}))
         if files:
-            path_hits = line_func()
-            for file in files:
-                if file in path_hits:
-                    line_hit = path_hits[file]
-                    cmd = file
-                    if line_hit.line_number is not None:
-                        cmd = f"-n{str(line_hit.line_number)} {cmd}"
-                        if line_hit.column_number() is not None:
-                            cmd = f"-c{str(line_hit.column_number())} {cmd}"
-                    args = [cmd]
-                else:
-                    args = [file]
-                exec_item(sys_path=parent.app.sys_paths.notepad.path, args=args)
+            validate_executable(sys_path=notepad)
+            commands.extend(
+                notepad_commands(program=notepad, files=files, positions=hit_positions(line_func=line_func))
+            )
+        launcher().launch(commands=commands)
         return True
     return False
 
 
 def go_to_item(parent, path_func: Callable, context_func: Callable) -> bool:
-    if context_func() == Context.search:
+    if context_func() in (Context.search, Context.quick_open):
         paths, is_ok = path_func(), True
     else:
         paths = path_func(show_info=False)
@@ -396,8 +421,21 @@ def go_to_item(parent, path_func: Callable, context_func: Callable) -> bool:
     return False
 
 
+def quick_open(parent, path_func: Callable) -> bool:
+    current_tree = parent.current_tree()
+    paths = path_func(show_info=False)
+    root = current_tree.pinned_path if current_tree else None
+    if not root and paths:
+        root = extract_path(item=paths[0])
+    if not root:
+        QMessageBox.information(parent, APP_NAME, "Pin a folder or select a path to open files from")
+        return False
+    parent.quick_open_dlg.open_root(root=root)
+    return True
+
+
 def search_in_path(parent, path_func: Callable):
     if paths := path_func():
         parent.search_dlg.show()
-        for path in extract_folders(paths=paths):
-            parent.search_dlg.search_control.add_search_panel(path=path)
+        roots = collapse_roots(paths=extract_folders(paths=paths))
+        parent.search_dlg.search_control.add_search_panel(path=";".join(roots))
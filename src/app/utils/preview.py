@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, NamedTuple, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from src.app.utils.logger import get_console_logger
+from src.app.utils.path_util import file_first_lines, dir_list
+from src.app.utils.scheduler import io_scheduler
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+PREVIEW_CACHE_SIZE = 256
+PREVIEW_LINES = 20
+PREVIEW_MAX_CHARS = 64 * 1024
+PREVIEW_DIR_LIMIT = 200
+PREVIEW_PLACEHOLDER = "Loading preview..."
+
+
+class PreviewKey(NamedTuple):
+    path: str
+    last_modified: int
+    is_dir: bool
+
+
+class PreviewCache:
+    """Thread safe LRU of preview texts"""
+
+    def __init__(self, max_size: int = PREVIEW_CACHE_SIZE):
+        self.max_size = max_size
+        self._items: OrderedDict[PreviewKey, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key: PreviewKey) -> Optional[str]:
+        with self._lock:
+            text = self._items.get(key)
+            if text is not None:
+                self._items.move_to_end(key)
+            return text
+
+    def put(self, key: PreviewKey, text: str):
+        with self._lock:
+            self._items[key] = text
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+
+def load_preview(key: PreviewKey) -> str:
+    try:
+        if key.is_dir:
+            parts = dir_list(path=key.path, limit=PREVIEW_DIR_LIMIT)
+        else:
+            parts = file_first_lines(file_path=key.path, count=PREVIEW_LINES, max_chars=PREVIEW_MAX_CHARS)
+    except (RuntimeError, OSError) as e:
+        parts = [str(e)]
+    return "\n".join(parts)
+
+
+class PreviewLoader(QObject):
+    """Computes tooltip previews in background thread. Most recent requests are served first"""
+
+    ready = Signal(str)
+
+    def __init__(self, cache_size: int = PREVIEW_CACHE_SIZE, max_pending: int = 8):
+        super().__init__()
+        self.cache = PreviewCache(max_size=cache_size)
+        self._requests: Deque[PreviewKey] = deque(maxlen=max_pending)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._io_lane = io_scheduler().lane(name="previews", limit=1)
+
+    def preview(self, key: PreviewKey) -> Optional[str]:
+        text = self.cache.get(key=key)
+        if text is None:
+            self.request(key=key)
+        return text
+
+    def request(self, key: PreviewKey):
+        with self._condition:
+            if key in self._requests:
+                return
+            self._requests.append(key)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="preview loader", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._requests:
+                    self._condition.wait()
+                key = self._requests.pop()
+            if self.cache.get(key=key) is not None:
+                continue
+            with self._io_lane.slot():
+                text = load_preview(key=key)
+            self.cache.put(key=key, text=text)
+            logger.debug(f"preview of {key.path} ready")
+            self.ready.emit(key.path)
+
+
+_preview_loader: Optional[PreviewLoader] = None
+
+
+def preview_loader() -> PreviewLoader:
+    global _preview_loader  # pylint: disable=global-statement
+    if _preview_loader is None:
+        _preview_loader = PreviewLoader()
+    return _preview_loader
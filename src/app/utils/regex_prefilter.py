@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import logging
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+# parser of re is public only as deprecated sre_parse module, since Python 3.11 it is private re._parser
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse  # pylint: disable=deprecated-module
+    import sre_constants  # pylint: disable=deprecated-module
+
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+LATIN_1_MAX = "\xff"
+# opcodes are created at runtime so they are looked up by name once
+LITERAL = getattr(sre_constants, "LITERAL")
+SUBPATTERN = getattr(sre_constants, "SUBPATTERN")
+# possessive repeats and atomic groups are parsed since Python 3.11
+REPEATS = tuple(
+    op
+    for op in (getattr(sre_constants, name, None) for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"))
+    if op is not None
+)
+ATOMIC_GROUP = getattr(sre_constants, "ATOMIC_GROUP", None)
+
+
+class LiteralPrefilter:
+    """Substring test for literals every match of a regular expression has to contain.
+    Texts failing the test cannot match so regex engine doesn't have to run on them"""
+
+    def __init__(self, literals: Tuple[str, ...], ignore_case: bool):
+        self.ignore_case = ignore_case
+        self.literals = tuple(literal.lower() for literal in literals) if ignore_case else literals
+
+    def __bool__(self):
+        return bool(self.literals)
+
+    def might_match(self, text: str) -> bool:
+        if not self.literals:
+            return True
+        if self.ignore_case:
+            # case folding of re.IGNORECASE equals str.lower only within latin-1
+            if not text.isascii() and max(text) > LATIN_1_MAX:
+                return True
+            text = text.lower()
+        return all(literal in text for literal in self.literals)
+
+
+def sequence_literals(items: sre_parse.SubPattern, ignore_case: bool) -> List[str]:
+    literals = []
+    run = []
+
+    def close_run():
+        if run:
+            literals.append("".join(run))
+            run.clear()
+
+    for op, av in items:
+        if op is LITERAL and (not ignore_case or chr(av) <= LATIN_1_MAX):
+            run.append(chr(av))
+            continue
+        close_run()
+        if op is SUBPATTERN:
+            _, add_flags, del_flags, sub_items = av
+            if not add_flags and not del_flags:
+                literals.extend(sequence_literals(items=sub_items, ignore_case=ignore_case))
+        elif op in REPEATS:
+            min_count, _, sub_items = av
+            if min_count >= 1:
+                literals.extend(sequence_literals(items=sub_items, ignore_case=ignore_case))
+        elif ATOMIC_GROUP is not None and op is ATOMIC_GROUP:
+            literals.extend(sequence_literals(items=av, ignore_case=ignore_case))
+    close_run()
+    return literals
+
+
+@lru_cache(maxsize=64)
+def required_literals(pattern: str, flags: int = 0) -> LiteralPrefilter:
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error as e:
+        logger.debug(f"Cannot analyse pattern {pattern} {e}")
+        return LiteralPrefilter(literals=(), ignore_case=False)
+    ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+    literals = sorted(dict.fromkeys(sequence_literals(items=parsed, ignore_case=ignore_case)), key=len, reverse=True)
+    return LiteralPrefilter(literals=tuple(literals), ignore_case=ignore_case)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import re
+import stat
+from typing import Callable, Iterator, List, NamedTuple, Optional, Sequence
+
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+DEFAULT_BATCH_SIZE = 1000
+FIRST_BATCH_SIZE = 50
+FILE_ATTRIBUTE_HIDDEN = 0x2
+
+
+class ScanEntry(NamedTuple):
+    name: str
+    is_dir: bool
+    hidden: bool
+    system: bool
+    size: int
+    modified: float
+
+
+class ScanOptions(NamedTuple):
+    files: bool = True
+    hidden: bool = False
+    system: bool = False
+    name_filters: Sequence[str] = ()
+
+
+def name_filter_pattern(name_filters: Sequence[str]) -> Optional[re.Pattern]:
+    patterns = [pattern.strip() for pattern in name_filters if pattern.strip() and pattern.strip() != "*"]
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns), re.IGNORECASE)
+
+
+def is_hidden(name: str, attributes: int) -> bool:
+    if os.name == "nt":
+        return bool(attributes & FILE_ATTRIBUTE_HIDDEN)
+    return name.startswith(".")
+
+
+def is_system(mode: int) -> bool:
+    # same meaning as in QFileSystemModel - neither regular file nor directory (device, pipe, socket)
+    return not (stat.S_ISDIR(mode) or stat.S_ISREG(mode))
+
+
+def scan_entry(entry: os.DirEntry, options: ScanOptions, pattern: Optional[re.Pattern]) -> Optional[ScanEntry]:
+    try:
+        is_dir = entry.is_dir()
+        entry_stat = entry.stat()
+    except OSError:
+        return None
+    attributes = getattr(entry_stat, "st_file_attributes", 0)
+    hidden = is_hidden(name=entry.name, attributes=attributes)
+    if hidden and not options.hidden:
+        return None
+    system = is_system(mode=entry_stat.st_mode)
+    if system and not options.system:
+        return None
+    if not is_dir and (not options.files or (pattern and not pattern.match(entry.name))):
+        return None
+    return ScanEntry(
+        name=entry.name,
+        is_dir=is_dir,
+        hidden=hidden,
+        system=system,
+        size=0 if is_dir else entry_stat.st_size,
+        modified=entry_stat.st_mtime,
+    )
+
+
+def scan_dir(
+    path: str,
+    options: ScanOptions = ScanOptions(),
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    is_cancelled: Callable[[], bool] = None,
+) -> Iterator[List[ScanEntry]]:
+    """Lists directory in batches so that consumer can show first entries before whole directory is read.
+    Batches grow from FIRST_BATCH_SIZE up to batch_size"""
+    pattern = name_filter_pattern(name_filters=options.name_filters)
+    batch = []
+    size = min(FIRST_BATCH_SIZE, batch_size)
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if scanned := scan_entry(entry=entry, options=options, pattern=pattern):
+                    batch.append(scanned)
+                if len(batch) >= size:
+                    yield batch
+                    batch = []
+                    size = min(size * 2, batch_size)
+                    if is_cancelled and is_cancelled():
+                        return
+    except OSError as e:
+        logger.debug(f"Cannot list {path} {e}")
+    if batch:
+        yield batch
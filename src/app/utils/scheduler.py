@@ -0,0 +1,106 @@
+import logging
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterator, Optional
+
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+
+class IOLane:
+    """Queue of I/O requests of a single client (search, file job) served by IOScheduler"""
+
+    def __init__(self, scheduler: "IOScheduler", name: str, limit: int):
+        self.scheduler = scheduler
+        self.name = name
+        self.limit = limit
+        self.pending = 0
+        self.granted = 0
+        self.active = 0
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.scheduler.acquire(lane=self)
+        try:
+            yield
+        finally:
+            self.scheduler.release(lane=self)
+
+    def __repr__(self) -> str:
+        return f"IOLane({self.name}, pending={self.pending}, active={self.active})"
+
+
+class IOScheduler:
+    """Bounds number of concurrent I/O operations in the process.
+    Free slots are granted to waiting lanes in round-robin order"""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._condition = threading.Condition()
+        self._rotation: Deque[IOLane] = deque()
+        self._active = 0
+
+    @property
+    def active(self) -> int:
+        with self._condition:
+            return self._active
+
+    def lane(self, name: str, limit: Optional[int] = None, reserve: int = 0) -> IOLane:
+        """Lane with reserve leaves that many slots to other lanes. Scheduler with fewer workers is extended,
+        so that reserved slots are always available"""
+        if reserve:
+            with self._condition:
+                self.max_workers = max(self.max_workers, reserve + 1)
+        max_limit = self.max_workers - reserve
+        return IOLane(scheduler=self, name=name, limit=min(limit or max_limit, max_limit))
+
+    def acquire(self, lane: IOLane):
+        with self._condition:
+            lane.pending += 1
+            if lane not in self._rotation:
+                self._rotation.append(lane)
+            self._dispatch()
+            while not lane.granted:
+                self._condition.wait()
+            lane.granted -= 1
+
+    def release(self, lane: IOLane):
+        with self._condition:
+            lane.active -= 1
+            self._active -= 1
+            self._dispatch()
+
+    def _dispatch(self):
+        skipped = 0
+        while self._rotation and self._active < self.max_workers and skipped < len(self._rotation):
+            lane = self._rotation.popleft()
+            if lane.active >= lane.limit:
+                self._rotation.append(lane)
+                skipped += 1
+                continue
+            lane.pending -= 1
+            lane.granted += 1
+            lane.active += 1
+            self._active += 1
+            skipped = 0
+            if lane.pending:
+                self._rotation.append(lane)
+            logger.debug(f"slot granted to {lane}")
+        self._condition.notify_all()
+
+
+_io_scheduler: Optional[IOScheduler] = None
+_io_scheduler_lock = threading.Lock()
+
+
+def io_scheduler() -> IOScheduler:
+    global _io_scheduler  # pylint: disable=global-statement
+    with _io_scheduler_lock:
+        if _io_scheduler is None:
+            _io_scheduler = IOScheduler()
+        return _io_scheduler
@@ -1,14 +1,22 @@
 import logging
 import re
-from typing import Iterator, List, Union
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Iterator, List, Optional, Union, Set, Tuple
 
 from PySide6.QtCore import QDirIterator, QDir, QFileInfo
 
 from src.app.model.search import FileSearchResult, SearchParam
+from src.app.utils.aho_corasick import Automaton, TermMatch
 from src.app.utils.logger import get_console_logger
+from src.app.utils.path_util import normalize_path
+from src.app.utils.regex_prefilter import required_literals
+from src.app.utils.scheduler import IOLane
 
 logger = get_console_logger(name=__name__, log_level=logging.ERROR)
 
+DIR_BATCH_SIZE = 256
+
 
 def find_keyword(
     search_param: SearchParam,
@@ -18,11 +26,26 @@ def find_keyword(
     flag = re.IGNORECASE if search_param.ignore_case else 0
     esc_word = search_param.keyword if search_param.reg_exp else re.escape(search_param.keyword)
     pattern = r"\b" + esc_word + r"\b" if search_param.whole_words else r"" + esc_word + r""
+    if not required_literals(pattern=pattern, flags=flag).might_match(text=text):
+        return None if find_first else iter(())
     if find_first:
         return re.search(pattern=pattern, string=text, flags=flag)
     return re.finditer(pattern=pattern, string=text, flags=flag)
 
 
+@lru_cache(maxsize=8)
+def keyword_automaton(keywords: Tuple[str, ...], ignore_case: bool) -> Automaton:
+    return Automaton(keywords=keywords, ignore_case=ignore_case)
+
+
+def find_keywords(search_param: SearchParam, text: str) -> List[TermMatch]:
+    automaton = keyword_automaton(keywords=tuple(search_param.keyword_list()), ignore_case=search_param.ignore_case)
+    hits = list(automaton.finditer(text=text, whole_words=search_param.whole_words))
+    if search_param.all_keywords and len({hit.term for hit in hits}) < len(automaton.keywords):
+        return []
+    return hits
+
+
 def search_file(
     search_param: SearchParam, text_lines: Union[List[str], str], search_result: FileSearchResult
 ) -> FileSearchResult:
@@ -33,7 +56,9 @@ def search_file(
         search_result.error = text_lines
     else:
         text = "".join(text_lines)
-        if has_hits(data=text):
+        if search_param.multiple_keywords:
+            search_result.hits = find_keywords(search_param=search_param, text=text) or None
+        elif has_hits(data=text):
             search_result.hits = list(find_keyword(search_param=search_param, text=text))
     return search_result
 
@@ -49,19 +74,40 @@ def is_in_excluded_dirs(file_info: QFileInfo, excluded_dirs: List[str]):
     return False
 
 
+def dir_entries(it: QDirIterator, io_lane: Optional[IOLane] = None) -> Iterator[Tuple[str, QFileInfo]]:
+    """Reads entries of iterator in batches. Every batch is read in one slot of I/O lane, so that directory walk
+    is bounded together with other I/O of the process"""
+    while True:
+        with io_lane.slot() if io_lane else nullcontext():
+            batch = []
+            while len(batch) < DIR_BATCH_SIZE and it.hasNext():
+                file_name = it.next()
+                batch.append((file_name, it.fileInfo()))
+        if not batch:
+            return
+        yield from batch
+
+
 def search(
     search_param: SearchParam,
     filters: QDir.Filters = QDir.AllEntries | QDir.NoSymLinks | QDir.Dirs | QDir.NoDotAndDotDot,  # | QDir.DirsFirst,
+    io_lane: Optional[IOLane] = None,
 ) -> Iterator[FileSearchResult]:
     flags = QDirIterator.Subdirectories if search_param.subdirectories else QDirIterator.NoIteratorFlags
-    it = QDirIterator(search_param.path, search_param.name_filters, filters, flags)
-    while it.hasNext():
-        file_name = it.next()
-        file_info = QFileInfo(file_name)
-        if is_in_excluded_dirs(file_info=file_info, excluded_dirs=search_param.excluded_dirs):
-            continue
-        yield FileSearchResult(
-            keyword=search_param.keyword,
-            file_name=file_name,
-            is_dir=file_info.isDir(),
-        )
+    roots = search_param.search_paths()
+    visited: Set[str] = set()
+    for root in roots:
+        it = QDirIterator(root, search_param.name_filters, filters, flags)
+        for file_name, file_info in dir_entries(it=it, io_lane=io_lane):
+            if is_in_excluded_dirs(file_info=file_info, excluded_dirs=search_param.excluded_dirs):
+                continue
+            if len(roots) > 1:
+                key = normalize_path(file_name)
+                if key in visited:
+                    continue
+                visited.add(key)
+            yield FileSearchResult(
+                keyword=search_param.keyword,
+                file_name=file_name,
+                is_dir=file_info.isDir(),
+            )
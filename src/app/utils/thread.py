@@ -1,9 +1,8 @@
 import logging
 from threading import Thread
-from typing import Callable, Sequence, List, NamedTuple
+from typing import Callable, Sequence, NamedTuple
 
-from PySide6.QtCore import QObject, Signal, QThread
-from PySide6.QtWidgets import QMessageBox
+from PySide6.QtCore import QObject, QThread
 
 from src.app.utils.logger import get_console_logger, get_file_handler
 
@@ -32,54 +31,6 @@ class ShellThread(Thread):
             logger.error(str(e))
 
 
-class ShellWorker(QObject):
-    exception = Signal(str)
-    finished = Signal()
-
-    def __init__(self, parent, target: Callable, args: Sequence):
-        super().__init__()
-        self.parent = parent
-        self.target = target
-        self.args = args
-
-    def run(self):
-        try:
-            logger.debug(f"Executing {self.target} with args {self.args}")
-            self.target(*self.args)
-        except Exception as e:
-            logger.error(str(e))
-            self.exception.emit(str(e))
-        finally:
-            self.finished.emit()
-
-
 class ThreadWithWorker(NamedTuple):
     thread: QThread
-    worker: ShellWorker
-
-
-def run_in_thread(parent, target: Callable, args: Sequence, threads: List[ThreadWithWorker]) -> None:
-    def on_finish(tww: ThreadWithWorker):
-        def finalize():
-            logger.debug(f"count {len(threads)}")
-            logger.debug(f"finishing {id(tww)}")
-            parent.remove_thread(thread_with_worker=tww)
-            tww.thread.deleteLater()
-            logger.debug("cleanup done")
-
-        return finalize
-
-    logger.debug(f"run_in_thread {type(parent)}")
-    thread = QThread()
-    worker = ShellWorker(parent=parent, target=target, args=args)
-    thread_with_worker = ThreadWithWorker(thread=thread, worker=worker)
-    threads.append(thread_with_worker)
-    worker.moveToThread(thread)
-    thread.started.connect(worker.run)
-    worker.finished.connect(thread.quit)
-    worker.finished.connect(worker.deleteLater)
-    thread.finished.connect(on_finish(tww=thread_with_worker))
-    worker.exception.connect(lambda exc: QMessageBox.critical(parent, "Exception in background thread", exc))
-    # Start the thread
-    logger.debug(f"Starting thread {thread} with worker {worker}")
-    thread.start()
+    worker: QObject
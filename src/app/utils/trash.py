@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from src.app.utils.copy_engine import CopyProgress, Sources, entry_is_junction, expand_sources, is_junction
+from src.app.utils.jobs import JobCancelled
+from src.app.utils.logger import get_console_logger
+
+logger = get_console_logger(name=__name__, log_level=logging.ERROR)
+
+STAGING_DIR = ".file_system_deleting"
+STAGED_PREFIX = "delete-"
+# staged folder which nobody touched for this long was left by interrupted delete
+STALE_STAGED_AGE = 3600
+DELETE_WORKERS = 8
+
+
+def mount_point(path: str) -> str:
+    path = os.path.abspath(path)
+    while not os.path.ismount(path) and (parent := os.path.dirname(path)) != path:
+        path = parent
+    return path
+
+
+def staging_dirs(path: str) -> List[str]:
+    """Candidate staging folders on the same volume as path. Root of volume is preferred
+    so that staging folder doesn't show up among user's files"""
+    parent = os.path.dirname(os.path.abspath(path))
+    dirs = [os.path.join(mount_point(path=parent), STAGING_DIR), os.path.join(parent, STAGING_DIR)]
+    return list(dict.fromkeys(dirs))
+
+
+def stage(path: str, index: int, staged: List[str]) -> Optional[str]:
+    """Renames path into staging folder of its volume. Rename is atomic and instant regardless of size
+    of the item, so the item disappears from views immediately. None if item can't be staged"""
+    for staging_dir in staging_dirs(path=path):
+        try:
+            os.makedirs(staging_dir, exist_ok=True)
+            target_dir = next((folder for folder in staged if os.path.dirname(folder) == staging_dir), None)
+            if target_dir is None:
+                target_dir = tempfile.mkdtemp(prefix=STAGED_PREFIX, dir=staging_dir)
+                staged.append(target_dir)
+            target = os.path.join(target_dir, f"{index}-{os.path.basename(path)}")
+            os.rename(path, target)
+            return target
+        except OSError as e:
+            if e.errno == errno.ENOENT and not os.path.lexists(path):
+                raise
+            logger.debug(f"Cannot stage {path} in {staging_dir} {e}")
+    return None
+
+
+def stale_staged(staging_dir: str) -> List[str]:
+    try:
+        with os.scandir(staging_dir) as it:
+            return [
+                entry.path
+                for entry in it
+                if entry.name.startswith(STAGED_PREFIX)
+                and time.time() - entry.stat(follow_symlinks=False).st_mtime > STALE_STAGED_AGE
+            ]
+    except OSError:
+        return []
+
+
+def list_tree(path: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """Files with sizes and folders of tree, folders are listed parents first.
+    Junctions are listed as empty folders, removing them doesn't touch folders they point to"""
+    if is_junction(path=path):
+        return [], [path]
+    if os.path.islink(path) or not os.path.isdir(path):
+        return [(path, os.lstat(path).st_size)], []
+    files: List[Tuple[str, int]] = []
+    dirs = [path]
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                        if not entry_is_junction(entry=entry):
+                            stack.append(entry.path)
+                    else:
+                        files.append((entry.path, entry.stat(follow_symlinks=False).st_size))
+        except FileNotFoundError:
+            continue
+    return files, dirs
+
+
+def remove_files(files: Iterator[Tuple[str, int]], lock: threading.Lock, progress: CopyProgress):
+    """Unlinks files taken from iterator shared by all workers until it is exhausted"""
+    while True:
+        with lock:
+            item = next(files, None)
+        if item is None:
+            return
+        path, size = item
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except PermissionError:
+            # read only files can't be removed on Windows
+            os.chmod(path, 0o777)
+            os.unlink(path)
+        progress.add(count=size)
+        progress.check_cancelled()
+
+
+def purge(paths: List[str], workers: int = DELETE_WORKERS):
+    """Removes trees in parallel, files first and then folders deepest first"""
+    progress = CopyProgress()
+    files: List[Tuple[str, int]] = []
+    dirs: List[str] = []
+    for path in paths:
+        progress.check_cancelled()
+        try:
+            tree_files, tree_dirs = list_tree(path=path)
+        except FileNotFoundError:
+            continue
+        files.extend(tree_files)
+        dirs.extend(tree_dirs)
+    progress.total = sum(size for _, size in files)
+    files_iterator = iter(files)
+    lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="delete") as executor:
+        futures = [executor.submit(remove_files, files_iterator, lock, progress) for _ in range(workers)]
+        for future in futures:
+            future.result()
+    for folder in reversed(dirs):
+        try:
+            os.rmdir(folder)
+        except FileNotFoundError:
+            pass
+
+
+def restore(moves: List[Tuple[str, str]], staged: List[str]):
+    """Moves what is left of staged items back after cancelled delete, so it isn't purged later as stale"""
+    for path, target in moves:
+        try:
+            if os.path.lexists(target) and not os.path.lexists(path):
+                os.rename(target, path)
+        except OSError as e:
+            logger.error(f"Cannot restore {path} from {target} {e}")
+    for folder in staged:
+        for empty_dir in (folder, os.path.dirname(folder)):
+            try:
+                os.rmdir(empty_dir)
+            except OSError:
+                # not empty or used by other delete
+                pass
+
+
+def trash_dir(path: str) -> str:
+    """Freedesktop trash of the volume of path"""
+    home_trash = os.path.join(os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share"), "Trash")
+    os.makedirs(home_trash, exist_ok=True)
+    if os.lstat(path).st_dev == os.stat(home_trash).st_dev:
+        return home_trash
+    return os.path.join(mount_point(path=path), f".Trash-{os.getuid()}")
+
+
+def move_to_trash(path: str):
+    """Moves item to freedesktop trash so that it can be restored by file managers"""
+    trash = trash_dir(path=path)
+    os.makedirs(os.path.join(trash, "files"), exist_ok=True)
+    os.makedirs(os.path.join(trash, "info"), exist_ok=True)
+    name = os.path.basename(path)
+    number = 1
+    while True:
+        info_file = os.path.join(trash, "info", f"{name}.trashinfo")
+        try:
+            fd = os.open(info_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            break
+        except FileExistsError:
+            number += 1
+            name = f"{os.path.basename(path)}({number})"
+    with os.fdopen(fd, "w", encoding="utf-8") as info:
+        info.write(
+            f"[Trash Info]\nPath={quote(os.path.abspath(path))}\n"
+            f"DeletionDate={datetime.now().strftime('%Y-%m-%dT%H:%M:%S')}\n"
+        )
+    try:
+        os.rename(path, os.path.join(trash, "files", name))
+    except OSError:
+        os.remove(info_file)
+        raise
+
+
+def delete(src: Sources, hard_delete: bool) -> bool:
+    """
+    Delete files and directories without blocking on large trees.
+
+    :param src: Path or a list of paths to delete. Filename portion of a path
+                can contain wildcards ``*`` and ``?``.
+    :param hard_delete: if true then items are removed for good, otherwise they are moved to recycle bin
+                        (Windows) or trash (freedesktop)
+    :returns: ``True`` if the operation completed successfully.
+    :raises: ``OSError`` if anything went wrong, ``JobCancelled`` if job was cancelled.
+    """
+    sources = expand_sources(src)
+    if not hard_delete:
+        if os.name == "nt":
+            # recycle bin is available through shell only
+            from src.app.utils.shell import delete as shell_delete  # pylint: disable=import-outside-toplevel
+
+            return shell_delete(sources, False)
+        for path in sources:
+            move_to_trash(path=path)
+        return True
+    staged: List[str] = []
+    moves: List[Tuple[str, str]] = []
+    in_place = []
+    for index, path in enumerate(sources):
+        if (target := stage(path=path, index=index, staged=staged)) is None:
+            in_place.append(path)
+        else:
+            moves.append((path, target))
+    leftovers = [path for folder in dict.fromkeys(map(os.path.dirname, staged)) for path in stale_staged(folder)]
+    try:
+        purge(paths=in_place + staged + [path for path in leftovers if path not in staged])
+    except JobCancelled:
+        restore(moves=moves, staged=staged)
+        raise
+    for staging_dir in dict.fromkeys(map(os.path.dirname, staged)):
+        try:
+            os.rmdir(staging_dir)
+        except OSError:
+            # used by other delete
+            pass
+    return True
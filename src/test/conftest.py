@@ -1,3 +1,5 @@
+import logging
+
 import pytest
 
 from src.app.model.favorite import Favorite, Favorites
@@ -21,3 +23,13 @@ def empty_favorites() -> Favorites:
 @pytest.fixture
 def one_item_favorites(favorite1) -> Favorites:
     return Favorites(items=[favorite1], selected=favorite1)
+
+
+@pytest.fixture(autouse=True)
+def no_log_file():
+    """App modules log to file_system.log in working folder, tests log only to console"""
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(logger, logging.Logger):
+            for handler in [handler for handler in logger.handlers if isinstance(handler, logging.FileHandler)]:
+                logger.removeHandler(handler)
+                handler.close()
@@ -1,3 +1,6 @@
+from src.app.model.favorite import Favorite
+
+
 def test_create_item_from_empty(empty_favorites, favorite2):
     empty_favorites.create_item(new_favorite=favorite2)
     assert len(empty_favorites.items) == 1
@@ -28,3 +31,46 @@ def test_delete_item_from_one_item(empty_favorites, favorite1, favorite2):
     empty_favorites.delete_item(current_favorite=favorite2)
     assert len(empty_favorites.items) == 1
     assert empty_favorites.items[0] == favorite1
+
+
+def test_remove_paths(empty_favorites, favorite1, favorite2):
+    empty_favorites.create_item(new_favorite=favorite1)
+    empty_favorites.create_item(current_favorite=favorite1, new_favorite=favorite2)
+    assert empty_favorites.remove_paths(paths={favorite2.path}) == [favorite2.path]
+    assert empty_favorites.items == [favorite1]
+    assert not favorite1.children
+
+
+def test_listener_gets_incremental_changes(empty_favorites):
+    events = []
+
+    class Listener:
+        def on_favorite_inserted(self, parent, favorite, row):
+            events.append(("inserted", parent.name if parent else None, favorite.name, row))
+
+        def on_favorite_updated(self, favorite):
+            events.append(("updated", favorite.name))
+
+        def on_favorite_removed(self, parent, favorite, row):
+            events.append(("removed", parent.name if parent else None, favorite.name, row))
+
+    empty_favorites.subscribe(listener=Listener())
+    b, a = Favorite(name="b", path="b"), Favorite(name="a", path="a")
+    empty_favorites.create_item(new_favorite=b)
+    empty_favorites.create_item(new_favorite=a)
+    empty_favorites.create_item(current_favorite=b, new_favorite=Favorite(name="child", path="a"))
+    empty_favorites.modify_item(current_favorite=a, new_favorite=Favorite(name="a", description="x", path="c"))
+    empty_favorites.modify_item(current_favorite=a, new_favorite=Favorite(name="c", path="c"))
+    assert [favorite.name for favorite in empty_favorites.items] == ["b", "c"]
+    assert [favorite.name for favorite in empty_favorites.find_by_path(path="a")] == ["child"]
+    assert empty_favorites.remove_paths(paths={"b"}) == ["b"]
+    assert empty_favorites.paths() == ["c"]
+    assert events == [
+        ("inserted", None, "b", 0),
+        ("inserted", None, "a", 0),
+        ("inserted", "b", "child", 0),
+        ("updated", "a"),
+        ("removed", None, "c", 0),
+        ("inserted", None, "c", 1),
+        ("removed", None, "b", 0),
+    ]
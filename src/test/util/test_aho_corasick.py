@@ -0,0 +1,20 @@
+from src.app.utils.aho_corasick import Automaton
+
+
+def test_finds_overlapping_keywords():
+    automaton = Automaton(keywords=["he", "she", "his", "hers"])
+    found = [(match.term, match.span()) for match in automaton.finditer(text="ushers")]
+    assert found == [("she", (1, 4)), ("he", (2, 4)), ("hers", (2, 6))]
+
+
+def test_ignore_case_and_whole_words():
+    text = "Select name FROM selection"
+    assert Automaton(keywords=["SELECT"], ignore_case=False).search(text=text) is None
+    automaton = Automaton(keywords=["select", "from"])
+    assert [match.span() for match in automaton.finditer(text=text)] == [(0, 6), (12, 16), (17, 23)]
+    assert [match.span() for match in automaton.finditer(text=text, whole_words=True)] == [(0, 6), (12, 16)]
+    assert automaton.matched_terms(text=text) == ["select", "from"]
+
+
+def test_no_keywords():
+    assert Automaton(keywords=["", ""]).search(text="text") is None
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from src.app.utils.bulk_rename import FolderNames, RenameRule, plan_renames, order_renames, apply_renames
+
+
+def test_plan_detects_conflicts():
+    paths = ["/d/IMG_1.jpg", "/d/IMG_2.jpg", "/d/IMG_3.png", "/d/notes.txt"]
+    existing = {"/d/photo_3.png"}
+    plan = plan_renames(
+        paths=paths,
+        rule=RenameRule(pattern=r"^IMG_(\d)\.\w+$", replacement=r"photo_\1.png"),
+        exists=lambda path: path in existing or path in paths,
+    )
+    assert plan.names["/d/IMG_1.jpg"] == "/d/photo_1.png"
+    assert plan.conflicts == {"/d/IMG_3.png": "Already exists"}
+    assert plan.renames == [("/d/IMG_1.jpg", "/d/photo_1.png"), ("/d/IMG_2.jpg", "/d/photo_2.png")]
+    assert not plan
+
+    plan = plan_renames(paths=paths, rule=RenameRule(pattern="", replacement="x{ext}", regex=False))
+    assert plan.conflicts["/d/IMG_1.jpg"].startswith("Same new name")
+    assert plan.conflicts["/d/IMG_2.jpg"].startswith("Same new name")
+    plan = plan_renames(
+        paths=paths, rule=RenameRule(pattern="", replacement="{parent}_{n:03}{ext}", regex=False, start=0)
+    )
+    assert plan.names["/d/notes.txt"] == "/d/d_003.txt"
+    with pytest.raises(ValueError):
+        RenameRule(pattern="", replacement="{unknown}", regex=False).new_name(path="/d/a", number=1)
+
+
+def test_chains_and_cycles_are_renamed_safely(tmp_path):
+    names = ["a", "b", "c", "x", "y"]
+    for name in names:
+        (tmp_path / name).write_text(name)
+    paths = [str(tmp_path / name) for name in names]
+    # a->b->c->d chain and x<->y cycle
+    targets = {"a": "b", "b": "c", "c": "d", "x": "y", "y": "x"}
+    plan = plan_renames(paths=paths, rule=RenameRule(pattern=".+", replacement=lambda match: targets[match.group(0)]))
+    assert plan
+    steps = order_renames(renames=plan.renames)
+    assert steps[:3] == [(paths[2], str(tmp_path / "d")), (paths[1], paths[2]), (paths[0], paths[1])]
+    apply_renames(steps=steps)
+    assert {name: (tmp_path / name).read_text() for name in os.listdir(tmp_path)} == {
+        "b": "a",
+        "c": "b",
+        "d": "c",
+        "x": "y",
+        "y": "x",
+    }
+    # failed rename rolls back renames done before it
+    with pytest.raises(FileExistsError):
+        apply_renames(steps=[(paths[1], str(tmp_path / "e")), (paths[2], str(tmp_path / "d"))])
+    assert sorted(os.listdir(tmp_path)) == ["b", "c", "d", "x", "y"]
+
+
+def test_items_inside_renamed_folder_are_renamed_first(tmp_path):
+    (tmp_path / "folder").mkdir()
+    (tmp_path / "folder" / "file").write_text("x")
+    paths = [str(tmp_path / "folder"), str(tmp_path / "folder" / "file")]
+    plan = plan_renames(paths=paths, rule=RenameRule(pattern="$", replacement="_new"))
+    apply_renames(steps=order_renames(renames=plan.renames))
+    assert (tmp_path / "folder_new" / "file_new").read_text() == "x"
+
+
+def test_existing_targets_are_found_in_folder_listing(tmp_path):
+    for name in ("IMG_1.jpg", "IMG_2.jpg", "photo_2.jpg"):
+        (tmp_path / name).write_text(name)
+    paths = [str(tmp_path / "IMG_1.jpg"), str(tmp_path / "IMG_2.jpg")]
+    exists = FolderNames()
+    plan = plan_renames(paths=paths, rule=RenameRule(pattern="IMG", replacement="photo"), exists=exists)
+    assert plan.conflicts == {str(tmp_path / "IMG_2.jpg"): "Already exists"}
+    assert exists(str(tmp_path / "missing" / "a.jpg")) is False
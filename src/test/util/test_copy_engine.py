@@ -0,0 +1,99 @@
+import errno
+import os
+
+import pytest
+
+from src.app.utils import copy_engine
+from src.app.utils.copy_engine import copy, move, copy_file, CopyProgress
+
+
+def make_tree(root):
+    (root / "src" / "sub").mkdir(parents=True)
+    (root / "src" / "a.txt").write_text("a")
+    (root / "src" / "sub" / "b.txt").write_text("b" * 10)
+    (root / "src" / "big.bin").write_bytes(os.urandom(copy_engine.SMALL_FILE_SIZE + 3))
+    return root / "src"
+
+
+def tree(root):
+    return sorted(
+        (os.path.relpath(os.path.join(folder, name), root), open(os.path.join(folder, name), "rb").read())
+        for folder, _, names in os.walk(root)
+        for name in names
+    )
+
+
+def test_copy_move_and_conflicts(tmp_path):
+    src = make_tree(root=tmp_path)
+    assert copy(src=[str(src)], dst=str(tmp_path / "dst"), auto_rename=False)
+    assert tree(root=tmp_path / "dst" / "src") == tree(root=src)
+    assert copy(src=str(src), dst=str(tmp_path / "dst"), auto_rename=True)
+    assert tree(root=tmp_path / "dst" / "src(1)") == tree(root=src)
+    # duplicate folder content by wildcard
+    assert copy(src=str(src / "*.*"), dst=str(tmp_path / "dup"), auto_rename=False)
+    assert tree(root=tmp_path / "dup") == tree(root=src)
+    assert copy_file(src=str(src / "a.txt"), tgt=str(src / "a.txt"), auto_rename=True)
+    assert (src / "a(1).txt").read_text() == "a"
+
+    (tmp_path / "dst" / "src" / "a.txt").write_text("old")
+    (tmp_path / "dst" / "src" / "keep.txt").write_text("keep")
+    expected = tree(root=src) + [("keep.txt", b"keep")]
+    # existing files are not overwritten unless asked to
+    with pytest.raises(FileExistsError):
+        move(src=[str(src)], dst=str(tmp_path / "dst"))
+    with pytest.raises(FileExistsError):
+        copy(src=[str(src)], dst=str(tmp_path / "dst"), auto_rename=False)
+    assert (tmp_path / "dst" / "src" / "a.txt").read_text() == "old"
+    assert src.exists()
+    assert move(src=[str(src)], dst=str(tmp_path / "dst"), overwrite=True)
+    assert not src.exists()
+    assert tree(root=tmp_path / "dst" / "src") == sorted(expected)
+
+
+def test_copy_falls_back_when_kernel_copy_is_not_supported(tmp_path, monkeypatch):
+    src = make_tree(root=tmp_path)
+
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, "cross device")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+    progress = CopyProgress()
+    plan = copy_engine.plan_copy(pairs=[(str(src), str(tmp_path / "dst"))], progress=progress)
+    copy_engine.execute_plan(plan=plan, progress=progress)
+    assert tree(root=tmp_path / "dst") == tree(root=src)
+    assert progress.done == progress.total == copy_engine.SMALL_FILE_SIZE + 3 + 11
+
+    # move to other volume is copy and remove
+    monkeypatch.setattr(os, "replace", unsupported)
+    expected = tree(root=src)
+    assert move(src=str(src), dst=str(tmp_path / "other"))
+    assert not src.exists()
+    assert tree(root=tmp_path / "other" / "src") == expected
+
+
+def test_duplicate_clones_files_and_copies_the_rest(tmp_path, monkeypatch):
+    src = make_tree(root=tmp_path)
+    cloned = []
+
+    class FakeFcntl:
+        @staticmethod
+        def ioctl(dst_fd, request, src_fd):
+            assert request == copy_engine.FICLONE
+            if os.fstat(src_fd).st_size < copy_engine.SMALL_FILE_SIZE:
+                raise OSError(errno.EOPNOTSUPP, "not supported")
+            cloned.append(os.fstat(src_fd).st_size)
+            os.write(dst_fd, os.pread(src_fd, os.fstat(src_fd).st_size, 0))
+
+    monkeypatch.setattr(copy_engine, "fcntl", FakeFcntl)
+    assert copy_engine.duplicate(src=str(src), dst=str(tmp_path / "copy"))
+    assert tree(root=tmp_path / "copy") == tree(root=src)
+    assert cloned == [copy_engine.SMALL_FILE_SIZE + 3]
+
+
+def test_junction_is_copied_as_link(tmp_path, monkeypatch):
+    src = make_tree(root=tmp_path)
+    monkeypatch.setattr(copy_engine, "is_junction", lambda path: os.path.basename(path) == "sub")
+    plan = copy_engine.plan_copy(pairs=[(str(src), str(tmp_path / "dst"))], progress=CopyProgress())
+    assert plan.links == [(str(src / "sub"), str(tmp_path / "dst" / "sub"))]
+    assert all("sub" not in task.src for task in plan.files)
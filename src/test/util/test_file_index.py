@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from src.app.utils.file_index import FileIndex, fuzzy_score, index_file_name
+
+
+@pytest.fixture(name="tree_root")
+def fixture_tree_root(tmp_path) -> str:
+    for path in [
+        "src/app/utils/search.py",
+        "src/app/utils/shell.py",
+        "src/app/gui/search/search_panel.py",
+        "src/test/util/test_search.py",
+        "venv/lib/search.py",
+        "readme.md",
+    ]:
+        file_path = tmp_path.joinpath(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text("")
+    return str(tmp_path).replace(os.sep, "/")
+
+
+def test_build_skips_excluded_dirs(tree_root):
+    index = FileIndex.build(root=tree_root)
+    assert len(index) == 5
+    assert f"{tree_root}/venv/lib/search.py" not in index.query(text="search")
+
+
+def test_query_prefers_file_name_matches(tree_root):
+    index = FileIndex.build(root=tree_root)
+    assert index.query(text="search.py", limit=1) == [f"{tree_root}/src/app/utils/search.py"]
+    assert index.query(text="shell", limit=2) == [f"{tree_root}/src/app/utils/shell.py"]
+    assert index.query(text="sepa", limit=2) == [f"{tree_root}/src/app/gui/search/search_panel.py"]
+    assert index.query(text="gui/panel") == [f"{tree_root}/src/app/gui/search/search_panel.py"]
+    assert not index.query(text="xyz")
+
+
+def test_query_narrows_previous_candidates(tree_root):
+    index = FileIndex.build(root=tree_root)
+    assert len(index.query(text="s")) == 4
+    assert len(index.query(text="sea")) == 3
+    assert len(index.query(text="se")) == 4
+
+
+def test_fuzzy_score():
+    assert fuzzy_score(query="abc", key="x/acb") is None
+    assert fuzzy_score(query="sp", key="app/search_panel.py") > fuzzy_score(query="sp", key="app/sxxxxp.py")
+
+
+def test_save_and_load(tree_root, tmp_path):
+    index = FileIndex.build(root=tree_root)
+    file_name = index_file_name(index_dir=str(tmp_path), root=tree_root)
+    index.save(file_name=file_name)
+    loaded = FileIndex.load(file_name=file_name)
+    assert loaded.root == index.root
+    assert loaded.paths == index.paths
+    assert FileIndex.load(file_name=file_name + ".missing") is None
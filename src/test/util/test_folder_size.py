@@ -0,0 +1,51 @@
+from src.app.utils.folder_size import FolderSizeCache, FolderSizeScanner, folder_size
+
+
+def test_folder_size_is_updated_incrementally(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "c").mkdir()
+    (tmp_path / "top.bin").write_bytes(b"x" * 10)
+    (tmp_path / "a" / "b" / "deep.bin").write_bytes(b"x" * 100)
+    (tmp_path / "c" / "other.bin").write_bytes(b"x" * 1000)
+    cache = FolderSizeCache()
+    assert folder_size(path=str(tmp_path), cache=cache) == 1110
+    assert cache.total(path=str(tmp_path / "a")) == (100, True)
+    (tmp_path / "a" / "b" / "new.bin").write_bytes(b"x" * 5)
+    assert cache.invalidate(path=str(tmp_path / "a" / "b"))
+    assert cache.total(path=str(tmp_path)) == (1110, False)
+    c_aggregate = cache.get(path=str(tmp_path / "c"))
+    assert folder_size(path=str(tmp_path), cache=cache) == 1115
+    assert cache.total(path=str(tmp_path / "a")) == (105, True)
+    assert cache.get(path=str(tmp_path / "c")) is c_aggregate
+
+
+def test_invalidated_folder_is_announced_once(tmp_path):
+    (tmp_path / "a").mkdir()
+    scanner = FolderSizeScanner()
+    invalidated = []
+    scanner.invalidated.connect(invalidated.append)
+    assert not scanner.invalidate(path=str(tmp_path / "a"))
+    folder_size(path=str(tmp_path), cache=scanner.cache)
+    assert scanner.invalidate(path=str(tmp_path / "a"))
+    assert not scanner.invalidate(path=str(tmp_path / "a"))
+    assert invalidated == [str(tmp_path / "a")]
+
+
+def test_only_changes_in_subtree_discard_computed_total(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "c").mkdir()
+    cache = FolderSizeCache()
+    folder_size(path=str(tmp_path), cache=cache)
+    a_aggregate = cache.get(path=str(tmp_path / "a"))
+    generation = cache.begin(path=str(tmp_path / "a"))
+    cache.invalidate(path=str(tmp_path / "c"))
+    cache.put(path=str(tmp_path / "a"), aggregate=a_aggregate, generation=generation)
+    cache.end(path=str(tmp_path / "a"))
+    assert cache.total(path=str(tmp_path / "a")) == (0, True)
+    generation = cache.begin(path=str(tmp_path / "a"))
+    cache.invalidate(path=str(tmp_path / "a" / "b"))
+    cache.put(path=str(tmp_path / "a"), aggregate=a_aggregate, generation=generation)
+    cache.end(path=str(tmp_path / "a"))
+    assert cache.total(path=str(tmp_path / "a")) == (0, False)
+    assert folder_size(path=str(tmp_path), cache=cache) == 0
+    assert cache.total(path=str(tmp_path)) == (0, True)
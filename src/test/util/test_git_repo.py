@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from src.app.utils.git_repo import config_cache, find_repo, parse_config, remote_url
+
+CONFIG = """[core]
+\tbare = false
+[remote "origin"]
+\turl = https://github.com/user/repo.git ; comment
+\tfetch = +refs/heads/*:refs/remotes/origin/*
+[remote "upstream"]
+\turl = "git@github.com:org/repo.git"
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    yield
+    config_cache().clear()
+
+
+def test_config_is_parsed():
+    config = parse_config(text=CONFIG)
+    assert config["core"]["bare"] == "false"
+    assert config['remote "origin"']["url"] == "https://github.com/user/repo.git"
+    assert config['remote "upstream"']["url"] == "git@github.com:org/repo.git"
+
+
+def test_repo_is_found_from_nested_folder_and_worktree(tmp_path):
+    main = tmp_path / "main"
+    (main / ".git" / "worktrees" / "feature").mkdir(parents=True)
+    (main / ".git" / "config").write_text(CONFIG)
+    (main / "src" / "app").mkdir(parents=True)
+    assert find_repo(path=str(main / "src" / "app")).root == str(main)
+    assert remote_url(path=str(main / "src" / "app")) == "https://github.com/user/repo.git"
+    assert remote_url(path=str(main), remote="upstream") == "git@github.com:org/repo.git"
+    assert remote_url(path=str(tmp_path)) is None
+    # linked work tree has .git file pointing to its folder which points to common folder
+    feature = tmp_path / "feature"
+    feature.mkdir()
+    (feature / ".git").write_text("gitdir: ../main/.git/worktrees/feature\n")
+    (main / ".git" / "worktrees" / "feature" / "commondir").write_text("../..\n")
+    repo = find_repo(path=str(feature))
+    assert repo.git_dir == str(main / ".git" / "worktrees" / "feature")
+    assert repo.common_dir == str(main / ".git")
+    assert remote_url(path=str(feature)) == "https://github.com/user/repo.git"
+    # changed config is parsed again
+    config = main / ".git" / "config"
+    config.write_text(CONFIG.replace("user/repo", "user/renamed"))
+    os.utime(config, (1, 1))
+    assert remote_url(path=str(feature)) == "https://github.com/user/renamed.git"
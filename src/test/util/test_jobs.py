@@ -0,0 +1,55 @@
+import threading
+import time
+
+from src.app.utils.jobs import JobQueue, JobPriority, JobState, current_job
+from src.app.utils.scheduler import IOScheduler
+
+
+def test_jobs_run_by_priority_and_can_be_cancelled():
+    lane = IOScheduler(max_workers=1).lane(name="test jobs")
+    queue = JobQueue(workers=1, lane=lane)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def blocking():
+        started.set()
+        release.wait(timeout=5)
+
+    def record(name: str):
+        order.append(name)
+
+    def failing():
+        raise OSError("disk is gone")
+
+    def cancellable():
+        job = current_job()
+        job.report(done=1, total=2)
+        while not job.cancelled:
+            time.sleep(0.01)
+        job.check_cancelled()
+
+    first = queue.submit(target=blocking, args=[], caption="blocking")
+    assert started.wait(timeout=5)
+    low = queue.submit(target=record, args=["low"], caption="low", priority=JobPriority.LOW)
+    normal = queue.submit(target=record, args=["normal"], caption="normal")
+    high = queue.submit(target=record, args=["high"], caption="high", priority=JobPriority.HIGH)
+    dropped = queue.submit(target=record, args=["dropped"], caption="dropped")
+    failed = queue.submit(target=failing, args=[], caption="failing")
+    queue.cancel(job=dropped)
+    release.set()
+    assert queue.wait(timeout=5)
+    assert order == ["high", "normal", "low"]
+    assert first.state == low.state == normal.state == high.state == JobState.DONE
+    assert dropped.state == JobState.CANCELLED
+    assert failed.state == JobState.FAILED and failed.error == "disk is gone"
+
+    running = queue.submit(target=cancellable, args=[], caption="cancellable")
+    while running.progress() is None:
+        time.sleep(0.01)
+    assert running.progress() == 50
+    queue.cancel(job=running)
+    assert queue.wait(timeout=5)
+    assert running.state == JobState.CANCELLED
+    assert len(queue.clear_finished()) == 7
+    assert not queue.jobs
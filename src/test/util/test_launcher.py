@@ -0,0 +1,26 @@
+from src.app.utils.launcher import command_batches, notepad_commands, vs_code_commands
+
+
+def test_editor_commands_are_grouped(tmp_path):
+    files = [str(tmp_path / f"{number}.py") for number in range(4)]
+    positions = {files[0]: (10, 5), files[1]: (10, 5), files[2]: (3, None)}
+    assert vs_code_commands(program="code", paths=files, positions=positions) == [
+        ["code", "-g", f"{files[0]}:10:5", f"{files[1]}:10:5", f"{files[2]}:3", files[3]]
+    ]
+    assert vs_code_commands(program="code", paths=[str(tmp_path)] + files[3:], positions={}) == [
+        ["code", "-n", str(tmp_path), files[3]]
+    ]
+    assert notepad_commands(program="npp", files=files, positions=positions) == [
+        ["npp", "-n10", "-c5", files[0], files[1]],
+        ["npp", "-n3", files[2]],
+        ["npp", files[3]],
+    ]
+
+
+def test_long_command_is_split():
+    items = [f"file{number:02}" for number in range(10)]
+    commands = command_batches(program="p", options=["-x"], items=items, limit=50)
+    assert all(command[:2] == ["p", "-x"] for command in commands)
+    assert sum((command[2:] for command in commands), []) == items
+    assert all(sum(len(arg) + 3 for arg in command) <= 50 for command in commands)
+    assert len(commands) == 3
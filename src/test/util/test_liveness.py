@@ -0,0 +1,53 @@
+import threading
+import time
+
+from PySide6.QtCore import Qt
+
+from src.app.utils.liveness import LivenessChecker, PathProbe
+
+
+def test_probe_reports_unknown_for_hanging_path(tmp_path):
+    release = threading.Event()
+    calls = []
+
+    def exists(path: str) -> bool:
+        calls.append(path)
+        if path == "hanging":
+            release.wait(timeout=5)
+        return path == str(tmp_path)
+
+    probe = PathProbe(timeout=0.2, exists=exists)
+    assert probe.probe(paths=[str(tmp_path), "missing", "hanging"]) == {
+        str(tmp_path): True,
+        "missing": False,
+        "hanging": None,
+    }
+    assert probe.probe(paths=[str(tmp_path), "missing", "hanging"])["missing"] is False
+    release.set()
+    assert calls.count(str(tmp_path)) == 1
+    assert calls.count("missing") == 2
+    assert calls.count("hanging") == 1
+    # late answer replaces unknown result
+    deadline = time.monotonic() + 5
+    while "hanging" in probe.cache and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert probe.probe(paths=["hanging"]) == {"hanging": False}
+
+
+def test_dead_paths_are_reported_to_requester(tmp_path):
+    checker = LivenessChecker(probe=PathProbe(exists=lambda path: path == str(tmp_path)))
+    reported = []
+    done = threading.Event()
+
+    def on_dead(requester, paths):
+        reported.append((requester, sorted(paths)))
+        if len(reported) == 2:
+            done.set()
+
+    checker.dead.connect(on_dead, Qt.DirectConnection)
+    checker.check(requester="first", paths=[str(tmp_path), "a"])
+    checker.check(requester="second", paths=["a", "b"])
+    checker.check(requester="third", paths=[str(tmp_path)])
+    checker.start_check()
+    assert done.wait(timeout=5)
+    assert sorted(reported) == [("first", ["a"]), ("second", ["a", "b"])]
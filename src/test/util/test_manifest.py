@@ -0,0 +1,53 @@
+import pytest
+
+from src.app.utils.manifest import ManifestEntry, ManifestError, parse_manifest, validate_manifest, create_manifest
+
+MANIFEST = """
+# project
+src/
+    app
+        __init__.py;main.py
+    test/
+\t\tconftest.py
+docs/api/index.md
+README.md
+"""
+
+
+def test_parse_manifest():
+    assert parse_manifest(text=MANIFEST) == [
+        ManifestEntry(path="src", is_dir=True),
+        ManifestEntry(path="src/app", is_dir=True),
+        ManifestEntry(path="src/app/__init__.py", is_dir=False),
+        ManifestEntry(path="src/app/main.py", is_dir=False),
+        ManifestEntry(path="src/test", is_dir=True),
+        ManifestEntry(path="src/test/conftest.py", is_dir=False),
+        ManifestEntry(path="docs", is_dir=True),
+        ManifestEntry(path="docs/api", is_dir=True),
+        ManifestEntry(path="docs/api/index.md", is_dir=False),
+        ManifestEntry(path="README.md", is_dir=False),
+    ]
+    for text in ("a\n    b\n  c", "../a", "/etc/passwd", "a/b:c"):
+        with pytest.raises(ManifestError):
+            parse_manifest(text=text)
+
+
+def test_validate_and_create(tmp_path):
+    (tmp_path / "src" / "app").mkdir(parents=True)
+    (tmp_path / "src" / "app" / "main.py").write_text("keep")
+    (tmp_path / "docs").write_text("file")
+    plan = validate_manifest(root=str(tmp_path), entries=parse_manifest(text=MANIFEST))
+    assert plan.conflicts == {str(tmp_path / "docs"): "File exists"}
+    assert not plan
+    (tmp_path / "docs").unlink()
+    plan = validate_manifest(root=str(tmp_path), entries=parse_manifest(text=MANIFEST))
+    assert plan
+    assert plan.existing == [
+        str(tmp_path / "src"),
+        str(tmp_path / "src" / "app"),
+        str(tmp_path / "src" / "app" / "main.py"),
+    ]
+    assert create_manifest(plan=plan) == [str(tmp_path / "src"), str(tmp_path / "docs"), str(tmp_path / "README.md")]
+    assert (tmp_path / "src" / "app" / "main.py").read_text() == "keep"
+    assert (tmp_path / "src" / "test" / "conftest.py").is_file()
+    assert (tmp_path / "docs" / "api" / "index.md").is_file()
@@ -0,0 +1,39 @@
+import threading
+
+from PySide6.QtCore import Qt
+
+from src.app.utils.file_index import FileIndex
+from src.app.utils.name_matcher import MatchingDirsFinder, NameMatcher
+
+
+def test_name_matcher_terms():
+    assert not NameMatcher(text=" ; *")
+    assert NameMatcher(text="").matches(name="anything")
+    matcher = NameMatcher(text="*.py; READ")
+    assert matcher.matches(name="setup.PY")
+    assert matcher.matches(name="ReadMe.md")
+    assert not matcher.matches(name="setup.py.bak")
+    assert not matcher.matches(name="rdme.txt")
+    fuzzy = NameMatcher(text="rdme", fuzzy=True)
+    assert fuzzy.matches(name="README.md")
+    assert not fuzzy.matches(name="mder")
+
+
+def test_matching_dirs():
+    matcher = NameMatcher(text="*.sql")
+    paths = ["a/b/query.sql", "a/b/notes.txt", "a/c/other.txt", "d/e/f/x.sql", "top.sql"]
+    expected = {f"/root/{folder}" for folder in ("a", "a/b", "d", "d/e", "d/e/f")}
+    assert matcher.matching_dirs(root="/root", paths=paths) == expected
+
+
+def test_matching_dirs_are_found_in_background():
+    finder = MatchingDirsFinder()
+    ready = threading.Event()
+    finder.ready.connect(lambda root: ready.set(), Qt.DirectConnection)
+    index = FileIndex(root="/root", paths=["a/b/query.sql", "c/notes.txt"])
+    matcher = NameMatcher(text="*.sql")
+    assert finder.find(index=index, matcher=matcher) is None
+    assert ready.wait(timeout=5)
+    assert finder.find(index=index, matcher=matcher) == {"/root/a", "/root/a/b"}
+    # other text is found again
+    assert finder.find(index=index, matcher=NameMatcher(text="*.txt")) is None
@@ -0,0 +1,14 @@
+from src.app.utils.path_trie import PathTrie
+
+
+def test_pop_children_returns_paths_directly_under_directory():
+    trie = PathTrie(paths=["C:/work/a", "C:/work/a/b/c", "C:/work/d", "C:\\other"])
+    assert len(trie) == 4
+    assert sorted(trie.pop_children(path="C:/work")) == ["C:/work/a", "C:/work/d"]
+    assert "C:/work/a" not in trie
+    assert "C:/work/a/b/c" in trie
+    assert trie.pop_children(path="C:/work/a") == []
+    assert trie.pop_children(path="C:/work/a/b") == ["C:/work/a/b/c"]
+    assert trie.pop_children(path="C:/") == ["C:\\other"]
+    assert len(trie) == 0
+    assert not trie.root.children
@@ -0,0 +1,26 @@
+from src.app.utils.path_util import dir_list
+from src.app.utils.preview import PreviewCache, PreviewKey, load_preview
+
+
+def test_preview_cache_is_lru():
+    cache = PreviewCache(max_size=2)
+    first, second, third = (PreviewKey(path=path, last_modified=0, is_dir=False) for path in "abc")
+    cache.put(key=first, text="a")
+    cache.put(key=second, text="b")
+    assert cache.get(key=first) == "a"
+    cache.put(key=third, text="c")
+    assert cache.get(key=second) is None
+    assert cache.get(key=first) == "a"
+    assert cache.get(key=first._replace(last_modified=1)) is None
+
+
+def test_load_preview_is_bounded(tmp_path):
+    for i in range(10):
+        (tmp_path / f"file{i}.txt").write_text("\n".join(str(line) for line in range(100)))
+    assert load_preview(key=PreviewKey(path=str(tmp_path / "file0.txt"), last_modified=0, is_dir=False)).startswith(
+        "0\n1\n"
+    )
+    assert len(load_preview(key=PreviewKey(path=str(tmp_path), last_modified=0, is_dir=True)).split("\n")) == 10
+    assert dir_list(path=str(tmp_path), limit=3)[3:] == ["..."]
+    missing = PreviewKey(path=str(tmp_path / "missing"), last_modified=0, is_dir=True)
+    assert load_preview(key=missing).endswith("is not a directory")
@@ -0,0 +1,29 @@
+import re
+
+from src.app.utils.regex_prefilter import required_literals
+
+
+def test_required_literals():
+    assert required_literals(pattern=r"CREATE\s+OR\s+REPLACE\s+PACKAGE").literals == (
+        "REPLACE",
+        "PACKAGE",
+        "CREATE",
+        "OR",
+    )
+    assert required_literals(pattern=r"\bdef (get|set)_\w+\(").literals == ("def ", "_", "(")
+    assert required_literals(pattern=r"(?:abc)?x+yz").literals == ("yz", "x")
+    assert not required_literals(pattern=r"foo|bar")
+    assert not required_literals(pattern=r"[")
+
+
+def test_prefilter_never_rejects_matching_text():
+    texts = ["create or replace package p", "CREATE OR\n REPLACE  PACKAGE", "create package", "Ÿ create or replace"]
+    patterns = [r"CREATE\s+OR\s+REPLACE\s+PACKAGE", r"(?i)Ÿ create", r"é+ x", r"(?i:or) replace"]
+    for pattern in patterns:
+        for flags in (0, re.IGNORECASE):
+            prefilter = required_literals(pattern=pattern, flags=flags)
+            for text in texts + [text.upper() for text in texts]:
+                if re.search(pattern, text, flags):
+                    assert prefilter.might_match(text=text), (pattern, flags, text)
+    prefilter = required_literals(pattern=r"CREATE\s+OR\s+REPLACE\s+PACKAGE", flags=re.IGNORECASE)
+    assert not prefilter.might_match(text="create or replace function")
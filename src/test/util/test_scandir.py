@@ -0,0 +1,28 @@
+from src.app.utils.scandir import ScanOptions, scan_dir
+
+
+def test_scan_dir_batches(tmp_path):
+    for i in range(120):
+        (tmp_path / f"file{i:03}.txt").write_text("x" * i)
+    (tmp_path / "folder").mkdir()
+    batches = list(scan_dir(path=str(tmp_path), batch_size=100))
+    assert [len(batch) for batch in batches] == [50, 71]
+    entries = {entry.name: entry for batch in batches for entry in batch}
+    assert len(entries) == 121
+    assert entries["folder"].is_dir and entries["folder"].size == 0
+    assert entries["file007.txt"].size == 7 and not entries["file007.txt"].is_dir
+
+
+def test_scan_dir_options(tmp_path):
+    for name in ("a.py", "b.sql", ".hidden.py"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "sub").mkdir()
+
+    def names(options: ScanOptions):
+        return sorted(entry.name for batch in scan_dir(path=str(tmp_path), options=options) for entry in batch)
+
+    assert names(options=ScanOptions()) == ["a.py", "b.sql", "sub"]
+    assert names(options=ScanOptions(files=False)) == ["sub"]
+    assert names(options=ScanOptions(name_filters=["*.PY"])) == ["a.py", "sub"]
+    assert names(options=ScanOptions(hidden=True, name_filters=["*.py"])) == [".hidden.py", "a.py", "sub"]
+    assert not list(scan_dir(path=str(tmp_path / "missing")))
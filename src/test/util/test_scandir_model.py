@@ -0,0 +1,51 @@
+import ntpath
+import os
+
+from PySide6.QtCore import QModelIndex
+from PySide6.QtWidgets import QApplication
+
+from src.app.gui.scandir_model import ScandirModel
+from src.app.utils.scandir import ScanEntry
+
+
+def folder_entry(name: str) -> ScanEntry:
+    return ScanEntry(name=name, is_dir=True, hidden=False, system=False, size=0, modified=0)
+
+
+def test_path_index_of_windows_paths(monkeypatch):
+    _ = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+    model = ScandirModel()
+    root = model.node(index=QModelIndex())
+    root.append(entry=folder_entry(name="C:/"))
+    drive_row = len(root) - 1
+    model.child_node(parent=root, row=drive_row).append(entry=folder_entry(name="Users"))
+    assert model.path_index(path="C:/").row() == drive_row
+    index = model.path_index(path="c:\\users")
+    assert index.isValid()
+    assert model.node(index=index).path == "C:/Users"
+
+
+def file_entry(name: str) -> ScanEntry:
+    return ScanEntry(name=name, is_dir=False, hidden=False, system=False, size=0, modified=0)
+
+
+def test_batches_are_inserted_in_sorted_order():
+    _ = QApplication.instance() or QApplication([])
+    model = ScandirModel()
+    root = model.node(index=QModelIndex())
+    root.append(entry=folder_entry(name="/data"))
+    node = model.child_node(parent=root, row=len(root) - 1)
+    model.insert_entries(node=node, entries=[file_entry(name="b.txt"), folder_entry(name="Sub")])
+    sub = model.child_node(parent=node, row=node.find(name="Sub"))
+    model.insert_entries(node=node, entries=[file_entry(name="c.txt"), folder_entry(name="alpha"), file_entry("a.txt")])
+    assert node.names == ["alpha", "Sub", "a.txt", "b.txt", "c.txt"]
+    # child folder moves with its row
+    assert sub.row == 1 and model.child_node(parent=node, row=1) is sub
+    assert node.find(name="c.txt") == 4
+    # scattered batch is appended and sorted at once
+    scattered = [file_entry(name=f"{name}{number}.txt") for number in range(20) for name in "bd"]
+    model.insert_entries(node=node, entries=scattered + [file_entry(name="b.txt")])
+    assert node.names == sorted(node.names, key=lambda name: (name.endswith(".txt"), name.lower()))
+    assert len(node) == 45
+    assert model.node(index=model.index(sub.row, 0, model.node_index(node=node))) is sub
@@ -0,0 +1,80 @@
+import threading
+import time
+
+from src.app.utils.scheduler import IOScheduler
+
+
+def test_concurrency_is_bounded():
+    scheduler = IOScheduler(max_workers=2)
+    lanes = [scheduler.lane(name=f"lane{i}") for i in range(3)]
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work(lane):
+        for _ in range(5):
+            with lane.slot():
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.002)
+                with lock:
+                    running[0] -= 1
+
+    threads = [threading.Thread(target=work, args=[lane]) for lane in lanes for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] <= 2
+    assert scheduler.active == 0
+
+
+def test_slots_are_granted_round_robin():
+    scheduler = IOScheduler(max_workers=1)
+    first, second, blocker = scheduler.lane(name="first"), scheduler.lane(name="second"), scheduler.lane(name="x")
+    order = []
+    scheduler.acquire(lane=blocker)
+
+    def work(lane):
+        with lane.slot():
+            order.append(lane.name)
+
+    threads = [threading.Thread(target=work, args=[lane]) for lane in (first, first, second)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    scheduler.release(lane=blocker)
+    for thread in threads:
+        thread.join()
+    assert order == ["first", "second", "first"]
+
+
+def test_lane_limit():
+    scheduler = IOScheduler(max_workers=4)
+    lane = scheduler.lane(name="jobs", limit=1)
+    lane.scheduler.acquire(lane=lane)
+    acquired = threading.Event()
+
+    def work():
+        with lane.slot():
+            acquired.set()
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    assert not acquired.wait(0.05)
+    scheduler.release(lane=lane)
+    thread.join()
+    assert acquired.is_set()
+
+
+def test_reserved_slot_is_left_to_other_lanes():
+    scheduler = IOScheduler(max_workers=1)
+    jobs = scheduler.lane(name="jobs", reserve=1)
+    assert jobs.limit == 1
+    assert scheduler.max_workers == 2
+    scheduler.acquire(lane=jobs)
+    search = scheduler.lane(name="search")
+    with search.slot():
+        assert scheduler.active == 2
+    scheduler.release(lane=jobs)
+    assert IOScheduler(max_workers=4).lane(name="jobs", reserve=1).limit == 3
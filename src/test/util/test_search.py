@@ -1,8 +1,9 @@
 import re
 from typing import Iterator
 
-from src.app.model.search import SearchParam, line_range_map
-from src.app.utils.search import find_keyword, search
+from src.app.model.search import SearchParam, line_range_map, FileSearchResult
+from src.app.utils.scheduler import IOScheduler
+from src.app.utils.search import DIR_BATCH_SIZE, find_keyword, search, search_file
 
 text1 = """flag = re.IGNORECASE if not case_sensitive else 0"""
 
@@ -99,3 +100,51 @@ def test_re_search_file_search():
 def test_file_line_range():
     print(line_range_map(["aaa", "bb", "c"]))
     assert line_range_map(["aaa", "bb", "c"]) == {(0, 2): 0, (3, 4): 1, (5, 5): 2}
+
+
+def test_search_paths_collapse_nested_roots():
+    search_param = SearchParam(path="c:/project;c:/project/src; d:/other;c:/project")
+    assert search_param.search_paths() == ["c:/project", "d:/other"]
+
+    search_param.subdirectories = False
+    assert search_param.search_paths() == ["c:/project", "c:/project/src", "d:/other"]
+
+
+def test_search_file_multiple_keywords():
+    text_lines = ["import re\n", "def find_keyword(search_param):\n", "    return re.finditer()\n"]
+    search_param = SearchParam(keyword="re; keyword ;missing", multiple_keywords=True, whole_words=True)
+    assert search_param.keyword_list() == ["re", "keyword", "missing"]
+    result = search_file(
+        search_param=search_param, text_lines=text_lines, search_result=FileSearchResult(file_name="f", is_dir=False)
+    )
+    assert [(hit.term, hit.span()) for hit in result.hits or ()] == [("re", (7, 9)), ("re", (53, 55))]
+    search_param.whole_words = False
+    result = search_file(
+        search_param=search_param, text_lines=text_lines, search_result=FileSearchResult(file_name="f", is_dir=False)
+    )
+    assert {hit.term for hit in result.hits or ()} == {"re", "keyword"}
+    search_param.all_keywords = True
+    result = search_file(
+        search_param=search_param, text_lines=text_lines, search_result=FileSearchResult(file_name="f", is_dir=False)
+    )
+    assert result.hits is None
+
+
+def test_directory_walk_reads_batches_in_io_slots(tmp_path):
+    for number in range(DIR_BATCH_SIZE + 10):
+        (tmp_path / f"{number}.txt").write_text("")
+    scheduler = IOScheduler(max_workers=1)
+    lane = scheduler.lane(name="search")
+    slots = []
+    original = scheduler.acquire
+
+    def acquire(lane):
+        original(lane=lane)
+        slots.append(lane.name)
+
+    scheduler.acquire = acquire
+    results = list(search(search_param=SearchParam(path=str(tmp_path)), io_lane=lane))
+    assert len(results) == DIR_BATCH_SIZE + 10
+    # two batches with entries and last empty read
+    assert slots == ["search"] * 3
+    assert scheduler.active == 0
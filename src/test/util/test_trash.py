@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from src.app.utils import trash
+from src.app.utils.jobs import JobCancelled
+
+
+def make_tree(root):
+    (root / "node_modules" / "pkg" / "lib").mkdir(parents=True)
+    for number in range(50):
+        (root / "node_modules" / "pkg" / "lib" / f"{number}.js").write_text("x" * number)
+    (root / "node_modules" / "link").symlink_to(root / "node_modules" / "pkg")
+    (root / "a.txt").write_text("a")
+
+
+def test_hard_delete_stages_and_purges(tmp_path, monkeypatch):
+    monkeypatch.setattr(trash, "mount_point", lambda path: str(tmp_path))
+    make_tree(root=tmp_path / "work")
+    stale = tmp_path / trash.STAGING_DIR / f"{trash.STAGED_PREFIX}old"
+    (stale / "0-left").mkdir(parents=True)
+    os.utime(stale, (0, 0))
+    purged = []
+    purge = trash.purge
+    monkeypatch.setattr(trash, "purge", lambda paths: purged.extend(paths) or purge(paths=paths))
+    assert trash.delete(
+        src=[str(tmp_path / "work" / "node_modules"), str(tmp_path / "work" / "a.txt")], hard_delete=True
+    )
+    assert os.listdir(tmp_path / "work") == []
+    assert not (tmp_path / trash.STAGING_DIR).exists()
+    assert str(stale) in purged
+    assert all(path.startswith(str(tmp_path / trash.STAGING_DIR)) for path in purged)
+
+
+def test_soft_delete_moves_to_trash(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    make_tree(root=tmp_path / "work")
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "a.txt").write_text("b")
+    assert trash.delete(src=str(tmp_path / "work" / "a.txt"), hard_delete=False)
+    assert trash.delete(src=str(tmp_path / "other" / "*.txt"), hard_delete=False)
+    files = tmp_path / "data" / "Trash" / "files"
+    assert sorted(os.listdir(files)) == ["a.txt", "a.txt(2)"]
+    assert (files / "a.txt(2)").read_text() == "b"
+    info = (tmp_path / "data" / "Trash" / "info" / "a.txt(2).trashinfo").read_text()
+    assert f"Path={tmp_path / 'other' / 'a.txt'}" in info
+
+
+def test_hard_delete_keeps_targets_of_links(tmp_path, monkeypatch):
+    monkeypatch.setattr(trash, "mount_point", lambda path: str(tmp_path))
+    (tmp_path / "outside").mkdir()
+    (tmp_path / "outside" / "keep.txt").write_text("keep")
+    (tmp_path / "work" / "node_modules" / "junction" / "lib").mkdir(parents=True)
+    (tmp_path / "work" / "node_modules" / "junction" / "lib" / "index.js").write_text("x")
+    (tmp_path / "work" / "node_modules" / "link").symlink_to(tmp_path / "outside", target_is_directory=True)
+    # junctions exist on Windows only, folder standing for one must not be walked into
+    monkeypatch.setattr(trash, "entry_is_junction", lambda entry: entry.name == "junction")
+    files, dirs = trash.list_tree(path=str(tmp_path / "work"))
+    assert str(tmp_path / "work" / "node_modules" / "junction") in dirs
+    assert all("junction" not in path for path, _ in files)
+    monkeypatch.setattr(trash, "entry_is_junction", lambda entry: False)
+    assert trash.delete(src=str(tmp_path / "work" / "node_modules"), hard_delete=True)
+    assert os.listdir(tmp_path / "work") == []
+    assert (tmp_path / "outside" / "keep.txt").read_text() == "keep"
+
+
+def test_cancelled_hard_delete_restores_staged_items(tmp_path, monkeypatch):
+    monkeypatch.setattr(trash, "mount_point", lambda path: str(tmp_path))
+    make_tree(root=tmp_path / "work")
+
+    def cancelled_purge(paths):
+        # first item is purged when delete is cancelled
+        os.unlink(os.path.join(paths[0], "0-a.txt"))
+        raise JobCancelled()
+
+    monkeypatch.setattr(trash, "purge", cancelled_purge)
+    with pytest.raises(JobCancelled):
+        trash.delete(src=[str(tmp_path / "work" / "a.txt"), str(tmp_path / "work" / "node_modules")], hard_delete=True)
+    assert os.listdir(tmp_path / "work") == ["node_modules"]
+    assert len(os.listdir(tmp_path / "work" / "node_modules" / "pkg" / "lib")) == 50
+    assert not (tmp_path / trash.STAGING_DIR).exists()